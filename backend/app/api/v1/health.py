@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from .transcription import get_transcription_service
+from ...services.transcription_service import TranscriptionService
+
+router = APIRouter()
+
+
+@router.get("/health")
+async def health() -> dict:
+    """Liveness probe: the process is up and serving requests."""
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+async def ready(
+    transcription: TranscriptionService = Depends(get_transcription_service),
+) -> dict:
+    """Readiness probe: models preloaded at startup are in memory."""
+    if not transcription.ready:
+        raise HTTPException(status_code=503, detail="Models are still loading")
+    return {"status": "ready"}
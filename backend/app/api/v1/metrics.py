@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from ...core.metrics import metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def get_metrics() -> dict:
+    """Snapshot of the in-process counters and summaries."""
+    return metrics.snapshot()
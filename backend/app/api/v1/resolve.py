@@ -0,0 +1,98 @@
+import json
+import logging
+from typing import Any
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Response, UploadFile
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from ...core.executors import ExecutorSaturatedError
+from ...models.resolve import ResolveError, ResolveResponse
+from ...models.transcription import WhisperModelName
+from ...services.audio_preprocessing import AudioTooLongError
+from ...services.resolver_service import ResolverService
+from ...services.transcription_service import Audio
+from .transcription import check_request, get_transcription_service, read_upload
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def get_resolver_service() -> ResolverService:
+    return ResolverService.get_instance()
+
+
+async def read_order(
+    file: UploadFile | None = File(None, description="Spoken travel order"),
+    text: str | None = Form(None, description="Typed travel order, instead of a file"),
+    lat: float | None = Form(None),
+    lon: float | None = Form(None),
+    model: WhisperModelName | None = Query(None, description="Whisper model tier (default: server setting)"),
+) -> dict[str, Any]:
+    """Form fields shared by the resolve routes, as `ResolverService` arguments."""
+    if (file is None) == (not text):
+        raise HTTPException(status_code=400, detail="Send either an audio file or a text")
+
+    audio: Audio | None = None
+    if file is not None:
+        check_request(file, model, get_transcription_service())
+        audio = await read_upload(file)
+
+    coords = (lat, lon) if lat is not None and lon is not None else None
+    return {"text": text or None, "audio": audio, "coords": coords, "model_name": model}
+
+
+@router.post("/resolve", response_model=ResolveResponse)
+async def resolve(
+    order: dict[str, Any] = Depends(read_order),
+    service: ResolverService = Depends(get_resolver_service),
+) -> Response:
+    """
+    Resolve a spoken or typed travel order into journeys in one call:
+    transcription, NER, station matching, time normalization and Navitia
+    search, with the time spent in each stage.
+    """
+    try:
+        result = await service.resolve(**order)
+    except AudioTooLongError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    # Serialized once, as for /journeys
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+
+@router.post("/resolve/stream")
+async def resolve_stream(
+    order: dict[str, Any] = Depends(read_order),
+    service: ResolverService = Depends(get_resolver_service),
+) -> StreamingResponse:
+    """
+    Same as /resolve, as server-sent events emitted when each stage
+    completes: `transcription`, `entities`, `datetime`, `stations`, one
+    `journey` per journey, then `timings`. Failures are sent as an `error`
+    event carrying the status code /resolve would have returned.
+    """
+
+    async def events():
+        try:
+            async for event, payload in service.stream(**order):
+                yield sse(event, payload)
+        except ExecutorSaturatedError as e:
+            yield sse("error", ResolveError(status_code=503, detail=str(e)))
+        except AudioTooLongError as e:
+            yield sse("error", ResolveError(status_code=413, detail=str(e)))
+        except Exception as e:
+            logger.exception("Streaming resolve failed")
+            yield sse("error", ResolveError(detail=f"Resolve failed: {e}"))
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def sse(event: str, payload: BaseModel | dict) -> str:
+    data = payload.model_dump_json() if isinstance(payload, BaseModel) else json.dumps(payload)
+    return f"event: {event}\ndata: {data}\n\n"
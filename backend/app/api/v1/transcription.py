@@ -1,6 +1,13 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from collections.abc import Iterator
+from contextlib import contextmanager
 
-from ...models.transcription import TranscriptionResponse
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from ...core.config import config
+from ...core.executors import ExecutorSaturatedError
+from ...models.transcription import TranscriptionResponse, WhisperModelName
+from ...services.audio_preprocessing import AudioTooLongError
 from ...services.transcription_service import TranscriptionService
 
 router = APIRouter()
@@ -10,17 +17,79 @@ def get_transcription_service() -> TranscriptionService:
     return TranscriptionService.get_instance()
 
 
+def check_request(
+    file: UploadFile, model: WhisperModelName | None, service: TranscriptionService
+) -> None:
+    if not file.content_type or not file.content_type.startswith("audio/"):
+        raise HTTPException(status_code=400, detail="File must be an audio file")
+    if model is not None and not service.is_allowed(model):
+        raise HTTPException(status_code=400, detail=f"Model '{model}' is not enabled on this server")
+
+
+async def read_upload(file: UploadFile) -> bytes:
+    """Read an audio upload, rejecting it with 413 once it exceeds `audio_max_upload_bytes`."""
+    limit = config.audio_max_upload_bytes
+    detail = f"Audio files are limited to {limit} bytes"
+    if file.size is not None and file.size > limit:
+        raise HTTPException(status_code=413, detail=detail)
+    # The size is not always known up front: never read more than one byte past the limit
+    content = await file.read(limit + 1)
+    if len(content) > limit:
+        raise HTTPException(status_code=413, detail=detail)
+    return content
+
+
+@contextmanager
+def transcription_errors() -> Iterator[None]:
+    """Map transcription failures to HTTP errors; saturation is left to the 503 handler."""
+    try:
+        yield
+    except ExecutorSaturatedError:
+        raise
+    except AudioTooLongError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+
+
 @router.post("/transcribe", response_model=TranscriptionResponse)
 async def transcribe_audio(
     file: UploadFile = File(...),
+    model: WhisperModelName | None = Query(None, description="Whisper model tier (default: server setting)"),
     service: TranscriptionService = Depends(get_transcription_service),
 ) -> TranscriptionResponse:
     """Transcribe audio file to text using Whisper."""
-    if not file.content_type or not file.content_type.startswith("audio/"):
-        raise HTTPException(status_code=400, detail="File must be an audio file")
+    check_request(file, model, service)
+    content = await read_upload(file)
 
-    try:
-        content = await file.read()
-        return service.transcribe(content)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+    with transcription_errors():
+        return await service.transcribe_async(content, model)
+
+
+@router.post("/transcribe/stream")
+async def transcribe_audio_stream(
+    file: UploadFile = File(...),
+    model: WhisperModelName | None = Query(None, description="Whisper model tier (default: server setting)"),
+    service: TranscriptionService = Depends(get_transcription_service),
+) -> StreamingResponse:
+    """
+    Transcribe audio file, streaming segments as newline-delimited JSON
+    (`{"start": ..., "end": ..., "text": ...}` per line) as they are decoded.
+    """
+    check_request(file, model, service)
+    content = await read_upload(file)
+
+    # Wait for the first segment so saturation, decoding and preprocessing errors
+    # still get the same status codes as /transcribe
+    with transcription_errors():
+        segments = service.transcribe_stream(content, model)
+        first = await anext(segments, None)
+
+    async def ndjson():
+        if first is None:
+            return
+        yield first.model_dump_json() + "\n"
+        async for segment in segments:
+            yield segment.model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
@@ -1,8 +1,16 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from ...models.travel import TravelOrderResponse
-from ...models.journey import JourneySearchResponse
+from ...core.config import config
+from ...core.executors import BoundedExecutor, cpu_executor
+from ...models.travel import (
+    TravelOrderBatchRequest,
+    TravelOrderBatchResponse,
+    TravelOrderResponse,
+)
+from ...models.journey import JourneyBatchRequest, JourneySearchResponse
+from ...services.journey_batch import JourneyBatchService
 from ...services.travel_service import TravelService
 from ...services.station_matcher import StationMatcher
 from ...services.navitia_service import NavitiaService
@@ -25,6 +33,14 @@ def get_station_matcher() -> StationMatcher:
 def get_navitia_service() -> NavitiaService:
     return NavitiaService.get_instance()
 
+
+def get_journey_batch_service() -> JourneyBatchService:
+    return JourneyBatchService.get_instance()
+
+
+def get_cpu_executor() -> BoundedExecutor:
+    return cpu_executor
+
 @router.get("/identify-travel-order", response_model=TravelOrderResponse)
 async def identify_travel_order(
     text: str = Query(...),
@@ -34,7 +50,31 @@ async def identify_travel_order(
 ) -> TravelOrderResponse:
     print("latlon", lat, lon)
     coords = (lat, lon) if lat is not None and lon is not None else None
-    return service.identify_travel_order(text, coords)
+    return await service.identify_travel_order_async(text, coords)
+
+
+@router.post("/identify-travel-orders", response_model=TravelOrderBatchResponse)
+async def identify_travel_orders(
+    request: TravelOrderBatchRequest,
+    service: TravelService = Depends(get_travel_service),
+    executor: BoundedExecutor = Depends(get_cpu_executor),
+) -> TravelOrderBatchResponse:
+    """
+    Identify a batch of travel orders in a single pass through the NER model.
+    """
+    texts = [item.text for item in request.items]
+    coords = [
+        (item.lat, item.lon) if item.lat is not None and item.lon is not None else None
+        for item in request.items
+    ]
+    results = await executor.run(
+        service.identify_travel_orders,
+        texts,
+        coords,
+        batch_size=request.batch_size,
+        n_process=request.n_process,
+    )
+    return TravelOrderBatchResponse(results=results)
 
 
 @router.get("/stations", response_model=StationsListResponse)
@@ -51,17 +91,46 @@ async def search_journeys(
     destination_id: int = Query(..., description="ID de la station d'arrivée"),
     datetime_iso: str | None = Query(None, description="Date/heure ISO (ex: 2024-01-15T14:30:00)"),
     datetime_represents: str = Query("departure", description="'departure' ou 'arrival'"),
+    datetime_end: str | None = Query(None, description="Fin de la plage horaire ISO: tous les trajets de la plage"),
+    count: int = Query(1, ge=1, le=config.navitia_max_count, description="Nombre de trajets"),
+    depth: int = Query(2, ge=0, le=3, description="Niveau de détail"),
+    cursor: str | None = Query(None, description="next_cursor ou prev_cursor d'une réponse précédente"),
     service: NavitiaService = Depends(get_navitia_service),
-) -> JourneySearchResponse:
+) -> Response:
     """
     Search for journeys between two stations via the Navitia API.
         
     Returns a list of journeys with the details of each section
     (walking, public transport, transfers).
     """
-    return await service.search_journeys(
+    result = await service.search_journeys(
         departure_station_id=departure_id,
         destination_station_id=destination_id,
         datetime_iso=datetime_iso,
         datetime_represents=datetime_represents,
+        datetime_end=datetime_end,
+        count=count,
+        depth=depth,
+        cursor=cursor,
     )
+    # Serialized directly: the journeys are already built from trusted data,
+    # so FastAPI's response_model re-validation is skipped
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+
+@router.post("/journeys/batch")
+async def search_journeys_batch(
+    request: JourneyBatchRequest,
+    service: JourneyBatchService = Depends(get_journey_batch_service),
+) -> StreamingResponse:
+    """
+    Search journeys for many (departure, destination, datetime) items at once.
+
+    Results are streamed as NDJSON in completion order, each tagged with the
+    `index` of its item; a failed search is a line with `error` set.
+    """
+    async def ndjson():
+        async for result in service.run(request.items, request.concurrency):
+            yield result.model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
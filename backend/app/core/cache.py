@@ -0,0 +1,191 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Generic, Hashable, Protocol, TypeVar
+
+from .metrics import metrics
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe bounded LRU cache with hit/miss/eviction counters."""
+
+    def __init__(self, maxsize: int, name: str | None = None):
+        self._maxsize = maxsize
+        self._name = name
+        self._data: OrderedDict[K, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+    def _count(self, counter: str) -> None:
+        setattr(self, counter, getattr(self, counter) + 1)
+        if self._name:
+            metrics.inc(f"{self._name}.{counter}")
+
+    def get(self, key: K, default=None):
+        """Return the cached value (marking it recently used), or `default`."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING or not self._is_fresh(entry):
+                self._count("misses")
+                return default
+            self._data.move_to_end(key)
+            self._count("hits")
+            return self._unwrap(entry)
+
+    def set(self, key: K, value: V) -> None:
+        self._store(key, value)
+
+    def _store(self, key: K, entry: Any) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._count("evictions")
+
+    def _is_fresh(self, entry: Any) -> bool:
+        return True
+
+    def _unwrap(self, entry: Any) -> V:
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self._maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class TTLCache(LRUCache[K, V]):
+    """LRU cache whose entries expire `ttl` seconds after being set."""
+
+    def __init__(self, maxsize: int, ttl: float, name: str | None = None):
+        super().__init__(maxsize, name)
+        self._ttl = ttl
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + (self._ttl if ttl is None else ttl)
+        self._store(key, (expires_at, value))
+
+    def _is_fresh(self, entry: tuple[float, V]) -> bool:
+        return entry[0] >= time.monotonic()
+
+    def _unwrap(self, entry: tuple[float, V]) -> V:
+        return entry[1]
+
+
+class CacheBackend(Protocol[V]):
+    """Async key/value store with per-entry TTL, keyed by strings."""
+
+    async def get(self, key: str) -> V | None: ...
+
+    async def set(self, key: str, value: V, ttl: float) -> None: ...
+
+
+class InMemoryCacheBackend(Generic[V]):
+    """In-process backend: a bounded TTL + LRU cache."""
+
+    def __init__(self, maxsize: int, ttl: float, name: str | None = None):
+        self._cache: TTLCache[str, V] = TTLCache(maxsize, ttl, name)
+
+    async def get(self, key: str) -> V | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: V, ttl: float) -> None:
+        self._cache.set(key, value, ttl)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+class SharedCacheBackend(Generic[V]):
+    """
+    Backend shared between workers, on top of a Redis-like async client.
+
+    The client only needs `get(key)` and `set(key, value, ex=seconds)`
+    coroutines (e.g. `redis.asyncio.Redis`). Values are stored as bytes
+    through `dumps`/`loads`.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        dumps: Callable[[V], bytes],
+        loads: Callable[[bytes], V],
+        prefix: str = "",
+    ):
+        self._client = client
+        self._dumps = dumps
+        self._loads = loads
+        self._prefix = prefix
+
+    async def get(self, key: str) -> V | None:
+        data = await self._client.get(self._prefix + key)
+        return None if data is None else self._loads(data)
+
+    async def set(self, key: str, value: V, ttl: float) -> None:
+        await self._client.set(self._prefix + key, self._dumps(value), ex=max(1, round(ttl)))
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Merge concurrent calls for the same key into a single execution.
+
+    The call runs as a task owned by the SingleFlight, so cancelling the
+    caller that started it (client disconnect, hedge cleanup) does not
+    cancel it for the others. It is only cancelled once every caller
+    waiting on it has been cancelled.
+    """
+
+    def __init__(self):
+        self._calls: dict[K, asyncio.Task] = {}
+        self._waiters: dict[K, int] = {}
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            # Avoid "exception never retrieved" warnings when every caller left
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            task.add_done_callback(lambda t: self._forget(key, t))
+            self._calls[key] = task
+            self._waiters[key] = 0
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and self._waiters[key] == 1:
+                task.cancel()
+            raise
+        finally:
+            if self._calls.get(key) is task:
+                self._waiters[key] -= 1
+
+    def _forget(self, key: K, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            del self._waiters[key]
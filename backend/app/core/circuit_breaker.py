@@ -0,0 +1,84 @@
+import threading
+import time
+
+from .metrics import metrics
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"{name} circuit is open, next probe in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker around an upstream.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    calls are refused for `reset_timeout` seconds. It then turns half-open:
+    a single probe call is let through, closing the circuit on success and
+    reopening it on failure. A probe that never reports back (cancelled) is
+    replaced after another `reset_timeout`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started: float | None = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._retry_in() <= 0:
+                return self.HALF_OPEN
+            return self._state
+
+    def _retry_in(self) -> float:
+        return self._opened_at + self._reset_timeout - time.monotonic()
+
+    def _set_state(self, state: str) -> None:
+        if state != self._state:
+            self._state = state
+            metrics.inc(f"{self.name}.circuit.{state}")
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may go through now."""
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.OPEN:
+                if self._retry_in() > 0:
+                    raise CircuitOpenError(self.name, self._retry_in())
+                self._set_state(self.HALF_OPEN)
+                self._probe_started = None
+            # Half-open: one probe at a time
+            if self._probe_started is not None and now - self._probe_started < self._reset_timeout:
+                raise CircuitOpenError(self.name, self._probe_started + self._reset_timeout - now)
+            self._probe_started = now
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probe_started = None
+            self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_started = None
+            if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+                self._set_state(self.OPEN)
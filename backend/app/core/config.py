@@ -1,6 +1,7 @@
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
 from pathlib import Path
+from typing import Literal
 
 load_dotenv()
 
@@ -16,7 +17,69 @@ class Config(BaseSettings):
     navitia_api_key: str = ""
     navitia_base_url: str = "https://api.navitia.io/v1"
     navitia_coverage: str = "sncf"
+    navitia_connect_timeout: float = 5.0
+    navitia_read_timeout: float = 10.0
+    navitia_max_connections: int = 20
+    navitia_max_keepalive_connections: int = 10
+    navitia_keepalive_expiry: float = 30.0
+    navitia_http2: bool = False
+    navitia_cache_backend: str = "memory"
+    navitia_cache_ttl: float = 120.0
+    navitia_cache_size: int = 512
+    navitia_cache_bucket_seconds: int = 300
+    navitia_window_min_journeys: int = 3
+    navitia_window_max_journeys: int = 20
+    # Longest timeframe_duration Navitia accepts: longer windows are split
+    navitia_window_max_seconds: int = 86400
+    # Longest window searched, enough for "la semaine prochaine"; longer ones are truncated
+    navitia_window_max_days: int = 7
+    navitia_max_count: int = 20
+    navitia_page_links_size: int = 1024
+    navitia_retry_base_delay: float = 0.5
+    navitia_retry_max_delay: float = 30.0
+    navitia_breaker_failures: int = 5
+    navitia_breaker_reset_seconds: float = 30.0
+    # e.g. 0.95: resend a call still pending after the p95 upstream latency
+    navitia_hedge_quantile: float | None = None
+    navitia_hedge_min_samples: int = 20
+    navitia_stale_ttl: float = 3600.0
+    navitia_stale_size: int = 2048
+    journey_batch_concurrency: int = 8
+    journey_batch_max_concurrency: int = 32
+    journey_batch_rate: float = 5.0
+    journey_batch_burst: int = 10
+    journey_batch_max_retries: int = 4
+    journey_batch_max_items: int = 10000
+    travel_batch_max_items: int = 1000
+    travel_batch_max_batch_size: int = 256
+    # spaCy starts this many processes per request: raise with care
+    travel_batch_max_processes: int = 1
+    redis_url: str = "redis://localhost:6379/0"
     google_maps_api_key: str = ""
+    station_match_cache_size: int = 2048
+    time_normalizer_cache_size: int = 4096
+    time_normalizer_bucket_seconds: int = 60
+    cpu_pool_workers: int = 4
+    cpu_pool_queue: int = 64
+    cpu_pool_retry_after: int = 1
+    inference_pool_workers: int = 1
+    inference_pool_queue: int = 4
+    inference_pool_retry_after: int = 10
+    inference_pool_processes: bool = True
+    whisper_model: str = "large-v3"
+    # Tiers requests may pick with ?model=; only whisper_model when unset. Each
+    # tier used stays loaded in every inference worker
+    whisper_allowed_models: list[str] | None = None
+    whisper_preload: bool = True
+    whisper_preload_retry_delay: float = 1.0
+    whisper_preload_retry_max_delay: float = 60.0
+    # Larger audio uploads are rejected with 413 before being read
+    audio_max_upload_bytes: int = 10 * 2**20
+    ner_backend: Literal["spacy", "compact"] = "spacy"
+    serving_bind: str = "0.0.0.0:8000"
+    serving_workers: int = 2
+    serving_timeout: int = 120
+    serving_shared_inference: bool = True
 
     @property
     def db_url(self):
@@ -0,0 +1,178 @@
+import asyncio
+import functools
+import multiprocessing
+import queue
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.managers import SyncManager
+from typing import Any, Callable, TypeVar
+
+from .config import config
+from .metrics import metrics
+
+R = TypeVar("R")
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when a pool already holds as much work as it may queue."""
+
+    def __init__(self, pool: str, retry_after: int):
+        super().__init__(f"The {pool} pool is saturated, retry in {retry_after}s")
+        self.pool = pool
+        self.retry_after = retry_after
+
+    def __reduce__(self):
+        # Raised in the inference server and re-raised in the worker that called it
+        return type(self), (self.pool, self.retry_after)
+
+
+class BoundedExecutor:
+    """
+    Run blocking callables on a worker pool without stalling the event loop.
+
+    At most `max_workers` calls run at once and `max_queue` more may wait
+    for a worker; beyond that `run` fails fast with `ExecutorSaturatedError`
+    instead of letting latency grow without bound. The pool itself is only
+    started on first use.
+
+    `new_queue` returns a queue workers of this pool can put results on
+    while they run, e.g. to stream partial output back to the event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        executor_factory: Callable[[int], Executor],
+        max_workers: int,
+        max_queue: int,
+        retry_after: int = 1,
+        queue_factory: Callable[[], Any] = queue.Queue,
+    ):
+        self.name = name
+        self._executor_factory = executor_factory
+        self._executor: Executor | None = None
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._retry_after = retry_after
+        self._queue_factory = queue_factory
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def submit(self, fn: Callable[..., R], *args, **kwargs) -> "asyncio.Future[R]":
+        """Schedule `fn` on the pool, raising right away if the pool is full."""
+        if self._in_flight >= self._max_workers + self._max_queue:
+            metrics.inc(f"executor.{self.name}.rejected")
+            raise ExecutorSaturatedError(self.name, self._retry_after)
+
+        if self._executor is None:
+            self._executor = self._executor_factory(self._max_workers)
+
+        self._in_flight += 1
+        metrics.observe(f"executor.{self.name}.in_flight", self._in_flight)
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn: Callable[..., R], *args, **kwargs) -> R:
+        return await self.submit(fn, *args, **kwargs)
+
+    async def warm_up(self, fn: Callable[..., Any], *args) -> None:
+        """
+        Run `fn` in every worker of the pool, e.g. to load a model.
+
+        Warm-up calls are not requests: they do not count against the queue
+        limit, here or in a shared inference server, which runs `fn` once
+        for all the API workers.
+        """
+        if self._executor is None:
+            self._executor = self._executor_factory(self._max_workers)
+        remote_warm_up = getattr(self._executor, "warm_up", None)
+        if remote_warm_up is not None:
+            await asyncio.wrap_future(remote_warm_up(fn, *args))
+            return
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, functools.partial(fn, *args))
+                for _ in range(self._max_workers)
+            )
+        )
+
+    def new_queue(self) -> Any:
+        return self._queue_factory()
+
+    def reconfigure(
+        self, executor_factory: Callable[[int], Executor], queue_factory: Callable[[], Any]
+    ) -> None:
+        """Use another kind of pool from now on (the current one is shut down)."""
+        self.shutdown()
+        self._executor_factory = executor_factory
+        self._queue_factory = queue_factory
+
+    def _release(self, future: asyncio.Future) -> None:
+        self._in_flight -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+def _thread_pool(name: str) -> Callable[[int], Executor]:
+    return lambda workers: ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+
+
+def _process_pool(workers: int) -> Executor:
+    # Spawned rather than forked: the parent runs an event loop and threads
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+_manager: SyncManager | None = None
+
+
+def _manager_queue() -> Any:
+    """A queue shared with worker processes, served by a manager process."""
+    global _manager
+    if _manager is None:
+        _manager = multiprocessing.get_context("spawn").Manager()
+    return _manager.Queue()
+
+
+# Light CPU work: spaCy NER, fuzzy matching, time normalization
+cpu_executor = BoundedExecutor(
+    "cpu",
+    _thread_pool("cpu"),
+    max_workers=config.cpu_pool_workers,
+    max_queue=config.cpu_pool_queue,
+    retry_after=config.cpu_pool_retry_after,
+)
+
+# Heavy inference: Whisper transcription
+inference_executor = BoundedExecutor(
+    "inference",
+    _process_pool if config.inference_pool_processes else _thread_pool("inference"),
+    max_workers=config.inference_pool_workers,
+    max_queue=config.inference_pool_queue,
+    retry_after=config.inference_pool_retry_after,
+    queue_factory=_manager_queue if config.inference_pool_processes else queue.Queue,
+)
+
+
+def use_inference_server(address: str) -> None:
+    """Send inference work to the shared inference server listening on `address`."""
+    from .inference_server import InferenceClient
+
+    client = InferenceClient(address)
+    inference_executor.reconfigure(client.executor, client.queue)
+
+
+def shutdown_executors() -> None:
+    global _manager
+    cpu_executor.shutdown()
+    inference_executor.shutdown()
+    if _manager is not None:
+        _manager.shutdown()
+        _manager = None
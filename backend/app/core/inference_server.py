@@ -0,0 +1,138 @@
+"""
+Inference server shared by all the API workers of a host.
+
+In the multi-process serving profile (`gunicorn.conf.py`), the gunicorn
+master starts one inference server before forking the workers. Workers send
+their inference calls to it over a local socket instead of running their own
+pool, so Whisper is loaded once per host rather than once per worker.
+
+The server enforces the inference pool limits for the whole host: at most
+`inference_pool_workers` calls run and `inference_pool_queue` more wait,
+whichever worker sent them. Beyond that a call fails with
+`ExecutorSaturatedError`, raised in the worker that sent it. Warm-up loads
+(`BoundedExecutor.warm_up`) are not requests and bypass that limit.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from multiprocessing.managers import SyncManager
+from typing import Any, Callable
+
+from .config import config
+from .executors import ExecutorSaturatedError
+
+
+class InferenceManager(SyncManager):
+    """SyncManager whose server also runs callables sent through `runner()`."""
+
+
+class _Runner:
+    """Runs callables in the server: `workers` at once, `max_queue` more waiting, the rest rejected."""
+
+    def __init__(self, workers: int, max_queue: int, retry_after: int):
+        self._slots = threading.BoundedSemaphore(workers)
+        self._max_admitted = workers + max_queue
+        self._retry_after = retry_after
+        self._admitted = 0
+        self._lock = threading.Lock()
+
+    def run(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        with self._lock:
+            if self._admitted >= self._max_admitted:
+                raise ExecutorSaturatedError("inference", self._retry_after)
+            self._admitted += 1
+        try:
+            with self._slots:
+                return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._admitted -= 1
+
+    def warm_up(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        """Run `fn` outside the admission limit: every API worker warms up the same server."""
+        return fn(*args, **kwargs)
+
+
+_runner: _Runner | None = None
+_runner_lock = threading.Lock()
+
+
+def _get_runner() -> _Runner:
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = _Runner(
+                config.inference_pool_workers,
+                config.inference_pool_queue,
+                config.inference_pool_retry_after,
+            )
+        return _runner
+
+
+InferenceManager.register("runner", callable=_get_runner, exposed=("run", "warm_up"))
+
+
+def start_inference_server(address: str) -> InferenceManager:
+    """
+    Start the server process listening on `address` (a Unix socket path).
+
+    Clients authenticate with the starting process' authkey, which forked
+    workers inherit.
+    """
+    # Spawned: the server needs none of the parent's loaded state
+    manager = InferenceManager(address=address, ctx=multiprocessing.get_context("spawn"))
+    manager.start()
+    return manager
+
+
+class InferenceClient:
+    """Connection to an inference server, opened on first use in each process."""
+
+    def __init__(self, address: str):
+        self._address = address
+        self._lock = threading.Lock()
+        self._manager: InferenceManager | None = None
+        self._runner: Any = None
+
+    def _connect(self) -> InferenceManager:
+        with self._lock:
+            if self._manager is None:
+                manager = InferenceManager(address=self._address)
+                manager.connect()
+                self._runner = manager.runner()  # type: ignore[attr-defined]
+                self._manager = manager
+            return self._manager
+
+    def call(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        self._connect()
+        return self._runner.run(fn, args, kwargs)
+
+    def warm_up(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        self._connect()
+        return self._runner.warm_up(fn, args, kwargs)
+
+    def queue(self) -> Any:
+        """A queue living in the server, shared with the calls it runs."""
+        return self._connect().Queue()
+
+    def executor(self, threads: int) -> Executor:
+        return RemoteExecutor(self, threads)
+
+
+class RemoteExecutor(Executor):
+    """Executor whose calls run in the inference server, waited on by local threads."""
+
+    def __init__(self, client: InferenceClient, threads: int):
+        self._client = client
+        self._threads = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="inference")
+
+    def submit(self, fn: Callable[..., Any], /, *args, **kwargs) -> Future:
+        return self._threads.submit(self._client.call, fn, args, kwargs)
+
+    def warm_up(self, fn: Callable[..., Any], /, *args, **kwargs) -> Future:
+        """Run `fn` once in the server, outside its admission limit."""
+        return self._threads.submit(self._client.warm_up, fn, args, kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._threads.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -1,19 +1,81 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
 
-from .api.v1 import user, transcription, travel
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from .api.v1 import user, transcription, travel, resolve, metrics, health
 from .core.config import config
+from .core.executors import ExecutorSaturatedError, shutdown_executors
 from .core.logging import setup_logging
 from .db.schema import Base, engine
+from .services.journey_batch import JourneyBatchService
+from .services.navitia_service import NavitiaService
+from .services.time_normalizer import TimeNormalizer
+from .services.transcription_service import TranscriptionService
+from .services.travel_service import TravelService
 
 setup_logging()
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI(
-    title=config.app_name,
-    description=config.app_description,
-    version=config.app_version,
-)
 
-app.include_router(user.router, prefix="/api/v1", tags=["users"])
-app.include_router(transcription.router, prefix="/api/v1", tags=["transcription"])
-app.include_router(travel.router, prefix="/api/v1", tags=["travel"])
\ No newline at end of file
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    navitia = NavitiaService.get_instance()
+    await navitia.start()
+    await asyncio.to_thread(TimeNormalizer.warm_up)
+    # Loaded in the background: /api/v1/ready reports when it is done
+    warm_up = None
+    if config.whisper_preload:
+        warm_up = asyncio.create_task(TranscriptionService.get_instance().warm_up())
+    yield
+    if warm_up is not None:
+        warm_up.cancel()
+    await navitia.aclose()
+    if JourneyBatchService._instance is not None:
+        await JourneyBatchService._instance.aclose()
+    shutdown_executors()
+
+
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+def preload_shared_state() -> None:
+    """
+    Load the read-only state every request uses: the NER model, the station
+    data behind matching and geolocation, and dateparser's language data.
+
+    Called in the gunicorn master before it forks, so that the workers share
+    these pages copy-on-write instead of each loading its own copy.
+    """
+    TravelService.get_instance().warm_up()
+    TimeNormalizer.warm_up()
+
+
+def create_app(preload: bool = False) -> FastAPI:
+    if preload:
+        preload_shared_state()
+
+    app = FastAPI(
+        title=config.app_name,
+        description=config.app_description,
+        version=config.app_version,
+        lifespan=lifespan,
+    )
+    app.add_exception_handler(ExecutorSaturatedError, executor_saturated_handler)  # type: ignore[arg-type]
+
+    app.include_router(user.router, prefix="/api/v1", tags=["users"])
+    app.include_router(transcription.router, prefix="/api/v1", tags=["transcription"])
+    app.include_router(travel.router, prefix="/api/v1", tags=["travel"])
+    app.include_router(resolve.router, prefix="/api/v1", tags=["resolve"])
+    app.include_router(metrics.router, prefix="/api/v1", tags=["metrics"])
+    app.include_router(health.router, prefix="/api/v1", tags=["health"])
+    return app
+
+
+app = create_app()
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from ..core.config import config
 
 class JourneyPlace(BaseModel):
     name: str
@@ -36,8 +38,29 @@ class JourneySearchRequest(BaseModel):
     destination_station_id: int
     datetime_iso: str | None = None
     datetime_represents: str = "departure"
+    datetime_end: str | None = None
+    count: int = Field(1, ge=1, le=config.navitia_max_count)
 
 
 class JourneySearchResponse(BaseModel):
     journeys: list[Journey]
     error: str | None = None
+    # Opaque cursors for the following/preceding journeys (`cursor` query parameter)
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+    # True when Navitia is unavailable and this is an earlier result
+    stale: bool = False
+    # True when the requested window was longer than NAVITIA_WINDOW_MAX_DAYS
+    # and only its beginning was searched
+    truncated: bool = False
+
+
+class JourneyBatchRequest(BaseModel):
+    items: list[JourneySearchRequest] = Field(max_length=config.journey_batch_max_items)
+    concurrency: int | None = Field(None, ge=1, le=config.journey_batch_max_concurrency)
+
+
+class JourneyBatchResult(JourneySearchResponse):
+    """One line of a batch search: the response, tagged with its request."""
+    index: int
+    request: JourneySearchRequest
@@ -0,0 +1,44 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+from .journey import JourneySearchResponse
+from .transcription import TranscriptionResponse
+from .travel import TravelEntities
+
+
+class ResolvedStations(BaseModel):
+    departure_id: int | None = None
+    destination_id: int | None = None
+    # True when the departure is the station nearest to the given coordinates
+    departure_from_location: bool = False
+
+
+class ResolvedDatetime(BaseModel):
+    datetime_iso: str | None = None
+    # End of the window when the expression names a period ("ce soir")
+    datetime_end: str | None = None
+    datetime_represents: Literal["departure", "arrival"] = "departure"
+
+
+class ResolveError(BaseModel):
+    """A stage failure; `stage` is None when the whole pipeline stopped."""
+    stage: str | None = None
+    status_code: int = 500
+    detail: str
+
+
+class ResolveResponse(BaseModel):
+    """Result of the voice/text to itinerary pipeline."""
+    text: str
+    entities: TravelEntities
+    departure_id: int | None = None
+    destination_id: int | None = None
+    datetime_iso: str | None = None
+    datetime_end: str | None = None
+    datetime_represents: Literal["departure", "arrival"] = "departure"
+    departure_from_location: bool = False
+    transcription: TranscriptionResponse | None = None
+    journeys: JourneySearchResponse | None = None
+    # Milliseconds per stage, plus "total"
+    timings: dict[str, float]
@@ -1,16 +1,48 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
+# Whisper model tiers, fastest and least accurate first
+WhisperModelName = Literal["tiny", "base", "small", "medium", "large-v3"]
+
+
+class TranscriptionTimings(BaseModel):
+    """Time spent in each transcription stage, in milliseconds."""
+    decode_ms: float
+    vad_ms: float
+    transcribe_ms: float
+
 
 class TranscriptionResponse(BaseModel):
     """Response model for audio transcription."""
     text: str
+    audio_seconds: float | None = None
+    speech_seconds: float | None = None
+    truncated: bool = False
+    timings: TranscriptionTimings | None = None
+
+
+class TranscriptionSegment(BaseModel):
+    """A transcribed segment, as streamed while decoding."""
+    start: float
+    end: float
+    text: str
 
 
 class TranscriptionConfig(BaseModel):
     """Configuration for the Whisper model."""
-    model_name: str = "large-v3"
+    model_name: WhisperModelName = "large-v3"
     device: str = "cpu"
     compute_type: str = "int8"
     language: str = "fr"
     beam_size: int = 1
+    # Preprocessing: audio longer than max_input_seconds is rejected (or
+    # truncated) before VAD, leading/trailing silence is cut with Silero VAD,
+    # then speech longer than max_audio_seconds is rejected (or truncated)
+    vad_trim: bool = True
+    vad_min_silence_ms: int = 500
+    vad_speech_pad_ms: int = 200
+    max_input_seconds: float = 120.0
+    max_audio_seconds: float = 30.0
+    truncate_long_audio: bool = False
     initial_prompt: str = "Je suis un assistant de réservation de billets de train. Je suis capable de transcrire des requêtes de voyage en texte."
@@ -1,11 +1,68 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from ..core.config import config
+
+
+class TimeWindow(BaseModel):
+    """Interval a time expression refers to; `end` is None for an exact instant."""
+    start: datetime
+    end: datetime | None = None
+    represents: Literal["departure", "arrival"] = "departure"
+
+    def response_fields(self) -> dict:
+        """The datetime_iso / datetime_end / datetime_represents fields of responses."""
+        return {
+            "datetime_iso": self.start.isoformat(),
+            "datetime_end": self.end.isoformat() if self.end else None,
+            "datetime_represents": self.represents,
+        }
 
 
 class TravelOrderResponse(BaseModel):
     departure_id: int | None = None
     destination_id: int | None = None
     datetime_iso: str | None = None
+    datetime_end: str | None = None
+    datetime_represents: Literal["departure", "arrival"] = "departure"
+
+
+class TravelEntities(BaseModel):
+    """Raw entity texts found by the NER model, before matching."""
+    departure: str | None = None
+    destination: str | None = None
+    time: str | None = None
+
+
+class TravelOrderBatchItem(BaseModel):
+    text: str
+    lat: float | None = None
+    lon: float | None = None
+
+
+class TravelOrderBatchRequest(BaseModel):
+    items: list[TravelOrderBatchItem] = Field(max_length=config.travel_batch_max_items)
+    batch_size: int | None = Field(None, ge=1, le=config.travel_batch_max_batch_size)
+    n_process: int | None = Field(None, ge=1, le=config.travel_batch_max_processes)
+
+
+class TravelOrderBatchResponse(BaseModel):
+    results: list[TravelOrderResponse]
 
 
 class TravelServiceConfig(BaseModel):
-    model_path: str = "base/models/travel-order-ner-model"
+    # "spacy" (model_path) or "compact" (tagger_path, trained by base/src/training.py)
+    backend: Literal["spacy", "compact"] = config.ner_backend
+    tagger_path: str = "base/models/travel-order-tagger.npz"
+    # Exported by base/src/ner/export-inference-model.py (`uv run poe export-ner`);
+    # the full trained pipeline is served instead until it has been exported
+    model_path: str = "base/models/travel-order-ner-inference"
+    fallback_model_path: str = "base/models/travel-order-ner-model"
+    batch_size: int = 64
+    n_process: int = 1
+    micro_batch_size: int = 32
+    micro_batch_wait_ms: float = 5.0
+    # Texts waiting for a micro-batch; more are answered 503
+    micro_batch_max_pending: int = 256
@@ -0,0 +1,151 @@
+import io
+import time
+import wave
+from math import gcd
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+# faster_whisper and scipy are imported on first use: they are slow to import
+# and only transcription requests need them
+if TYPE_CHECKING:
+    from faster_whisper.vad import VadOptions
+
+# Whisper works on 16 kHz mono
+SAMPLE_RATE = 16000
+
+
+class AudioTooLongError(ValueError):
+    """Raised when an upload, or the speech in it, exceeds the allowed duration."""
+
+
+class PreparedAudio:
+    """16 kHz mono samples ready for Whisper, with what preprocessing did to them."""
+
+    def __init__(
+        self,
+        samples: np.ndarray,
+        audio_seconds: float,
+        truncated: bool = False,
+        decode_ms: float = 0.0,
+        vad_ms: float = 0.0,
+    ):
+        self.samples = samples
+        self.audio_seconds = audio_seconds
+        self.truncated = truncated
+        self.decode_ms = decode_ms
+        self.vad_ms = vad_ms
+
+    @property
+    def speech_seconds(self) -> float:
+        return len(self.samples) / SAMPLE_RATE
+
+
+def prepare_audio(
+    audio: bytes | np.ndarray,
+    vad_options: "VadOptions | None" = None,
+    max_seconds: float | None = None,
+    truncate: bool = False,
+    max_input_seconds: float | None = None,
+) -> PreparedAudio:
+    """
+    Decode an upload to 16 kHz mono, trim the silence around the speech
+    (when `vad_options` is given) and enforce `max_seconds` on what is left,
+    truncating or raising `AudioTooLongError`.
+
+    `max_input_seconds` is enforced the same way on the whole audio, before
+    VAD runs; a PCM WAV is rejected from its header, before decoding.
+
+    NumPy input is taken as already decoded 16 kHz mono audio.
+    """
+    if isinstance(audio, bytes) and max_input_seconds is not None and not truncate:
+        duration = wav_duration(audio)
+        if duration is not None and duration > max_input_seconds:
+            raise AudioTooLongError(f"Audio lasts {duration:.1f}s, the limit is {max_input_seconds:g}s")
+
+    start = time.perf_counter()
+    samples = decode_audio(audio) if isinstance(audio, bytes) else audio
+    decoded = time.perf_counter()
+    audio_seconds = len(samples) / SAMPLE_RATE
+
+    truncated = False
+    if max_input_seconds is not None and len(samples) > max_input_seconds * SAMPLE_RATE:
+        if not truncate:
+            raise AudioTooLongError(f"Audio lasts {audio_seconds:.1f}s, the limit is {max_input_seconds:g}s")
+        samples = samples[: int(max_input_seconds * SAMPLE_RATE)]
+        truncated = True
+
+    if vad_options is not None:
+        samples = trim_silence(samples, vad_options)
+    trimmed = time.perf_counter()
+
+    if max_seconds is not None and len(samples) > max_seconds * SAMPLE_RATE:
+        if not truncate:
+            raise AudioTooLongError(
+                f"Speech lasts {len(samples) / SAMPLE_RATE:.1f}s, the limit is {max_seconds:g}s"
+            )
+        samples = samples[: int(max_seconds * SAMPLE_RATE)]
+        truncated = True
+
+    return PreparedAudio(
+        samples,
+        audio_seconds,
+        truncated=truncated,
+        decode_ms=(decoded - start) * 1000,
+        vad_ms=(trimmed - decoded) * 1000,
+    )
+
+
+def wav_duration(data: bytes) -> float | None:
+    """Duration of a PCM WAV from its header, without decoding; None for other formats."""
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    try:
+        with wave.open(io.BytesIO(data)) as wav:
+            return wav.getnframes() / wav.getframerate()
+    except (wave.Error, EOFError, ZeroDivisionError):
+        return None
+
+
+def decode_audio(data: bytes) -> np.ndarray:
+    """Decode audio bytes to 16 kHz mono float32 samples, in memory."""
+    if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        try:
+            return _decode_pcm_wav(data)
+        except (wave.Error, EOFError, ValueError):
+            pass  # Not plain 16/32-bit PCM: let FFmpeg handle it
+    from faster_whisper import decode_audio as decode_with_av
+
+    return decode_with_av(io.BytesIO(data), sampling_rate=SAMPLE_RATE)
+
+
+def _decode_pcm_wav(data: bytes) -> np.ndarray:
+    # Browser recordings are PCM WAV: read them without going through FFmpeg
+    with wave.open(io.BytesIO(data)) as wav:
+        width = wav.getsampwidth()
+        channels = wav.getnchannels()
+        rate = wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+
+    if width not in (2, 4):
+        raise ValueError(f"Unsupported sample width: {width}")
+    samples = np.frombuffer(frames, dtype=f"<i{width}").astype(np.float32)
+    samples /= 2 ** (8 * width - 1)
+    samples = samples.reshape(-1, channels).mean(axis=1)
+
+    if rate != SAMPLE_RATE:
+        from scipy.signal import resample_poly
+
+        divisor = gcd(rate, SAMPLE_RATE)
+        samples = resample_poly(samples, SAMPLE_RATE // divisor, rate // divisor)
+    return samples.astype(np.float32)
+
+
+def trim_silence(samples: np.ndarray, vad_options: "VadOptions") -> np.ndarray:
+    """Cut the leading and trailing non-speech, keeping pauses inside the speech."""
+    from faster_whisper.vad import get_speech_timestamps
+
+    speech = get_speech_timestamps(samples, vad_options, sampling_rate=SAMPLE_RATE)
+    if not speech:
+        return samples[:0]
+    return samples[speech[0]["start"] : speech[-1]["end"]]
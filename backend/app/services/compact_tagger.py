@@ -0,0 +1,153 @@
+"""
+Compact travel order tagger, a CPU-cheap alternative to the spaCy NER.
+
+A linear model scores BIO tags from hashed features of each token and its
+neighbours; its weights are quantized to int8 with one scale per tag, so a
+token's scores are a sum of int8 rows. Tags are decoded with a Viterbi pass
+that only allows I-X after B-X or I-X. Trained by base/src/training.py.
+"""
+
+import re
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+ENTITY_LABELS = ("DEPARTURE", "DESTINATION", "TIME")
+TAGS = ("O", *(f"{prefix}-{label}" for label in ENTITY_LABELS for prefix in ("B", "I")))
+
+# Entity span in the tagged text: (label, start, end)
+Span = tuple[str, int, int]
+
+_TOKEN = re.compile(r"\S+")
+
+
+def tokenize(text: str) -> list[tuple[int, int]]:
+    """Whitespace token offsets; texts are normalized (see `normalize_text`) first."""
+    return [match.span() for match in _TOKEN.finditer(text)]
+
+
+def _shape(token: str) -> str:
+    shape = "".join("d" if c.isdigit() else "x" for c in token)
+    # Collapse runs: "14h30" -> "dxd"
+    return "".join(c for i, c in enumerate(shape) if i == 0 or c != shape[i - 1])
+
+
+def token_features(tokens: list[str], i: int) -> list[str]:
+    word = tokens[i]
+    prev = tokens[i - 1] if i > 0 else "<s>"
+    prev2 = tokens[i - 2] if i > 1 else "<s>"
+    next_ = tokens[i + 1] if i + 1 < len(tokens) else "</s>"
+    next2 = tokens[i + 2] if i + 2 < len(tokens) else "</s>"
+    return [
+        "bias",
+        f"w={word}",
+        f"p3={word[:3]}",
+        f"s3={word[-3:]}",
+        f"s2={word[-2:]}",
+        f"shape={_shape(word)}",
+        f"w-1={prev}",
+        f"w-2={prev2}",
+        f"w+1={next_}",
+        f"w+2={next2}",
+        f"w-1,w={prev}|{word}",
+        f"w,w+1={word}|{next_}",
+        f"w-2,w-1={prev2}|{prev}",
+        f"s3-1={prev[-3:]}",
+        f"s3+1={next_[-3:]}",
+    ]
+
+
+def feature_ids(tokens: list[str], n_features: int) -> np.ndarray:
+    """Hashed feature ids of every token, shape (len(tokens), features per token)."""
+    return np.array(
+        [
+            [zlib.crc32(feature.encode()) % n_features for feature in token_features(tokens, i)]
+            for i in range(len(tokens))
+        ],
+        dtype=np.int64,
+    ).reshape(len(tokens), -1)
+
+
+def _allowed_transitions() -> np.ndarray:
+    """(previous tag, tag) -> 0 if allowed, -inf otherwise; row -1 is the start."""
+    allowed = np.zeros((len(TAGS) + 1, len(TAGS)), dtype=np.float32)
+    for j, tag in enumerate(TAGS):
+        if tag.startswith("I-"):
+            label = tag[2:]
+            for i, prev in enumerate(TAGS):
+                if prev not in (f"B-{label}", f"I-{label}"):
+                    allowed[i, j] = -np.inf
+            allowed[-1, j] = -np.inf
+    return allowed
+
+
+class CompactTagger:
+    """int8 linear BIO tagger over hashed token features."""
+
+    def __init__(self, weights: np.ndarray, scales: np.ndarray, bias: np.ndarray):
+        self._weights = weights
+        self._scales = scales
+        self._bias = bias
+        # int8 rows are summed exactly in int32; float weights (before quantization) as is
+        self._accumulator = np.int32 if weights.dtype == np.int8 else np.float64
+        self._transitions = _allowed_transitions()
+
+    @property
+    def n_features(self) -> int:
+        return self._weights.shape[0]
+
+    @classmethod
+    def quantize(cls, weights: np.ndarray, bias: np.ndarray) -> "CompactTagger":
+        """From float weights of shape (n_features, len(TAGS)): symmetric int8 per tag."""
+        scales = np.abs(weights).max(axis=0) / 127
+        scales[scales == 0] = 1
+        quantized = np.clip(np.rint(weights / scales), -127, 127).astype(np.int8)
+        return cls(quantized, scales.astype(np.float32), bias.astype(np.float32))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "CompactTagger":
+        with np.load(path) as data:
+            if tuple(data["tags"]) != TAGS:
+                raise ValueError(f"{path} was trained for tags {tuple(data['tags'])}, expected {TAGS}")
+            return cls(data["weights"], data["scales"], data["bias"])
+
+    def save(self, path: str | Path) -> None:
+        np.savez_compressed(
+            path, weights=self._weights, scales=self._scales, bias=self._bias, tags=np.array(TAGS)
+        )
+
+    def scores(self, tokens: list[str]) -> np.ndarray:
+        """Log-probabilities of each tag, shape (len(tokens), len(TAGS))."""
+        ids = feature_ids(tokens, self.n_features)
+        logits = self._weights[ids].sum(axis=1, dtype=self._accumulator) * self._scales + self._bias
+        logits -= logits.max(axis=1, keepdims=True)
+        return logits - np.log(np.exp(logits).sum(axis=1, keepdims=True))
+
+    def _decode(self, scores: np.ndarray) -> list[int]:
+        best = scores[0] + self._transitions[-1]
+        back = []
+        for row in scores[1:]:
+            candidates = best[:, None] + self._transitions[:-1]
+            back.append(candidates.argmax(axis=0))
+            best = candidates.max(axis=0) + row
+        path = [int(best.argmax())]
+        for pointers in reversed(back):
+            path.append(int(pointers[path[-1]]))
+        return path[::-1]
+
+    def tag(self, text: str) -> list[Span]:
+        offsets = tokenize(text)
+        if not offsets:
+            return []
+        tags = self._decode(self.scores([text[start:end] for start, end in offsets]))
+
+        spans: list[Span] = []
+        for (start, end), tag in zip(offsets, tags):
+            name = TAGS[tag]
+            if name.startswith("I-"):
+                label, span_start, _ = spans[-1]
+                spans[-1] = (label, span_start, end)
+            elif name.startswith("B-"):
+                spans.append((name[2:], start, end))
+        return spans
@@ -1,13 +1,23 @@
-import pandas as pd
-from pathlib import Path
-from math import radians, cos, sin, sqrt, atan2
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .station_store import StationStore
+
+if TYPE_CHECKING:
+    from sklearn.neighbors import BallTree
 
 
 class GeoLocationService:
     _instance: "GeoLocationService | None" = None
-    _stations_with_coords: list[dict] | None = None
+    _store: StationStore | None = None
+    _tree: "BallTree | None" = None
+    # Stations sharing the same coordinates are indexed once; each tree point
+    # maps to a slice of `_point_ids` (CSV order, so the first id wins ties)
+    _point_ids: np.ndarray | None = None
+    _point_offsets: np.ndarray | None = None
 
-    STATIONS_DATA_PATH = "base/data/processed/entries.csv"
+    EARTH_RADIUS_KM = 6371
 
     @classmethod
     def get_instance(cls) -> "GeoLocationService":
@@ -17,35 +27,71 @@ class GeoLocationService:
         return cls._instance
 
     def _load_stations(self) -> None:
-        if GeoLocationService._stations_with_coords is not None:
+        if GeoLocationService._store is not None:
             return
+        store = GeoLocationService._store = StationStore.get_instance()
+        GeoLocationService._index_stations(store)
+        StationStore.on_reload(GeoLocationService._index_stations)
 
-        path = Path(self.STATIONS_DATA_PATH)
-        if not path.exists():
-            GeoLocationService._stations_with_coords = []
+    @classmethod
+    def _index_stations(cls, store: StationStore) -> None:
+        # Imported here: scikit-learn is slow to import and only geolocation needs it
+        from sklearn.neighbors import BallTree
+
+        rows = store.located_rows()
+        if rows.size == 0:
+            cls._tree = cls._point_ids = cls._point_offsets = None
             return
 
-        df = pd.read_csv(path)
+        ids = store.ids[rows]
+        coords = np.radians(np.column_stack([store.lat[rows], store.lon[rows]]))
 
-        GeoLocationService._stations_with_coords = [
-            {"id": row["index"], "lat": float(row["Y_WGS84"]), "lon": float(row["X_WGS84"])}
-            for _, row in df.iterrows()
-            if pd.notna(row["Y_WGS84"]) and pd.notna(row["X_WGS84"])
-        ]
+        points, point_of_station = np.unique(coords, axis=0, return_inverse=True)
+        order = np.argsort(point_of_station, kind="stable")
 
-    @staticmethod
-    def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        R = 6371
-        lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-        dlat, dlon = lat2 - lat1, lon2 - lon1
-        a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-        return R * 2 * atan2(sqrt(a), sqrt(1 - a))
+        cls._point_ids = ids[order]
+        cls._point_offsets = np.searchsorted(point_of_station[order], np.arange(len(points) + 1))
+        cls._tree = BallTree(points, metric="haversine")
 
     def find_nearest_station_id(self, lat: float, lon: float) -> int | None:
-        if not self._stations_with_coords:
+        if self._tree is None:
             return None
-        nearest = min(
-            self._stations_with_coords,
-            key=lambda s: self._haversine(lat, lon, s["lat"], s["lon"])
-        )
-        return nearest["id"]
+        ids, _ = self.find_nearest_station_ids([lat], [lon])
+        return int(ids[0])
+
+    def find_nearest_station_ids(
+        self, lats: np.ndarray | list[float], lons: np.ndarray | list[float]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized nearest-station lookup: returns (station ids, distances in km)."""
+        if self._tree is None:
+            raise ValueError("No station coordinates loaded")
+
+        query = np.radians(np.column_stack([lats, lons]))
+        distances, points = self._tree.query(query, k=1)
+        points = points[:, 0]
+
+        ids = self._point_ids[self._point_offsets[points]]  # type: ignore
+        return ids, distances[:, 0] * self.EARTH_RADIUS_KM
+
+    def find_k_nearest(
+        self, lat: float, lon: float, k: int = 5, max_km: float | None = None
+    ) -> list[tuple[int, float]]:
+        """Return up to `k` (station id, distance in km) pairs, nearest first."""
+        if self._tree is None or k <= 0:
+            return []
+
+        n_points = len(self._point_offsets) - 1  # type: ignore
+        query = np.radians([[lat, lon]])
+        distances, points = self._tree.query(query, k=min(k, n_points))
+
+        nearest: list[tuple[int, float]] = []
+        for distance, point in zip(distances[0], points[0]):
+            distance_km = float(distance) * self.EARTH_RADIUS_KM
+            if max_km is not None and distance_km > max_km:
+                break
+            start, end = self._point_offsets[point], self._point_offsets[point + 1]  # type: ignore
+            for station_id in self._point_ids[start:end]:  # type: ignore
+                nearest.append((int(station_id), distance_km))
+                if len(nearest) == k:
+                    return nearest
+        return nearest
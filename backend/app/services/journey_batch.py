@@ -0,0 +1,82 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Iterable
+
+from ..core.config import config
+from ..core.metrics import metrics
+from ..core.rate_limit import TokenBucket
+from ..models.journey import JourneyBatchResult, JourneySearchRequest, JourneySearchResponse
+from .navitia_service import NavitiaService
+
+logger = logging.getLogger(__name__)
+
+
+class JourneyBatchService:
+    """
+    Runs many journey searches concurrently for bulk reprocessing.
+
+    Searches go through a dedicated NavitiaService, so batches have their own
+    connection pool, share one token bucket for the upstream quota and retry
+    429/5xx answers, without slowing down interactive searches.
+    """
+
+    _instance: "JourneyBatchService | None" = None
+
+    def __init__(self, navitia: NavitiaService | None = None):
+        self._navitia = navitia or NavitiaService(
+            rate_limiter=TokenBucket(config.journey_batch_rate, config.journey_batch_burst),
+            max_retries=config.journey_batch_max_retries,
+        )
+
+    @classmethod
+    def get_instance(cls) -> "JourneyBatchService":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    async def aclose(self) -> None:
+        await self._navitia.aclose()
+
+    async def run(
+        self, items: Iterable[JourneySearchRequest], concurrency: int | None = None
+    ) -> AsyncIterator[JourneyBatchResult]:
+        """
+        Search every item, yielding results as they complete (not in order:
+        `index` is the item's position).
+
+        At most `concurrency` searches are in flight; `items` is consumed
+        lazily, so it can be a generator over a large file. A search that
+        raises yields an error result for its item rather than ending the
+        batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency or config.journey_batch_concurrency)
+        pending: set[asyncio.Task[JourneyBatchResult]] = set()
+
+        async def search(index: int, item: JourneySearchRequest) -> JourneyBatchResult:
+            try:
+                response = await self._navitia.search_journeys(**item.model_dump())
+            except Exception as e:
+                logger.exception("Batch search %d failed", index)
+                response = JourneySearchResponse(journeys=[], error=f"Erreur: {e}")
+            finally:
+                semaphore.release()
+            metrics.inc("journey_batch.errors" if response.error else "journey_batch.searches")
+            return JourneyBatchResult.model_construct(
+                **dict(response), index=index, request=item
+            )
+
+        try:
+            for index, item in enumerate(items):
+                await semaphore.acquire()
+                pending.add(asyncio.create_task(search(index, item)))
+                done = {task for task in pending if task.done()}
+                pending -= done
+                for task in done:
+                    yield task.result()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,101 @@
+import asyncio
+import time
+from typing import Callable, Generic, TypeVar
+
+from ..core.executors import BoundedExecutor, ExecutorSaturatedError
+from ..core.metrics import metrics
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesce concurrent calls into batches processed on a worker thread.
+
+    Items wait at most `max_wait_ms` (or until `max_batch_size` items are
+    queued) before being handed to `process_batch`. Only one batch runs at
+    a time: requests arriving meanwhile are queued and form the next batch.
+    Batches run on `executor` when given, on the default thread pool otherwise.
+
+    At most `max_pending` items wait for a batch; beyond that `submit`
+    raises `ExecutorSaturatedError` rather than queueing without bound.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[T]], list[R]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "batcher",
+        executor: BoundedExecutor | None = None,
+        max_pending: int = 1024,
+        retry_after: int = 1,
+    ):
+        self._process_batch = process_batch
+        self._executor = executor
+        self._max_batch_size = max_batch_size
+        self._max_pending = max_pending
+        self._retry_after = retry_after
+        self._max_wait = max_wait_ms / 1000
+        self._name = name
+        self._pending: list[tuple[T, asyncio.Future, float]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._running = False
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        if len(self._pending) >= self._max_pending:
+            raise ExecutorSaturatedError(self._name, self._retry_after)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((item, future, time.perf_counter()))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._running or not self._pending:
+            return
+
+        batch = self._pending[: self._max_batch_size]
+        self._pending = self._pending[self._max_batch_size :]
+        self._running = True
+
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[T, asyncio.Future, float]]) -> None:
+        started = time.perf_counter()
+        metrics.observe(f"{self._name}.batch_size", len(batch))
+        for _, _, enqueued in batch:
+            metrics.observe(f"{self._name}.queue_latency_ms", (started - enqueued) * 1000)
+
+        try:
+            items = [item for item, _, _ in batch]
+            if self._executor is not None:
+                results = await self._executor.run(self._process_batch, items)
+            else:
+                results = await asyncio.to_thread(self._process_batch, items)
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future, _), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._running = False
+            # Requests queued while this batch was running form the next one
+            self._flush()
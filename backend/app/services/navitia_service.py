@@ -1,14 +1,94 @@
-import httpx
-from datetime import datetime
+import asyncio
+import base64
+import binascii
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
+from ..core.cache import (
+    CacheBackend,
+    InMemoryCacheBackend,
+    SharedCacheBackend,
+    SingleFlight,
+    TTLCache,
+)
+from ..core.circuit_breaker import CircuitBreaker, CircuitOpenError
 from ..core.config import config
+from ..core.metrics import Summary, metrics
+from ..core.rate_limit import TokenBucket, backoff_delay
 from ..models.journey import (
     Journey,
     JourneySection,
     JourneyPlace,
     JourneySearchResponse,
 )
-from .geolocation import GeoLocationService
+from .station_store import StationStore
+
+# httpx is imported when the client is built (in the app's lifespan)
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Parameters of Navitia's next/prev links that a cursor carries over;
+# from/to, count and depth always come from the request itself
+CURSOR_PARAMS = (
+    "datetime",
+    "datetime_represents",
+    "timeframe_duration",
+    "min_nb_journeys",
+    "max_nb_journeys",
+)
+
+# Upstream statuses worth retrying: quota exceeded and server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _encode_cursor(href: str) -> str:
+    """Opaque cursor for a Navitia next/prev link."""
+    query = [(k, v) for k, v in parse_qsl(urlsplit(href).query) if k in CURSOR_PARAMS]
+    return base64.urlsafe_b64encode(urlencode(sorted(query)).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> dict[str, str] | None:
+    """
+    Navitia parameters of a cursor, or None if it is not one of ours.
+
+    Cursors come back from clients: the window they carry is clamped to the
+    limits applied to searches, so a forged one cannot widen it.
+    """
+    try:
+        query = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        return None
+    params = dict(parse_qsl(query))
+    if "datetime" not in params or not params.keys() <= set(CURSOR_PARAMS):
+        return None
+    try:
+        datetime.strptime(params["datetime"], "%Y%m%dT%H%M%S")
+        limits = {
+            "timeframe_duration": config.navitia_window_max_seconds,
+            "max_nb_journeys": config.navitia_window_max_journeys,
+            "min_nb_journeys": config.navitia_window_max_journeys,
+        }
+        for name, limit in limits.items():
+            if name in params:
+                params[name] = str(min(max(int(params[name]), 1), limit))
+    except ValueError:
+        return None
+    if params.get("datetime_represents", "departure") not in ("departure", "arrival"):
+        return None
+    return params
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
 
 class NavitiaService:
@@ -16,11 +96,49 @@ class NavitiaService:
 
     _instance: "NavitiaService | None" = None
 
-    def __init__(self):
+    def __init__(
+        self,
+        transport: "httpx.AsyncBaseTransport | None" = None,
+        cache: CacheBackend[JourneySearchResponse] | None = None,
+        rate_limiter: TokenBucket | None = None,
+        max_retries: int = 0,
+    ):
+        """
+        `rate_limiter` spaces out upstream calls; `max_retries` retries calls
+        answered 429/5xx with jittered exponential backoff. Both are meant
+        for bulk work, interactive searches fail fast by default.
+
+        Upstream failures (timeouts, 5xx) trip a circuit breaker; while it is
+        open, searches answer from the last good result for the same key,
+        flagged `stale`, and refresh it in the background.
+        """
         self._api_key = config.navitia_api_key
         self._base_url = config.navitia_base_url
         self._coverage = config.navitia_coverage
-        self._geolocation = GeoLocationService.get_instance()
+        self._stations = StationStore.get_instance()
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+        self._max_retries = max_retries
+        self._breaker = CircuitBreaker(
+            "navitia", config.navitia_breaker_failures, config.navitia_breaker_reset_seconds
+        )
+        # Upstream latencies, for the hedging delay
+        self._latency = Summary()
+        # Last good result per key, kept well past the cache TTL for outages
+        self._stale: TTLCache[str, JourneySearchResponse] = TTLCache(
+            config.navitia_stale_size, config.navitia_stale_ttl
+        )
+        self._revalidations: set[asyncio.Task] = set()
+        self._client: "httpx.AsyncClient | None" = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        # Clients left behind on another event loop, being closed from this one
+        self._discarded: set[asyncio.Task] = set()
+        self._cache = cache or self._build_cache()
+        self._inflight: SingleFlight[str, JourneySearchResponse] = SingleFlight()
+        # Page key of a cursor -> (page that issued it, "next" or "prev")
+        self._origins: TTLCache[str, tuple[JourneySearchResponse, str]] = TTLCache(
+            config.navitia_page_links_size, config.navitia_cache_ttl
+        )
 
     @classmethod
     def get_instance(cls) -> "NavitiaService":
@@ -28,18 +146,141 @@ class NavitiaService:
             cls._instance = cls()
         return cls._instance
 
+    def _build_client(self) -> "httpx.AsyncClient":
+        import httpx
+
+        http2 = config.navitia_http2
+        if http2 and not _http2_available():
+            logger.warning("NAVITIA_HTTP2 is set but the 'h2' package is missing, using HTTP/1.1")
+            http2 = False
+
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                config.navitia_read_timeout, connect=config.navitia_connect_timeout
+            ),
+            limits=httpx.Limits(
+                max_connections=config.navitia_max_connections,
+                max_keepalive_connections=config.navitia_max_keepalive_connections,
+                keepalive_expiry=config.navitia_keepalive_expiry,
+            ),
+            http2=http2,
+            transport=self._transport,
+        )
+
+    @staticmethod
+    def _build_cache() -> CacheBackend[JourneySearchResponse]:
+        if config.navitia_cache_backend == "redis":
+            try:
+                import redis.asyncio as redis
+            except ImportError as exc:
+                raise RuntimeError(
+                    "NAVITIA_CACHE_BACKEND=redis needs the 'redis' extra: uv sync --extra redis"
+                ) from exc
+
+            return SharedCacheBackend(
+                redis.from_url(config.redis_url),
+                dumps=lambda response: response.model_dump_json().encode(),
+                loads=JourneySearchResponse.model_validate_json,
+                prefix="navitia:journeys:",
+            )
+        return InMemoryCacheBackend(
+            config.navitia_cache_size, config.navitia_cache_ttl, name="navitia.cache"
+        )
+
+    @staticmethod
+    def _cache_key(
+        departure_station_id: int,
+        destination_station_id: int,
+        dt: datetime | None,
+        datetime_represents: str,
+        timeframe: int | None = None,
+    ) -> str:
+        """Key of a search, with the datetime rounded down to the cache bucket."""
+        timestamp = (dt or datetime.now()).timestamp()
+        bucket = int(timestamp // config.navitia_cache_bucket_seconds)
+        key = f"{departure_station_id}:{destination_station_id}:{datetime_represents}:{bucket}"
+        return f"{key}:{timeframe}" if timeframe else key
+
+    @staticmethod
+    def _page_key(
+        departure_station_id: int, destination_station_id: int, cursor: str, count: int, depth: int
+    ) -> str:
+        return f"{departure_station_id}:{destination_station_id}:page:{cursor}:{count}:{depth}"
+
+    @staticmethod
+    def _timeframe(start: datetime | None, datetime_end: str | None) -> int | None:
+        """Length in seconds of the searched window, if any."""
+        if start is None or not datetime_end:
+            return None
+        try:
+            end = datetime.fromisoformat(datetime_end.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        seconds = int((end - start).total_seconds())
+        return seconds if seconds > 0 else None
+
+    async def start(self) -> None:
+        """Open the pooled HTTP client (called from the app lifespan)."""
+        self._get_client()
+
+    async def aclose(self) -> None:
+        """Cancel pending background refreshes, then close the pooled HTTP client."""
+        revalidations = list(self._revalidations)
+        for task in revalidations:
+            task.cancel()
+        await asyncio.gather(*revalidations, return_exceptions=True)
+        await asyncio.gather(*self._discarded, return_exceptions=True)
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        # Pooled connections are bound to the event loop that opened them
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            self._discard_client(loop)
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client()
+            self._client_loop = loop
+        return self._client
+
+    def _discard_client(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close the client opened on another event loop so its sockets are not leaked."""
+        client, client_loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        if client is None or client.is_closed:
+            return
+        if client_loop is not None and client_loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+            return
+        # Its loop is gone: release what can still be released from this one
+        task = loop.create_task(self._close_orphan(client))
+        self._discarded.add(task)
+        task.add_done_callback(self._discarded.discard)
+
+    @staticmethod
+    async def _close_orphan(client: "httpx.AsyncClient") -> None:
+        try:
+            await client.aclose()
+        except Exception:
+            logger.debug("Closing a client left on a closed event loop failed", exc_info=True)
+
     def _get_station_coords(self, station_id: int) -> tuple[float, float] | None:
-        """Get the coordinates of a station by its ID."""
-        stations = self._geolocation._stations_with_coords or []
-        for station in stations:
-            if station["id"] == station_id:
-                return (station["lon"], station["lat"])
-        return None
+        """Get the (lon, lat) coordinates of a station by its ID."""
+        coords = self._stations.get_coords(station_id)
+        return (coords[1], coords[0]) if coords else None
 
     def _format_coords(self, coords: tuple[float, float]) -> str:
         """Format the coordinates for the Navitia API (lon;lat)."""
         return f"{coords[0]};{coords[1]}"
 
+    # The parsers below build models with `model_construct`: Navitia's payload
+    # is trusted and values are coerced by hand, which skips Pydantic
+    # validation of every nested journey/section/place.
+
     def _parse_place(self, place_data: dict) -> JourneyPlace:
         """Parse a place from the Navitia response."""
         name = place_data.get("name", "Inconnu")
@@ -60,7 +301,7 @@ class NavitiaService:
             c = place_data["address"]["coord"]
             coord = (float(c["lon"]), float(c["lat"]))
         
-        return JourneyPlace(name=name, coord=coord)
+        return JourneyPlace.model_construct(name=str(name), coord=coord)
 
     def _parse_section(self, section_data: dict) -> JourneySection:
         """Parse a section of a journey from the Navitia response."""
@@ -85,14 +326,14 @@ class NavitiaService:
             direction = display.get("direction")
             network = display.get("network")
         
-        return JourneySection(
+        return JourneySection.model_construct(
             type=section_type,
             mode=mode,
             from_place=from_place,
             to_place=to_place,
             departure_datetime=section_data.get("departure_date_time", ""),
             arrival_datetime=section_data.get("arrival_date_time", ""),
-            duration=section_data.get("duration", 0),
+            duration=int(section_data.get("duration", 0)),
             line_name=line_name,
             line_code=line_code,
             commercial_mode=commercial_mode,
@@ -109,14 +350,15 @@ class NavitiaService:
         
         co2 = None
         if "co2_emission" in journey_data and journey_data["co2_emission"]:
-            co2 = journey_data["co2_emission"].get("value")
+            value = journey_data["co2_emission"].get("value")
+            co2 = float(value) if value is not None else None
         
-        return Journey(
+        return Journey.model_construct(
             departure_datetime=journey_data.get("departure_date_time", ""),
             arrival_datetime=journey_data.get("arrival_date_time", ""),
-            duration=journey_data.get("duration", 0),
-            nb_transfers=journey_data.get("nb_transfers", 0),
-            walking_duration=journey_data.get("durations", {}).get("walking", 0),
+            duration=int(journey_data.get("duration", 0)),
+            nb_transfers=int(journey_data.get("nb_transfers", 0)),
+            walking_duration=int(journey_data.get("durations", {}).get("walking", 0)),
             co2_emission=co2,
             sections=sections,
         )
@@ -127,9 +369,21 @@ class NavitiaService:
         destination_station_id: int,
         datetime_iso: str | None = None,
         datetime_represents: str = "departure",
+        datetime_end: str | None = None,
+        count: int = 1,
+        depth: int = 2,
+        cursor: str | None = None,
     ) -> JourneySearchResponse:
         """
         Search for journeys between two stations.
+
+        With `datetime_end`, every journey of the [datetime_iso, datetime_end]
+        window is fetched in a single upstream call (Navitia's
+        `timeframe_duration`) instead of only the next `count` ones.
+
+        `cursor` is the `next_cursor` or `prev_cursor` of an earlier response
+        for the same stations, count and depth; it replaces the datetime
+        arguments. Going back to a page already seen is served from the cache.
         """
         if not self._api_key:
             return JourneySearchResponse(
@@ -161,11 +415,24 @@ class NavitiaService:
             "from": self._format_coords(dep_coords),
             "to": self._format_coords(dest_coords),
             "datetime_represents": datetime_represents,
-            "count": 1,  # Number of journeys to return
-            "depth": 2,  # Detail level
+            "count": count,  # Number of journeys to return
+            "depth": depth,  # Detail level
         }
-        
+
+        def page_key(cursor: str) -> str:
+            return self._page_key(departure_station_id, destination_station_id, cursor, count, depth)
+
+        if cursor is not None:
+            paging = _decode_cursor(cursor)
+            if paging is None:
+                return JourneySearchResponse(journeys=[], error="Curseur de pagination invalide")
+            params.update(paging)
+            if "timeframe_duration" in paging:
+                del params["count"]
+            return await self._get_page(page_key(cursor), url, params, page_key)
+
         # Add the datetime if provided
+        dt: datetime | None = None
         if datetime_iso:
             # Convert ISO to Navitia format (YYYYMMDDTHHmmss)
             try:
@@ -173,54 +440,275 @@ class NavitiaService:
                 params["datetime"] = dt.strftime("%Y%m%dT%H%M%S")
             except ValueError:
                 pass
-        
+
+        timeframe = self._timeframe(dt, datetime_end)
+        max_window = config.navitia_window_max_days * 86400
+        if dt is not None and timeframe and timeframe > config.navitia_window_max_seconds:
+            result = await self._search_days(
+                departure_station_id,
+                destination_station_id,
+                dt,
+                min(timeframe, max_window),
+                datetime_represents,
+                count,
+                depth,
+            )
+            return result.model_copy(update={"truncated": timeframe > max_window})
+        if dt is not None and timeframe:
+            end = dt + timedelta(seconds=timeframe)
+            if datetime_represents == "arrival":
+                # Arrivals are searched backwards from the end of the window
+                dt = end
+                params["datetime"] = dt.strftime("%Y%m%dT%H%M%S")
+            del params["count"]
+            params["timeframe_duration"] = timeframe
+            params["min_nb_journeys"] = config.navitia_window_min_journeys
+            params["max_nb_journeys"] = config.navitia_window_max_journeys
+
+        key = self._cache_key(
+            departure_station_id, destination_station_id, dt, datetime_represents, timeframe
+        )
+        return await self._get_page(f"{key}:{count}:{depth}", url, params, page_key)
+
+    async def _search_days(
+        self,
+        departure_station_id: int,
+        destination_station_id: int,
+        start: datetime,
+        seconds: int,
+        datetime_represents: str,
+        count: int,
+        depth: int,
+    ) -> JourneySearchResponse:
+        """
+        A window longer than Navitia accepts, searched as consecutive windows
+        of `navitia_window_max_seconds` (each cached on its own) concurrently.
+        """
+        step = config.navitia_window_max_seconds
+        windows = [
+            (start + timedelta(seconds=offset), start + timedelta(seconds=min(offset + step, seconds)))
+            for offset in range(0, seconds, step)
+        ]
+        pages = await asyncio.gather(
+            *(
+                self.search_journeys(
+                    departure_station_id,
+                    destination_station_id,
+                    window_start.isoformat(),
+                    datetime_represents,
+                    datetime_end=window_end.isoformat(),
+                    count=count,
+                    depth=depth,
+                )
+                for window_start, window_end in windows
+            )
+        )
+
+        journeys, seen = [], set()
+        for page in pages:
+            for journey in page.journeys:
+                # Navitia may return a few journeys past the end of a window
+                key = (journey.departure_datetime, journey.arrival_datetime, journey.nb_transfers)
+                if key not in seen:
+                    seen.add(key)
+                    journeys.append(journey)
+        errors = [page.error for page in pages if page.error is not None]
+        return JourneySearchResponse(
+            journeys=journeys,
+            error=errors[0] if errors else None,
+            prev_cursor=pages[0].prev_cursor,
+            next_cursor=pages[-1].next_cursor,
+            stale=any(page.stale for page in pages),
+        )
+
+    async def _get_page(
+        self, key: str, url: str, params: dict, page_key: Callable[[str], str]
+    ) -> JourneySearchResponse:
+        """Cached or fetched page, its cursors remembered for paging back."""
+        result = await self._cache.get(key)
+        if result is None:
+            stale = self._stale.get(key)
+            # Concurrent identical lookups share a single upstream call
+            fetch = self._inflight.do(key, lambda: self._fetch_and_cache(key, url, params, stale))
+            if stale is not None and self._breaker.state != CircuitBreaker.CLOSED:
+                # Upstream failing: answer at once, refresh in the background
+                task = asyncio.ensure_future(fetch)
+                self._revalidations.add(task)
+                task.add_done_callback(self._revalidations.discard)
+                return self._serve_stale(stale)
+            result = await fetch
+        if result.error is not None or result.stale:
+            return result
+
+        origin = self._origins.get(key)
+        if origin is not None:
+            # Going back from this page leads to the page it was reached from
+            previous, direction = origin
+            back = result.prev_cursor if direction == "next" else result.next_cursor
+            if back:
+                await self._cache.set(page_key(back), previous, config.navitia_cache_ttl)
+        for direction, cursor in (("next", result.next_cursor), ("prev", result.prev_cursor)):
+            if cursor:
+                self._origins.set(page_key(cursor), (result, direction))
+        return result
+
+    async def _fetch_and_cache(
+        self, key: str, url: str, params: dict, stale: JourneySearchResponse | None = None
+    ) -> JourneySearchResponse:
+        result = await self._fetch_journeys(url, params, stale)
+        if result.error is None and not result.stale:
+            await self._cache.set(key, result, config.navitia_cache_ttl)
+            self._stale.set(key, result)
+        return result
+
+    @staticmethod
+    def _serve_stale(stale: JourneySearchResponse) -> JourneySearchResponse:
+        metrics.inc("navitia.stale_served")
+        return stale.model_copy(update={"stale": True})
+
+    async def _get(self, url: str, params: dict) -> "httpx.Response":
+        """GET through the circuit breaker, with rate limiting and retries."""
+        import httpx
+
+        attempt = 0
+        while True:
+            self._breaker.before_call()
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            try:
+                response = await self._send(url, params)
+            except httpx.TransportError:
+                self._breaker.record_failure()
+                raise
+            if response.status_code >= 500:
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+
+            if response.status_code not in RETRY_STATUSES or attempt >= self._max_retries:
+                return response
+
+            delay = backoff_delay(
+                attempt, config.navitia_retry_base_delay, config.navitia_retry_max_delay
+            )
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), config.navitia_retry_max_delay))
+            logger.info("Navitia answered %s, retrying in %.2fs", response.status_code, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(self, url: str, params: dict) -> "httpx.Response":
+        """
+        GET, hedged: when `navitia_hedge_quantile` is set and the call outlives
+        that quantile of recent upstream latencies, a second identical call
+        is sent and the first response wins.
+        """
+        tasks = {asyncio.ensure_future(self._timed_get(url, params))}
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    params=params,
-                    headers={"Authorization": self._api_key},
-                    timeout=30.0,
+            quantile = config.navitia_hedge_quantile
+            if quantile and self._latency.count >= config.navitia_hedge_min_samples:
+                done, _ = await asyncio.wait(tasks, timeout=self._latency.quantile(quantile))
+                if not done:
+                    metrics.inc("navitia.hedged")
+                    tasks.add(asyncio.ensure_future(self._timed_get(url, params)))
+            while True:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    return succeeded[0].result()
+                # A failed call only counts once its hedge has failed too
+                if not tasks:
+                    return done.pop().result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _timed_get(self, url: str, params: dict) -> "httpx.Response":
+        start = time.perf_counter()
+        response = await self._get_client().get(
+            url,
+            params=params,
+            headers={"Authorization": self._api_key},
+        )
+        elapsed = time.perf_counter() - start
+        self._latency.observe(elapsed)
+        metrics.observe("navitia.upstream_ms", elapsed * 1000)
+        return response
+
+    async def _fetch_journeys(
+        self, url: str, params: dict, stale: JourneySearchResponse | None = None
+    ) -> JourneySearchResponse:
+        """
+        Call the Navitia journeys endpoint and parse the response.
+
+        When Navitia is unavailable (open circuit, timeout, 5xx), `stale` is
+        returned instead of an error if given.
+        """
+        import httpx
+
+        try:
+            response = await self._get(url, params)
+            
+            if response.status_code == 401:
+                return JourneySearchResponse(
+                    journeys=[],
+                    error="Clé API Navitia invalide"
                 )
+            
+            if response.status_code == 404:
+                return JourneySearchResponse(
+                    journeys=[],
+                    error="Aucun trajet trouvé"
+                )
+            
+            response.raise_for_status()
+            data = response.json()
+            
+            # Parse the journeys
+            journeys = []
+            for journey_data in data.get("journeys", []):
+                try:
+                    journey = self._parse_journey(journey_data)
+                    journeys.append(journey)
+                except Exception:
+                    continue
+            
+            if not journeys and "error" in data:
+                return JourneySearchResponse(
+                    journeys=[],
+                    error=data["error"].get("message", "Erreur inconnue")
+                )
+            
+            cursors = {
+                f"{link['type']}_cursor": _encode_cursor(link["href"])
+                for link in data.get("links", [])
+                if link.get("type") in ("next", "prev") and link.get("href")
+            }
+            return JourneySearchResponse.model_construct(
+                journeys=journeys,
+                error=None,
+                next_cursor=cursors.get("next_cursor"),
+                prev_cursor=cursors.get("prev_cursor"),
+            )
                 
-                if response.status_code == 401:
-                    return JourneySearchResponse(
-                        journeys=[],
-                        error="Clé API Navitia invalide"
-                    )
-                
-                if response.status_code == 404:
-                    return JourneySearchResponse(
-                        journeys=[],
-                        error="Aucun trajet trouvé"
-                    )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Parse the journeys
-                journeys = []
-                for journey_data in data.get("journeys", []):
-                    try:
-                        journey = self._parse_journey(journey_data)
-                        journeys.append(journey)
-                    except Exception:
-                        continue
-                
-                if not journeys and "error" in data:
-                    return JourneySearchResponse(
-                        journeys=[],
-                        error=data["error"].get("message", "Erreur inconnue")
-                    )
-                
-                return JourneySearchResponse(journeys=journeys)
-                
+        except CircuitOpenError:
+            if stale is not None:
+                return self._serve_stale(stale)
+            return JourneySearchResponse(
+                journeys=[],
+                error="Navitia indisponible, nouvel essai dans quelques instants"
+            )
         except httpx.TimeoutException:
+            if stale is not None:
+                return self._serve_stale(stale)
             return JourneySearchResponse(
                 journeys=[],
                 error="Timeout lors de la requête Navitia"
             )
         except httpx.HTTPStatusError as e:
+            if stale is not None and e.response.status_code >= 500:
+                return self._serve_stale(stale)
             return JourneySearchResponse(
                 journeys=[],
                 error=f"Erreur HTTP: {e.response.status_code}"
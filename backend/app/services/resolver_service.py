@@ -0,0 +1,187 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+from ..core.executors import cpu_executor
+from ..core.metrics import metrics
+from ..models.journey import Journey, JourneySearchResponse
+from ..models.resolve import (
+    ResolvedDatetime,
+    ResolvedStations,
+    ResolveError,
+    ResolveResponse,
+)
+from ..models.transcription import WhisperModelName
+from .geolocation import GeoLocationService
+from .navitia_service import NavitiaService
+from .station_matcher import StationMatcher
+from .time_normalizer import TimeNormalizer
+from .transcription_service import Audio, TranscriptionService
+from .travel_service import TravelService
+
+T = TypeVar("T")
+
+
+class ResolverService:
+    """
+    Whole pipeline from a spoken or typed travel order to journeys.
+
+    transcription -> NER -> (departure match | destination match | time
+    normalization | nearest station) -> Navitia search. The steps in
+    parentheses only depend on the NER output and run concurrently.
+    """
+
+    _instance: "ResolverService | None" = None
+
+    def __init__(self):
+        self._transcription = TranscriptionService.get_instance()
+        self._travel = TravelService.get_instance()
+        self._station_matcher = StationMatcher.get_instance()
+        self._geolocation = GeoLocationService.get_instance()
+        self._navitia = NavitiaService.get_instance()
+
+    @classmethod
+    def get_instance(cls) -> "ResolverService":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _match_station_id(self, text: str | None) -> int | None:
+        if not text:
+            return None
+        match = self._station_matcher.match(text)
+        return match.id if match else None
+
+    async def stream(
+        self,
+        text: str | None = None,
+        audio: Audio | None = None,
+        coords: tuple[float, float] | None = None,
+        model_name: WhisperModelName | None = None,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Resolve `text`, or the transcription of `audio`, yielding
+        `(event, payload)` pairs as soon as each stage completes:
+
+        - "transcription": TranscriptionResponse (audio only)
+        - "entities": TravelEntities
+        - "datetime": ResolvedDatetime
+        - "stations": ResolvedStations
+        - "journey": Journey, once per journey found
+        - "error": ResolveError, when the journey search fails
+        - "timings": milliseconds per stage, plus "total"; always last
+        """
+        if (text is None) == (audio is None):
+            raise ValueError("Exactly one of text and audio is required")
+
+        timings: dict[str, float] = {}
+        start = time.perf_counter()
+
+        if audio is not None:
+            transcription = await _timed(
+                timings, "transcription", self._transcription.transcribe_async(audio, model_name)
+            )
+            yield "transcription", transcription
+            text = transcription.text
+        assert text is not None
+
+        entities = await _timed(timings, "ner", self._travel.extract_entities_async(text))
+        yield "entities", entities
+
+        def stage(name: str, fn: Callable[..., T], *args) -> "asyncio.Future[T]":
+            return asyncio.ensure_future(_timed(timings, name, cpu_executor.run(fn, *args)))
+
+        departure = stage("departure_match", self._match_station_id, entities.departure)
+        destination = stage("destination_match", self._match_station_id, entities.destination)
+        # Computed alongside the departure match in case it finds nothing
+        nearest = stage("geolocation", self._geolocation.find_nearest_station_id, *coords) if coords else None
+        when = stage("time_normalization", TimeNormalizer.normalize_window, entities.time) if entities.time else None
+
+        station_stages = [f for f in (departure, destination, nearest) if f is not None]
+        pending: set[asyncio.Future] = set(station_stages) | ({when} if when else set())
+        stations = None
+        resolved_datetime = ResolvedDatetime()
+        try:
+            if when is None:
+                yield "datetime", resolved_datetime
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if when in done:
+                    window = when.result()
+                    if window is not None:
+                        resolved_datetime = ResolvedDatetime(**window.response_fields())
+                    yield "datetime", resolved_datetime
+                if stations is None and all(f.done() for f in station_stages):
+                    departure_id = departure.result()
+                    nearest_id = nearest.result() if nearest else None
+                    stations = ResolvedStations(
+                        departure_id=departure_id if departure_id is not None else nearest_id,
+                        destination_id=destination.result(),
+                        departure_from_location=departure_id is None and nearest_id is not None,
+                    )
+                    yield "stations", stations
+        finally:
+            for future in pending:
+                future.cancel()
+        assert stations is not None
+
+        if stations.departure_id is not None and stations.destination_id is not None:
+            journeys = await _timed(
+                timings,
+                "journeys",
+                self._navitia.search_journeys(
+                    stations.departure_id,
+                    stations.destination_id,
+                    resolved_datetime.datetime_iso,
+                    resolved_datetime.datetime_represents,
+                    resolved_datetime.datetime_end,
+                ),
+            )
+            if journeys.error:
+                yield "error", ResolveError(stage="journeys", status_code=502, detail=journeys.error)
+            for journey in journeys.journeys:
+                yield "journey", journey
+
+        timings["total"] = (time.perf_counter() - start) * 1000
+        for name, ms in timings.items():
+            metrics.observe(f"resolve.{name}_ms", ms)
+        yield "timings", timings
+
+    async def resolve(
+        self,
+        text: str | None = None,
+        audio: Audio | None = None,
+        coords: tuple[float, float] | None = None,
+        model_name: WhisperModelName | None = None,
+    ) -> ResolveResponse:
+        """Resolve `text`, or the transcription of `audio`, into journeys."""
+        result: dict[str, Any] = {"text": text}
+        journeys: list[Journey] = []
+        error = None
+
+        async for event, payload in self.stream(text, audio, coords, model_name):
+            if event == "transcription":
+                result["transcription"] = payload
+                result["text"] = payload.text
+            elif event == "entities":
+                result["entities"] = payload
+            elif event in ("datetime", "stations"):
+                result.update(payload.model_dump())
+            elif event == "journey":
+                journeys.append(payload)
+            elif event == "error":
+                error = payload.detail
+            elif event == "timings":
+                result["timings"] = payload
+
+        if "journeys" in result["timings"]:
+            result["journeys"] = JourneySearchResponse.model_construct(journeys=journeys, error=error)
+        return ResolveResponse(**result)
+
+
+async def _timed(timings: dict[str, float], stage: str, awaitable: Awaitable[T]) -> T:
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[stage] = (time.perf_counter() - start) * 1000
@@ -0,0 +1,90 @@
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+
+# Same ASCII folding as thefuzz's `full_process(force_ascii=True)`
+_ASCII_TABLE = {i: None for i in range(128, 256)}
+
+
+def _process(text: str) -> str:
+    return default_process(text.translate(_ASCII_TABLE))
+
+
+def _sorted_tokens(text: str) -> str:
+    return " ".join(sorted(text.split()))
+
+
+class StationSearchIndex:
+    """
+    Search index reproducing `thefuzz.process.extractOne(..., scorer=token_sort_ratio)`.
+
+    Choices are preprocessed once at build time. At query time, a character
+    count index gives an upper bound of the `token_sort_ratio` of every
+    choice (the LCS of two strings can't exceed their common character
+    counts), computed in a single vectorized pass. Only the shortlist whose
+    bound reaches the cutoff is scored with RapidFuzz, in original order, so
+    the best match and tie-breaking are identical to a full scan.
+    """
+
+    def __init__(self, choices: list[str]):
+        self._processed = [_process(choice) for choice in choices]
+
+        sorted_choices = [_sorted_tokens(p) for p in self._processed]
+        alphabet = sorted({c for s in sorted_choices for c in s})
+        self._columns = {c: i for i, c in enumerate(alphabet)}
+
+        self._counts = np.zeros((len(choices), len(alphabet)), dtype=np.int16)
+        for row, s in enumerate(sorted_choices):
+            for c in s:
+                self._counts[row, self._columns[c]] += 1
+        self._lengths = np.array([len(s) for s in sorted_choices], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self._processed)
+
+    def _upper_bounds(self, query: str) -> np.ndarray:
+        sorted_query = _sorted_tokens(query)
+        counts = np.zeros(len(self._columns), dtype=np.int16)
+        for c in sorted_query:
+            column = self._columns.get(c)
+            if column is not None:
+                counts[column] += 1
+
+        overlap = np.minimum(self._counts, counts).sum(axis=1)
+        total = self._lengths + len(sorted_query)
+        return 200.0 * overlap / np.maximum(total, 1.0)
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Query as seen by the scorer: queries normalizing alike match alike."""
+        # thefuzz applies its default processor to the query before the scorer's own
+        return _process(default_process(query))
+
+    def extract_one(self, query: str, score_cutoff: float = 0) -> tuple[int, float] | None:
+        """Return (choice position, unrounded score) of the best match, or None."""
+        return self.extract_one_normalized(self.normalize_query(query), score_cutoff)
+
+    def extract_one_normalized(
+        self, processed_query: str, score_cutoff: float = 0
+    ) -> tuple[int, float] | None:
+        if processed_query:
+            # Small tolerance so float rounding never prunes an exact candidate
+            shortlist = np.flatnonzero(self._upper_bounds(processed_query) + 1e-6 >= score_cutoff)
+        else:
+            shortlist = np.arange(len(self._processed))
+
+        if shortlist.size == 0:
+            return None
+
+        result = process.extractOne(
+            processed_query,
+            [self._processed[i] for i in shortlist],
+            scorer=fuzz.token_sort_ratio,
+            processor=None,
+            score_cutoff=score_cutoff,
+        )
+        if result is None:
+            return None
+
+        _, score, position = result
+        return int(shortlist[position]), score
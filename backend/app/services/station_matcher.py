@@ -1,8 +1,12 @@
-import pandas as pd
-from pathlib import Path
-from thefuzz import process, fuzz
 from pydantic import BaseModel
 
+from ..core.cache import LRUCache
+from ..core.config import config
+from .station_index import StationSearchIndex
+from .station_store import StationStore
+
+_MISSING = object()
+
 
 class StationMatch(BaseModel):
     id: int
@@ -15,73 +19,101 @@ class StationMatcher:
     """Fuzzy matching service for station names."""
 
     _instance: "StationMatcher | None" = None
-    _entries_list: list[str] | None = None
-    _entries_lookup: dict[str, tuple[int, str]] | None = None
-    _all_entries: list[dict] | None = None
 
-    DEFAULT_DATA_PATH = "base/data/processed/entries.csv"
+    DEFAULT_DATA_PATH = StationStore.DEFAULT_DATA_PATH
     MIN_SCORE_THRESHOLD = 60
 
-    def __init__(self, data_path: str | None = None):
+    def __init__(self, data_path: str | None = None, cache_size: int | None = None):
         self._data_path = data_path or self.DEFAULT_DATA_PATH
+        self._store: StationStore | None = None
+        self._index: StationSearchIndex | None = None
+        self._cache: LRUCache[tuple[str, int], StationMatch | None] = LRUCache(
+            config.station_match_cache_size if cache_size is None else cache_size,
+            name="station_matcher.cache",
+        )
 
     @classmethod
-    def get_instance(cls, data_path: str | None = None) -> "StationMatcher":
+    def get_instance(
+        cls, data_path: str | None = None, cache_size: int | None = None
+    ) -> "StationMatcher":
         if cls._instance is None:
-            cls._instance = cls(data_path)
+            cls._instance = cls(data_path, cache_size)
             cls._instance._load_data()
         return cls._instance
 
+    def reload(self) -> None:
+        """Reload the station data and drop cached matches."""
+        if self._data_path == StationStore.DEFAULT_DATA_PATH:
+            # Every service on the shared store rebuilds through its reload hook
+            StationStore.reload()
+            self._load_data()
+        else:
+            self._store = None
+            self._load_data()
+            self._cache.clear()
+
     def _load_data(self) -> None:
-        if StationMatcher._entries_list is not None:
+        if self._store is not None:
             return
-            
-        path = Path(self._data_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Data file not found: {self._data_path}")
-        
-        df = pd.read_csv(path)
-        
-        StationMatcher._entries_list = df['entries'].tolist()
-        StationMatcher._entries_lookup = {
-            row['entries']: (row['index'], row['raw'])
-            for _, row in df.iterrows()
-        }
-        StationMatcher._all_entries = [
-            {"id": row['index'], "raw": row['raw'], "entries": row['entries']}
-            for _, row in df.iterrows()
-        ]
+
+        if self._data_path == StationStore.DEFAULT_DATA_PATH:
+            self._store = StationStore.get_instance()
+            StationStore.on_reload(self._rebuild)
+        else:
+            self._store = StationStore.load(self._data_path)
+        self._index = StationSearchIndex(self._store.entries.tolist())
+
+    def _rebuild(self, store: StationStore) -> None:
+        self._index = StationSearchIndex(store.entries.tolist())
+        self._cache.clear()
 
     def match(self, query: str, score_cutoff: int | None = None) -> StationMatch | None:
         if not query or not query.strip():
             return None
 
         cutoff = score_cutoff or self.MIN_SCORE_THRESHOLD
-        result = process.extractOne(
-            query.lower().strip(),
-            self._entries_list,
-            score_cutoff=cutoff,
-            scorer=fuzz.token_sort_ratio
-        )
+        normalized = StationSearchIndex.normalize_query(query.lower().strip())
+
+        cached = self._cache.get((normalized, cutoff), _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        match = self._match_normalized(normalized, cutoff)
+        self._cache.set((normalized, cutoff), match)
+        return match
+
+    def _match_normalized(self, normalized: str, cutoff: int) -> StationMatch | None:
+        result = self._index.extract_one_normalized(normalized, score_cutoff=cutoff)  # type: ignore
 
         if result is None:
             return None
 
-        matched_entry, score = result[0], result[1]
-        entry_id, raw_name = self._entries_lookup[matched_entry]  # type: ignore
+        row, score = result
+        return self._to_match(row, int(round(score)))
 
-        return StationMatch(id=entry_id, raw=raw_name, matched=matched_entry, score=score)
+    def _to_match(self, row: int, score: int) -> StationMatch:
+        store: StationStore = self._store  # type: ignore
+        return StationMatch(
+            id=int(store.ids[row]),
+            raw=str(store.raw[row]),
+            matched=str(store.entries[row]),
+            score=score,
+        )
+
+    def cache_stats(self) -> dict:
+        return self._cache.stats()
 
     def get_by_id(self, entry_id: int) -> StationMatch | None:
-        for entry in self._all_entries or []:
-            if entry["id"] == entry_id:
-                return StationMatch(
-                    id=entry["id"],
-                    raw=entry["raw"],
-                    matched=entry["entries"],
-                    score=100
-                )
-        return None
+        row = self._store.row(entry_id)  # type: ignore
+        if row is None:
+            return None
+        return self._to_match(row, score=100)
 
     def get_all_entries(self) -> list[dict]:
-        return self._all_entries or []
+        store: StationStore = self._store  # type: ignore
+        return [
+            {"id": station_id, "raw": raw, "entries": entries}
+            for station_id, raw, entries in zip(
+                store.ids.tolist(), store.raw.tolist(), store.entries.tolist()
+            )
+        ]
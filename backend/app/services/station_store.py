@@ -0,0 +1,170 @@
+import csv
+import hashlib
+import logging
+import weakref
+import numpy as np
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+NUMERIC_COLUMNS = ("ids", "lat", "lon")
+# Stored in the snapshot as newline-joined UTF-8 blobs rather than fixed-width arrays
+STRING_COLUMNS = ("raw", "entries")
+
+
+class StationStore:
+    """
+    Columnar station table shared by all services.
+
+    `entries.csv` is parsed once into NumPy arrays (ids, raw names,
+    normalized entries, lat/lon) with an id -> row index, so lookups by id
+    are O(1) and a single copy of the table lives in memory.
+
+    When a binary snapshot built from the same CSV (checked by hash) sits
+    next to it, the arrays are read from the snapshot instead of parsing
+    the CSV. See `build_snapshot`.
+
+    Services deriving indexes from the shared store register an `on_reload`
+    hook to rebuild them when `reload` swaps the data.
+    """
+
+    _instance: "StationStore | None" = None
+    # Called with the shared store after every reload; held weakly
+    _reload_hooks: list[weakref.WeakMethod] = []
+
+    DEFAULT_DATA_PATH = "base/data/processed/entries.csv"
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        raw: np.ndarray,
+        entries: np.ndarray,
+        lat: np.ndarray,
+        lon: np.ndarray,
+    ):
+        self.ids = ids
+        self.raw = raw
+        self.entries = entries
+        self.lat = lat
+        self.lon = lon
+        self._rows = {int(station_id): row for row, station_id in enumerate(ids)}
+
+    @classmethod
+    def get_instance(cls) -> "StationStore":
+        if cls._instance is None:
+            cls._instance = cls.load(cls.DEFAULT_DATA_PATH)
+        return cls._instance
+
+    @classmethod
+    def on_reload(cls, hook: Callable[["StationStore"], None]) -> None:
+        """Call `hook`, a bound method, with the shared store after every `reload`."""
+        cls._reload_hooks.append(weakref.WeakMethod(hook))
+
+    @classmethod
+    def reload(cls) -> "StationStore":
+        """Re-read the station data in place, so every service sees the update, then run the hooks."""
+        fresh = cls.load(cls.DEFAULT_DATA_PATH)
+        if cls._instance is None:
+            cls._instance = fresh
+        else:
+            vars(cls._instance).update(vars(fresh))
+
+        live = []
+        for ref in cls._reload_hooks:
+            hook = ref()
+            if hook is not None:
+                hook(cls._instance)
+                live.append(ref)
+        cls._reload_hooks[:] = live
+        return cls._instance
+
+    @classmethod
+    def load(cls, data_path: str) -> "StationStore":
+        path = Path(data_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Data file not found: {data_path}")
+
+        source_hash = _file_hash(path)
+        store = cls._load_snapshot(snapshot_path_for(path), source_hash)
+        if store is None:
+            store = cls._load_csv(path)
+        return store
+
+    @classmethod
+    def _load_snapshot(cls, snapshot_path: Path, source_hash: str) -> "StationStore | None":
+        if not snapshot_path.exists():
+            return None
+        try:
+            with np.load(snapshot_path, allow_pickle=False) as snapshot:
+                if str(snapshot["source_sha256"]) != source_hash:
+                    logger.warning("Station snapshot %s is stale, reading CSV", snapshot_path)
+                    return None
+                columns = {column: snapshot[column] for column in NUMERIC_COLUMNS}
+                for column in STRING_COLUMNS:
+                    blob = snapshot[column].tobytes().decode("utf-8")
+                    columns[column] = np.array(blob.split("\n"), dtype=str)
+                return cls(**columns)
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning("Unreadable station snapshot %s (%s), reading CSV", snapshot_path, e)
+            return None
+
+    @classmethod
+    def _load_csv(cls, path: Path) -> "StationStore":
+        with path.open(newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+        return cls(
+            ids=np.array([int(r["index"]) for r in rows], dtype=np.int64),
+            raw=np.array([r["raw"] for r in rows], dtype=str),
+            entries=np.array([r["entries"] for r in rows], dtype=str),
+            lat=np.array([_to_float(r["Y_WGS84"]) for r in rows], dtype=np.float64),
+            lon=np.array([_to_float(r["X_WGS84"]) for r in rows], dtype=np.float64),
+        )
+
+    @classmethod
+    def build_snapshot(cls, data_path: str | None = None) -> Path:
+        """Compile the CSV into a binary snapshot next to it and return its path."""
+        path = Path(data_path or cls.DEFAULT_DATA_PATH)
+        store = cls._load_csv(path)
+        snapshot_path = snapshot_path_for(path)
+        blobs = {
+            column: np.frombuffer("\n".join(getattr(store, column)).encode("utf-8"), dtype=np.uint8)
+            for column in STRING_COLUMNS
+        }
+        np.savez(
+            snapshot_path,
+            source_sha256=np.array(_file_hash(path)),
+            **{column: getattr(store, column) for column in NUMERIC_COLUMNS},
+            **blobs,
+        )
+        return snapshot_path
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def row(self, station_id: int) -> int | None:
+        return self._rows.get(station_id)
+
+    def get_coords(self, station_id: int) -> tuple[float, float] | None:
+        """Return (lat, lon) of a station, or None if unknown or not located."""
+        row = self.row(station_id)
+        if row is None or np.isnan(self.lat[row]) or np.isnan(self.lon[row]):
+            return None
+        return float(self.lat[row]), float(self.lon[row])
+
+    def located_rows(self) -> np.ndarray:
+        """Rows of the stations having coordinates."""
+        return np.flatnonzero(~(np.isnan(self.lat) | np.isnan(self.lon)))
+
+
+def snapshot_path_for(data_path: Path) -> Path:
+    return data_path.with_suffix(".npz")
+
+
+def _file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _to_float(value: str) -> float:
+    return float(value) if value else float("nan")
@@ -1,8 +1,40 @@
 import re
+import unicodedata
 from datetime import datetime, timedelta
 from typing import Any
 
-import dateparser
+from ..core.cache import LRUCache
+from ..core.config import config
+from ..core.metrics import metrics
+from ..models.travel import TimeWindow
+
+WEEKDAYS = ["lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche"]
+
+MONTHS = [
+    "janvier", "fevrier", "mars", "avril", "mai", "juin",
+    "juillet", "aout", "septembre", "octobre", "novembre", "decembre",
+]
+
+NUMBERS = {
+    "un": 1, "une": 1, "deux": 2, "trois": 3, "quatre": 4, "cinq": 5,
+    "six": 6, "sept": 7, "huit": 8, "neuf": 9, "dix": 10,
+}
+
+_MISSING = object()
+
+_NUMBER = r"(\d{1,2}|" + "|".join(NUMBERS) + r")"
+_HOUR = r"(\d{1,2})\s*h(?:eures?)?\s*(\d{2})?"
+
+
+def _fold(text: str) -> str:
+    """Minuscules, sans accents ni ponctuation (comme le texte vu par le NER)."""
+    text = unicodedata.normalize("NFD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^a-z0-9]", " ", text).split())
+
+
+def _to_int(value: str) -> int:
+    return int(value) if value.isdigit() else NUMBERS[value]
 
 
 class TimeNormalizer:
@@ -13,82 +45,244 @@ class TimeNormalizer:
         'RELATIVE_BASE': None,
     }
 
+    # Moments de la journée: (début, fin) en (heure, minute), les plus longs d'abord
     VAGUE_EXPRESSIONS = {
-        "matin": {"hour": 8, "minute": 0},
-        "matinee": {"hour": 9, "minute": 0},
-        "midi": {"hour": 12, "minute": 0},
-        "apres midi": {"hour": 14, "minute": 0},
-        "soir": {"hour": 18, "minute": 0},
-        "soiree": {"hour": 19, "minute": 0},
-        "nuit": {"hour": 21, "minute": 0},
+        "fin de matinee": ((11, 0), (12, 0)),
+        "fin de journee": ((17, 0), (20, 0)),
+        "fin d apres midi": ((17, 0), (19, 0)),
+        "apres le dejeuner": ((14, 0), (16, 0)),
+        "avant le diner": ((17, 0), (19, 30)),
+        "avant midi": ((8, 0), (12, 0)),
+        "tot le matin": ((6, 0), (8, 0)),
+        "apres midi": ((14, 0), (18, 0)),
+        "matinee": ((9, 0), (12, 0)),
+        "matin": ((8, 0), (12, 0)),
+        "midi": ((12, 0), (14, 0)),
+        "soiree": ((19, 0), (23, 0)),
+        "soir": ((18, 0), (22, 0)),
+        "nuit": ((21, 0), (23, 59)),
     }
 
-    # Regex pour les heures simples françaises: "15h", "15h30", "8h45", "à 17h", etc.
-    SIMPLE_TIME_PATTERN = re.compile(
-        r'(?:a\s+)?(\d{1,2})\s*h\s*(\d{1,2})?',
-        re.IGNORECASE
+    # L'heure est celle de l'arrivée plutôt que du départ
+    ARRIVAL_PATTERN = re.compile(r"\b(?:pour )?(?:arriver|arrivee|arrive)\b")
+
+    # Départ immédiat: la référence elle-même
+    IMMEDIATE_EXPRESSIONS = ("tout de suite", "des que possible", "au plus tot", "maintenant", "immediatement")
+
+    # Mots qui n'apportent rien une fois le reste reconnu
+    FILLER_WORDS = {"a", "pour", "vers", "le", "la", "l", "ce", "cet", "cette", "en", "dans", "de", "d", "des", "du", "aujourd", "hui"}
+
+    RANGE_PATTERN = re.compile(rf"\bentre {_HOUR} et {_HOUR}")
+    # Regex pour les heures simples françaises: "15h", "15h30", "8h45", "à 17h", "10 heures"
+    SIMPLE_TIME_PATTERN = re.compile(rf"\b{_HOUR}")
+    IN_DAYS_PATTERN = re.compile(rf"\bdans {_NUMBER} (jours?|semaines?)\b")
+    DATE_PATTERN = re.compile(rf"\b(\d{{1,2}}|1er|premier) ({'|'.join(MONTHS)})(?: (\d{{4}}))?\b")
+    WEEKDAY_PATTERN = re.compile(rf"\b({'|'.join(WEEKDAYS)})( prochain)?\b")
+
+    _cache: LRUCache[tuple[str, datetime], TimeWindow | None] = LRUCache(
+        config.time_normalizer_cache_size, name="time_normalizer.cache"
     )
 
     @classmethod
-    def _parse_simple_time(cls, time_expression: str, reference: datetime) -> datetime | None:
-        """Parse les expressions d'heure simples comme '15h', '17h30', 'à 8h45'."""
-        match = cls.SIMPLE_TIME_PATTERN.search(time_expression)
-        if not match:
-            return None
-        
-        hour = int(match.group(1))
-        minute = int(match.group(2)) if match.group(2) else 0
-        
-        # Validation
-        if hour > 23 or minute > 59:
-            return None
-        
-        result_dt = reference.replace(
-            hour=hour,
-            minute=minute,
-            second=0,
-            microsecond=0
-        )
-        
-        # Si l'heure est passée, prendre le lendemain
-        if result_dt < reference:
-            result_dt += timedelta(days=1)
-        
-        return result_dt
+    def warm_up(cls) -> None:
+        """Charge les données de langue de dateparser, lentes au premier appel."""
+        import dateparser
+
+        dateparser.parse("le 15 mars", languages=['fr'])
 
     @classmethod
     def normalize(cls, time_expression: str, reference_date: datetime | None = None) -> str | None:
+        """Date/heure ISO du début d'une expression temporelle française."""
+        window = cls.normalize_window(time_expression, reference_date)
+        return window.start.isoformat() if window else None
+
+    @classmethod
+    def normalize_window(
+        cls, time_expression: str, reference_date: datetime | None = None
+    ) -> TimeWindow | None:
+        """
+        Intervalle désigné par une expression temporelle française.
+
+        Les résultats sont mis en cache par (expression, référence arrondie
+        à `time_normalizer_bucket_seconds`); la référence arrondie sert aussi
+        au calcul, pour que le cache ne change pas le résultat.
+        """
         if not time_expression:
             return None
 
-        reference = reference_date or datetime.now()
-        expression_lower = time_expression.lower().strip()
-        
-        # 1. D'abord essayer les expressions d'heure simples (15h, 17h30, etc.)
-        simple_parsed = cls._parse_simple_time(expression_lower, reference)
-        if simple_parsed:
-            return simple_parsed.isoformat()
-        
-        # 2. Ensuite les expressions vagues (matin, soir, etc.)
-        for vague_term, time_info in cls.VAGUE_EXPRESSIONS.items():
-            if vague_term in expression_lower:
-                result_dt = reference.replace(
-                    hour=time_info["hour"],
-                    minute=time_info["minute"],
-                    second=0,
-                    microsecond=0
-                )
-                if result_dt < reference:
-                    result_dt += timedelta(days=1)
-                return result_dt.isoformat()
-
-        # 3. Enfin utiliser dateparser pour les expressions complexes
+        reference = cls._bucket(reference_date or datetime.now())
+        key = (time_expression, reference)
+        cached = cls._cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        window = cls.parse_window(time_expression, reference)
+        if window is not None:
+            metrics.inc("time_normalizer.fast_path")
+        else:
+            metrics.inc("time_normalizer.dateparser")
+            window = cls._parse_with_dateparser(time_expression, reference)
+
+        cls._cache.set(key, window)
+        return window
+
+    @staticmethod
+    def _bucket(reference: datetime) -> datetime:
+        seconds = config.time_normalizer_bucket_seconds
+        timestamp = reference.timestamp()
+        return datetime.fromtimestamp(timestamp - timestamp % seconds)
+
+    @classmethod
+    def _parse_with_dateparser(cls, time_expression: str, reference: datetime) -> TimeWindow | None:
+        # Importé au premier repli : l'import seul prend plusieurs centaines de ms
+        import dateparser
+
         settings: dict[str, Any] = cls.DATEPARSER_SETTINGS.copy()
         settings['RELATIVE_BASE'] = reference
 
         parsed = dateparser.parse(time_expression, languages=['fr'], settings=settings)  # type: ignore
 
         if parsed:
-            return parsed.isoformat()
+            return TimeWindow(start=parsed)
 
         return None
+
+    @classmethod
+    def parse_window(cls, time_expression: str, reference: datetime) -> TimeWindow | None:
+        """
+        Grammaire rapide pour les expressions produites par le NER.
+
+        Retourne None si l'expression contient des mots non reconnus, auquel
+        cas `normalize_window` se rabat sur dateparser.
+        """
+        text = _fold(time_expression)
+        if not text:
+            return None
+
+        represents = "departure"
+        if match := cls.ARRIVAL_PATTERN.search(text):
+            represents, text = "arrival", text.replace(match.group(0), " ")
+
+        for immediate in cls.IMMEDIATE_EXPRESSIONS:
+            if immediate in text:
+                text = text.replace(immediate, " ")
+                return TimeWindow(start=reference, represents=represents) if cls._only_fillers(text) else None
+
+        day, day_end, weekly, text = cls._parse_day(text, reference)
+        hours, text = cls._parse_hours(text)
+        if not cls._only_fillers(text) or (day is None and hours is None):
+            return None
+
+        if hours is None:
+            # Un jour sans heure: toute la journée, à partir de maintenant si c'est aujourd'hui
+            assert day is not None and day_end is not None
+            return TimeWindow(start=max(day, reference), end=day_end, represents=represents)
+
+        (start_h, start_m), end_time = hours
+        base = day if day is not None else reference
+        start = base.replace(hour=start_h, minute=start_m, second=0, microsecond=0)
+        end = None
+        if end_time is not None:
+            end = base.replace(hour=end_time[0], minute=end_time[1], second=0, microsecond=0)
+
+        if start < reference:
+            if end is not None and end > reference:
+                # Déjà commencé: à partir de maintenant
+                start = reference
+            elif day is None or weekly:
+                # Si l'heure est passée, prendre le lendemain, ou la semaine suivante pour un jour de la semaine
+                shift = timedelta(days=7 if weekly else 1)
+                start += shift
+                end = end + shift if end is not None else None
+            else:
+                # Aujourd'hui ou une date explicite déjà passée: laisser dateparser trancher
+                return None
+        return TimeWindow(start=start, end=end, represents=represents)
+
+    @classmethod
+    def _parse_day(
+        cls, text: str, reference: datetime
+    ) -> tuple[datetime | None, datetime | None, bool, str]:
+        """
+        Reconnaît le jour: retourne (début, fin) du jour ou de la période, si c'est un jour
+        de la semaine (qui revient la semaine suivante) et le texte restant.
+        """
+        today = reference.replace(hour=0, minute=0, second=0, microsecond=0)
+        one_day = timedelta(days=1)
+
+        if "semaine prochaine" in text:
+            monday = today + timedelta(days=7 - today.weekday())
+            return monday, monday + timedelta(days=7), False, text.replace("semaine prochaine", " ")
+
+        if "week end" in text:
+            days_to_saturday = (5 - today.weekday()) % 7
+            next_one = "week end prochain" in text
+            if today.weekday() == 5 and next_one:
+                days_to_saturday = 7
+            elif today.weekday() == 6 and not next_one:
+                days_to_saturday = -1  # déjà dimanche: ce week-end a commencé hier
+            saturday = today + timedelta(days=days_to_saturday)
+            text = re.sub(r"\bweek end( prochain)?\b", " ", text)
+            return saturday, saturday + 2 * one_day, False, text
+
+        day, weekly = None, False
+        if "apres demain" in text:
+            day, text = today + 2 * one_day, text.replace("apres demain", " ")
+        elif "demain" in text:
+            day, text = today + one_day, text.replace("demain", " ")
+        elif "aujourd hui" in text:
+            day, text = today, text.replace("aujourd hui", " ")
+        elif match := cls.IN_DAYS_PATTERN.search(text):
+            days = _to_int(match.group(1)) * (7 if match.group(2).startswith("semaine") else 1)
+            day, text = today + timedelta(days=days), text.replace(match.group(0), " ")
+        elif match := cls.DATE_PATTERN.search(text):
+            day_of_month = 1 if not match.group(1).isdigit() else int(match.group(1))
+            month = MONTHS.index(match.group(2)) + 1
+            year = int(match.group(3)) if match.group(3) else today.year
+            try:
+                day = today.replace(year=year, month=month, day=day_of_month)
+            except ValueError:
+                return None, None, False, text
+            if match.group(3) is None and day < today:
+                day = day.replace(year=year + 1)
+            text = text.replace(match.group(0), " ")
+        elif match := cls.WEEKDAY_PATTERN.search(text):
+            days_ahead = (WEEKDAYS.index(match.group(1)) - today.weekday()) % 7
+            if match.group(2) and days_ahead == 0:
+                days_ahead = 7
+            day, text = today + timedelta(days=days_ahead), text.replace(match.group(0), " ")
+            weekly = True
+
+        return day, (day + one_day if day is not None else None), weekly, text
+
+    @classmethod
+    def _parse_hours(
+        cls, text: str
+    ) -> tuple[tuple[tuple[int, int], tuple[int, int] | None] | None, str]:
+        """Reconnaît l'heure: retourne ((h, m) de début, (h, m) de fin ou None) et le texte restant."""
+        if match := cls.RANGE_PATTERN.search(text):
+            start = (int(match.group(1)), int(match.group(2) or 0))
+            end = (int(match.group(3)), int(match.group(4) or 0))
+            if cls._valid(*start) and cls._valid(*end) and end > start:
+                return (start, end), text.replace(match.group(0), " ")
+            return None, text
+
+        if match := cls.SIMPLE_TIME_PATTERN.search(text):
+            start = (int(match.group(1)), int(match.group(2) or 0))
+            if cls._valid(*start):
+                return (start, None), text.replace(match.group(0), " ")
+            return None, text
+
+        for vague_term, (start, end) in cls.VAGUE_EXPRESSIONS.items():
+            if re.search(rf"\b{vague_term}\b", text):
+                return (start, end), text.replace(vague_term, " ")
+
+        return None, text
+
+    @staticmethod
+    def _valid(hour: int, minute: int) -> bool:
+        return hour <= 23 and minute <= 59
+
+    @classmethod
+    def _only_fillers(cls, text: str) -> bool:
+        return all(word in cls.FILLER_WORDS for word in text.split())
@@ -1,19 +1,43 @@
-import tempfile
-import os
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator
 
-from faster_whisper import WhisperModel
+import numpy as np
 
-from ..models.transcription import TranscriptionConfig, TranscriptionResponse
+from ..core.config import config as app_config
+from ..core.executors import inference_executor
+from ..models.transcription import (
+    TranscriptionConfig,
+    TranscriptionResponse,
+    TranscriptionSegment,
+    TranscriptionTimings,
+    WhisperModelName,
+)
+from .audio_preprocessing import PreparedAudio, prepare_audio
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
+logger = logging.getLogger(__name__)
+
+# Audio as uploaded (encoded bytes) or already decoded (16 kHz mono float32)
+Audio = bytes | np.ndarray
 
 
 class TranscriptionService:
     """Service for handling audio transcription using Whisper."""
 
     _instance: "TranscriptionService | None" = None
-    _model: WhisperModel | None = None
+    # Loaded models by tier, kept for the lifetime of the process
+    _models: dict[str, "WhisperModel"] = {}
+    _models_lock = threading.Lock()
 
     def __init__(self, config: TranscriptionConfig | None = None):
-        self._config = config or TranscriptionConfig()
+        self._config = config or TranscriptionConfig(model_name=app_config.whisper_model)
+        self._ready = False
 
     @classmethod
     def get_instance(cls, config: TranscriptionConfig | None = None) -> "TranscriptionService":
@@ -22,32 +46,172 @@ class TranscriptionService:
             cls._instance = cls(config)
         return cls._instance
 
-    def _get_model(self) -> WhisperModel:
-        """Load the Whisper model (lazy loading with caching)."""
-        if TranscriptionService._model is None:
-            TranscriptionService._model = WhisperModel(
-                self._config.model_name,
-                device=self._config.device,
-                compute_type=self._config.compute_type,
+    @property
+    def ready(self) -> bool:
+        """Whether the default model has been preloaded by `warm_up`, if preloading is on."""
+        return self._ready or not app_config.whisper_preload
+
+    def is_allowed(self, model_name: str) -> bool:
+        return model_name in (app_config.whisper_allowed_models or [app_config.whisper_model])
+
+    def _get_model(self, model_name: WhisperModelName | None = None) -> "WhisperModel":
+        """Load a Whisper model tier (lazy loading with caching)."""
+        from faster_whisper import WhisperModel
+
+        model_name = model_name or self._config.model_name
+        model = TranscriptionService._models.get(model_name)
+        if model is None:
+            with TranscriptionService._models_lock:
+                model = TranscriptionService._models.get(model_name)
+                if model is None:
+                    model = TranscriptionService._models[model_name] = WhisperModel(
+                        model_name,
+                        device=self._config.device,
+                        compute_type=self._config.compute_type,
+                    )
+        return model
+
+    async def warm_up(self) -> None:
+        """
+        Load the default model in every inference worker.
+
+        One load is submitted per worker (once in a shared inference server),
+        outside the pool's queue limit; workers spawn on demand and each
+        picks up one of them while the others are still loading. A failed
+        load (e.g. a download error) is retried with exponential backoff
+        until it succeeds, so a transient failure does not keep the service
+        unready for the life of the process.
+        """
+        delay = app_config.whisper_preload_retry_delay
+        while True:
+            try:
+                await inference_executor.warm_up(_load_in_worker, self._config)
+            except Exception:
+                logger.exception(
+                    "Could not preload Whisper model %s, retrying in %gs", self._config.model_name, delay
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, app_config.whisper_preload_retry_max_delay)
+            else:
+                self._ready = True
+                return
+
+    def prepare(self, audio: Audio) -> PreparedAudio:
+        """Decode to 16 kHz mono, trim silence and enforce the maximum duration."""
+        vad_options = None
+        if self._config.vad_trim:
+            from faster_whisper.vad import VadOptions
+
+            vad_options = VadOptions(
+                min_silence_duration_ms=self._config.vad_min_silence_ms,
+                speech_pad_ms=self._config.vad_speech_pad_ms,
             )
-        return TranscriptionService._model
+        return prepare_audio(
+            audio,
+            vad_options,
+            max_seconds=self._config.max_audio_seconds,
+            max_input_seconds=self._config.max_input_seconds,
+            truncate=self._config.truncate_long_audio,
+        )
+
+    def _decode(
+        self, samples: np.ndarray, model_name: WhisperModelName | None
+    ) -> Iterator[TranscriptionSegment]:
+        if samples.size == 0:
+            return
+        segments, _ = self._get_model(model_name).transcribe(
+            samples,
+            language=self._config.language,
+            beam_size=self._config.beam_size,
+            initial_prompt=self._config.initial_prompt,
+        )
+        for segment in segments:
+            yield TranscriptionSegment(start=segment.start, end=segment.end, text=segment.text.strip())
+
+    def transcribe_segments(
+        self, audio: Audio, model_name: WhisperModelName | None = None
+    ) -> Iterator[TranscriptionSegment]:
+        """Yield segments as Whisper decodes them, reading the audio from memory."""
+        yield from self._decode(self.prepare(audio).samples, model_name)
+
+    def transcribe(
+        self, audio: Audio, model_name: WhisperModelName | None = None
+    ) -> TranscriptionResponse:
+        """Transcribe audio to text."""
+        prepared = self.prepare(audio)
 
-    def transcribe(self, audio_bytes: bytes) -> TranscriptionResponse:
-        """Transcribe audio bytes to text."""
-        model = self._get_model()
+        start = time.perf_counter()
+        text = " ".join(segment.text for segment in self._decode(prepared.samples, model_name))
+        transcribe_ms = (time.perf_counter() - start) * 1000
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-            tmp_file.write(audio_bytes)
-            tmp_path = tmp_file.name
+        return TranscriptionResponse(
+            text=text.strip(),
+            audio_seconds=prepared.audio_seconds,
+            speech_seconds=prepared.speech_seconds,
+            truncated=prepared.truncated,
+            timings=TranscriptionTimings(
+                decode_ms=prepared.decode_ms,
+                vad_ms=prepared.vad_ms,
+                transcribe_ms=transcribe_ms,
+            ),
+        )
 
+    async def transcribe_async(
+        self, audio: Audio, model_name: WhisperModelName | None = None
+    ) -> TranscriptionResponse:
+        """Transcribe audio on the inference pool, off the event loop."""
+        return await inference_executor.run(_transcribe_in_worker, self._config, audio, model_name)
+
+    def transcribe_stream(
+        self, audio: Audio, model_name: WhisperModelName | None = None
+    ) -> AsyncIterator[TranscriptionSegment]:
+        """
+        Stream segments from the inference pool as they are decoded.
+
+        The work is scheduled immediately, so a saturated pool raises here
+        rather than once the stream is being consumed.
+        """
+        segments = inference_executor.new_queue()
+        done = inference_executor.submit(
+            _stream_in_worker, self._config, audio, model_name, segments
+        )
+        return _drain(segments, done)
+
+
+async def _drain(segments: Any, done: asyncio.Future) -> AsyncIterator[TranscriptionSegment]:
+    while True:
         try:
-            segments, _ = model.transcribe(
-                tmp_path,
-                language=self._config.language,
-                beam_size=self._config.beam_size,
-                initial_prompt=self._config.initial_prompt,
-            )
-            text = " ".join([segment.text for segment in segments])
-            return TranscriptionResponse(text=text.strip())
-        finally:
-            os.unlink(tmp_path)
+            segment = await asyncio.to_thread(segments.get, timeout=0.5)
+        except queue.Empty:
+            if done.done():
+                # The worker died before its end marker; surface its error
+                done.result()
+                return
+            continue
+        if segment is None:
+            break
+        yield segment
+    await done
+
+
+# The functions below run in inference workers, which load and keep their own models
+
+def _load_in_worker(config: TranscriptionConfig) -> None:
+    TranscriptionService.get_instance(config)._get_model()
+
+
+def _transcribe_in_worker(
+    config: TranscriptionConfig, audio: Audio, model_name: WhisperModelName | None
+) -> TranscriptionResponse:
+    return TranscriptionService.get_instance(config).transcribe(audio, model_name)
+
+
+def _stream_in_worker(
+    config: TranscriptionConfig, audio: Audio, model_name: WhisperModelName | None, segments: Any
+) -> None:
+    try:
+        service = TranscriptionService.get_instance(config)
+        for segment in service.transcribe_segments(audio, model_name):
+            segments.put(segment)
+    finally:
+        segments.put(None)
@@ -1,12 +1,22 @@
-import spacy
-from spacy.language import Language
+import logging
 import unicodedata
 import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
 
-from ..models.travel import TravelOrderResponse, TravelServiceConfig
+from ..core.config import config as app_config
+from ..core.executors import cpu_executor
+from ..models.travel import TravelEntities, TravelOrderResponse, TravelServiceConfig
 from .time_normalizer import TimeNormalizer
 from .station_matcher import StationMatcher
 from .geolocation import GeoLocationService
+from .micro_batcher import MicroBatcher
+from .compact_tagger import CompactTagger
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+logger = logging.getLogger(__name__)
 
 
 def normalize_text(text: str) -> str:
@@ -17,14 +27,56 @@ def normalize_text(text: str) -> str:
     return re.sub(r'\s+', ' ', text).strip()
 
 
+def _listener_upstreams(component: Any) -> Iterable[str]:
+    if isinstance(component, dict):
+        if "Listener" in str(component.get("@architectures", "")):
+            yield component.get("upstream", "*")
+        for value in component.values():
+            yield from _listener_upstreams(value)
+
+
+def inference_exclude(model_path: str, keep: Iterable[str] = ("ner",)) -> list[str]:
+    """
+    Components of the pipeline at `model_path` that `keep` does not need.
+
+    Read from the pipeline's config: the shared tok2vec (or transformer) a
+    kept component listens to is needed, everything else can be excluded.
+    """
+    from spacy.util import load_config
+
+    model_config = load_config(Path(model_path) / "config.cfg")
+    components = model_config["components"]
+    needed = set(keep)
+    for name in keep:
+        for upstream in _listener_upstreams(components[name]):
+            if upstream == "*":
+                needed |= {
+                    other for other, component in components.items()
+                    if component.get("factory") in ("tok2vec", "transformer")
+                }
+            else:
+                needed.add(upstream)
+    return [name for name in model_config["nlp"]["pipeline"] if name not in needed]
+
+
 class TravelService:
     _instance: "TravelService | None" = None
-    _model: Language | None = None
+    _model: "Language | None" = None
+    _tagger: CompactTagger | None = None
 
     def __init__(self, config: TravelServiceConfig | None = None):
         self._config = config or TravelServiceConfig()
         self._station_matcher = StationMatcher.get_instance()
         self._geolocation = GeoLocationService.get_instance()
+        self._batcher: MicroBatcher[str, TravelEntities] = MicroBatcher(
+            self.extract_entities,
+            max_batch_size=self._config.micro_batch_size,
+            max_wait_ms=self._config.micro_batch_wait_ms,
+            name="ner",
+            executor=cpu_executor,
+            max_pending=self._config.micro_batch_max_pending,
+            retry_after=app_config.cpu_pool_retry_after,
+        )
 
     @classmethod
     def get_instance(cls, config: TravelServiceConfig | None = None) -> "TravelService":
@@ -32,9 +84,31 @@ class TravelService:
             cls._instance = cls(config)
         return cls._instance
 
-    def _get_model(self) -> Language:
+    def warm_up(self) -> None:
+        """Load the model of the configured NER backend."""
+        if self._config.backend == "compact":
+            self._get_tagger()
+        else:
+            self._get_model()
+
+    def _get_tagger(self) -> CompactTagger:
+        if TravelService._tagger is None:
+            TravelService._tagger = CompactTagger.load(self._config.tagger_path)
+        return TravelService._tagger
+
+    def _get_model(self) -> "Language":
         if TravelService._model is None:
-            TravelService._model = spacy.load(self._config.model_path)
+            # Imported with the model: spaCy alone takes a noticeable time to import
+            import spacy
+
+            path = self._config.model_path
+            if not Path(path).exists():
+                logger.warning(
+                    "%s not found (run `uv run poe export-ner`), serving %s",
+                    path, self._config.fallback_model_path,
+                )
+                path = self._config.fallback_model_path
+            TravelService._model = spacy.load(path, exclude=inference_exclude(path))
         return TravelService._model
 
     def _match_station_id(self, text: str | None) -> int | None:
@@ -46,34 +120,84 @@ class TravelService:
     def _get_nearest_station_id(self, coords: tuple[float, float]) -> int | None:
         return self._geolocation.find_nearest_station_id(*coords)
 
-    def identify_travel_order(
-        self, text: str, coords: tuple[float, float] | None = None
+    def _entities(self, spans: Iterable[tuple[str, str]]) -> TravelEntities:
+        """Entities from (label, text) pairs, the last one of each label winning."""
+        entities = TravelEntities()
+        for label, text in spans:
+            if label == "DEPARTURE":
+                entities.departure = text
+            elif label == "DESTINATION":
+                entities.destination = text
+            elif label == "TIME":
+                entities.time = text
+        return entities
+
+    def _extract(
+        self, texts: Iterable[str], batch_size: int, n_process: int = 1
+    ) -> list[TravelEntities]:
+        normalized = (normalize_text(text) for text in texts)
+        if self._config.backend == "compact":
+            tagger = self._get_tagger()
+            return [
+                self._entities((label, text[start:end]) for label, start, end in tagger.tag(text))
+                for text in normalized
+            ]
+        docs = self._get_model().pipe(normalized, batch_size=batch_size, n_process=n_process)
+        return [self._entities((ent.label_, ent.text) for ent in doc.ents) for doc in docs]
+
+    def resolve_entities(
+        self, entities: TravelEntities, coords: tuple[float, float] | None = None
     ) -> TravelOrderResponse:
-        doc = self._get_model()(normalize_text(text))
-
-        raw_departure: str | None = None
-        raw_destination: str | None = None
-        datetime_iso: str | None = None
-
-        for ent in doc.ents:
-            if ent.label_ == "DEPARTURE":
-                raw_departure = ent.text
-            elif ent.label_ == "DESTINATION":
-                raw_destination = ent.text
-            elif ent.label_ == "TIME":
-                print("raw time", ent.text)
-                print("normalized time", TimeNormalizer.normalize(ent.text))
-                print("end time normalize")
-                datetime_iso = TimeNormalizer.normalize(ent.text)
-
-        departure_id = self._match_station_id(raw_departure)
+        """Match stations and normalize the time of extracted entities."""
+        departure_id = self._match_station_id(entities.departure)
         
         # Fallback: use geolocation if no departure found
         if departure_id is None and coords:
             departure_id = self._get_nearest_station_id(coords)
 
+        window = TimeNormalizer.normalize_window(entities.time) if entities.time else None
         return TravelOrderResponse(
             departure_id=departure_id,
-            destination_id=self._match_station_id(raw_destination),
-            datetime_iso=datetime_iso,
+            destination_id=self._match_station_id(entities.destination),
+            **(window.response_fields() if window else {}),
+        )
+
+    def identify_travel_order(
+        self, text: str, coords: tuple[float, float] | None = None
+    ) -> TravelOrderResponse:
+        return self.resolve_entities(self._extract([text], batch_size=1)[0], coords)
+
+    def identify_travel_orders(
+        self,
+        texts: list[str],
+        coords: list[tuple[float, float] | None] | None = None,
+        batch_size: int | None = None,
+        n_process: int | None = None,
+    ) -> list[TravelOrderResponse]:
+        """Identify several travel orders at once (through `nlp.pipe` with spaCy)."""
+        if coords is None:
+            coords = [None] * len(texts)
+        if len(coords) != len(texts):
+            raise ValueError("texts and coords must have the same length")
+
+        entities = self._extract(
+            texts,
+            batch_size=batch_size or self._config.batch_size,
+            n_process=n_process or self._config.n_process,
         )
+        return [self.resolve_entities(e, c) for e, c in zip(entities, coords)]
+
+    def extract_entities(self, texts: list[str]) -> list[TravelEntities]:
+        """Run only the NER model over `texts`."""
+        return self._extract(texts, batch_size=self._config.batch_size)
+
+    async def extract_entities_async(self, text: str) -> TravelEntities:
+        """Extract entities, sharing NER work with concurrent requests."""
+        return await self._batcher.submit(text)
+
+    async def identify_travel_order_async(
+        self, text: str, coords: tuple[float, float] | None = None
+    ) -> TravelOrderResponse:
+        """Identify a travel order, sharing NER work with concurrent requests."""
+        entities = await self.extract_entities_async(text)
+        return await cpu_executor.run(self.resolve_entities, entities, coords)
@@ -0,0 +1,86 @@
+"""
+Load test: /journeys latency while transcriptions are running.
+
+Measures /journeys latency on an idle server, then again while `--transcriptions`
+concurrent uploads keep the inference pool busy. With transcription running
+off the event loop, both distributions should be close. Transcriptions
+rejected with 503 (pool saturated) are counted separately.
+
+Start the API first (`uv run poe api`), then from the project root:
+    uv run python -m backend.benchmarks.journeys_under_transcription_load \\
+        --url http://localhost:8000 --transcriptions 4 --requests 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from pathlib import Path
+
+import httpx
+
+DEFAULT_AUDIO = "base/data/raw/audio_travel_order/Fenouillet_Uzer_soir.wav"
+JOURNEY_PARAMS = {"departure_id": 3, "destination_id": 42}
+
+
+async def journeys_latencies(client: httpx.AsyncClient, n: int, interval: float) -> list[float]:
+    latencies = []
+    for i in range(n):
+        # A distinct datetime per request so the journey cache is not measured
+        params = {**JOURNEY_PARAMS, "datetime_iso": f"2026-01-{i % 28 + 1:02d}T{i % 24:02d}:00:00"}
+        start = time.perf_counter()
+        await client.get("/api/v1/journeys", params=params)
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def keep_transcribing(client: httpx.AsyncClient, audio: bytes, stop: asyncio.Event, counts: dict) -> None:
+    while not stop.is_set():
+        response = await client.post(
+            "/api/v1/transcribe", files={"file": ("audio.wav", audio, "audio/wav")}
+        )
+        counts[response.status_code] = counts.get(response.status_code, 0) + 1
+        if response.status_code == 503:
+            await asyncio.sleep(float(response.headers.get("retry-after", 1)))
+
+
+def summarize(label: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    print(f"  {label:<22} p50 {statistics.median(latencies):8.1f} ms   p95 {p95:8.1f} ms   max {latencies[-1]:8.1f} ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--audio", default=DEFAULT_AUDIO)
+    parser.add_argument("--transcriptions", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.05)
+    args = parser.parse_args()
+
+    audio = Path(args.audio).read_bytes()
+
+    async with httpx.AsyncClient(base_url=args.url, timeout=300) as client:
+        idle = await journeys_latencies(client, args.requests, args.interval)
+
+        stop = asyncio.Event()
+        counts: dict[int, int] = {}
+        workers = [
+            asyncio.create_task(keep_transcribing(client, audio, stop, counts))
+            for _ in range(args.transcriptions)
+        ]
+        await asyncio.sleep(1)  # let the transcriptions reach the pool
+        loaded = await journeys_latencies(client, args.requests, args.interval)
+        stop.set()
+        await asyncio.gather(*workers)
+
+    print("/journeys latency")
+    summarize("idle", idle)
+    summarize(f"{args.transcriptions} transcribing", loaded)
+    print(f"transcription responses by status: {counts}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+"""
+Microbenchmark: parsing a Navitia journeys payload into the /journeys response.
+
+Compares the validated path (models built with validation, then re-validated
+and encoded by FastAPI's response_model) with the fast path (model_construct
+and a single pydantic-core JSON serialization).
+
+Without arguments it parses the synthetic payload written by
+backend.scripts.build_navitia_fixture; pass recorded Navitia responses to
+measure real ones.
+
+Usage (from the project root):
+    uv run python -m backend.benchmarks.navitia_parsing [payload.json ...] --n 2000
+"""
+
+import argparse
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+
+from backend.app.models.journey import Journey, JourneySearchResponse
+from backend.app.services.navitia_service import NavitiaService
+
+DEFAULT_PAYLOADS = ["backend/tests/fixtures/navitia_journeys_synthetic.json"]
+
+
+def validated_path(service: NavitiaService, payload: dict) -> bytes:
+    journeys = [
+        Journey.model_validate(service._parse_journey(j).model_dump())
+        for j in payload.get("journeys", [])
+    ]
+    response = JourneySearchResponse(journeys=journeys)
+    # What FastAPI does with response_model on a returned model
+    revalidated = JourneySearchResponse.model_validate(response.model_dump())
+    return json.dumps(jsonable_encoder(revalidated)).encode()
+
+
+def fast_path(service: NavitiaService, payload: dict) -> bytes:
+    journeys = [service._parse_journey(j) for j in payload.get("journeys", [])]
+    response = JourneySearchResponse.model_construct(journeys=journeys, error=None)
+    return response.model_dump_json().encode()
+
+
+def bench(fn, service: NavitiaService, payload: dict, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn(service, payload)
+    return (time.perf_counter() - start) / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("payloads", nargs="*", default=DEFAULT_PAYLOADS)
+    parser.add_argument("--n", type=int, default=2000)
+    args = parser.parse_args()
+
+    service = NavitiaService()
+
+    for path in args.payloads:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+
+        assert json.loads(validated_path(service, payload)) == json.loads(fast_path(service, payload))
+
+        n_journeys = len(payload.get("journeys", []))
+        slow = bench(validated_path, service, payload, args.n)
+        fast = bench(fast_path, service, payload, args.n)
+        print(f"{path} ({n_journeys} journeys)")
+        print(f"  validated: {slow * 1e6:9.1f} us/response")
+        print(f"  fast:      {fast * 1e6:9.1f} us/response  ({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Accuracy and latency of the two NER backends on the held-out split.
+
+Scores the spaCy model (`model_path`, loaded as TravelService loads it) and
+the compact tagger (`tagger_path`) on the examples base/src/training.py
+keeps out of the tagger's training (same `--test-size` and `--seed`):
+exact-match entity precision/recall/F1, per-doc latency and batch
+throughput. custom-models-ner.py trains the spaCy model on the same train
+split, so neither backend has seen the held-out examples.
+
+Train the tagger first (`uv run poe train-tagger`), then from the project root:
+    uv run python -m backend.benchmarks.ner_backends
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+from typing import Callable
+
+from backend.app.models.travel import TravelServiceConfig
+from backend.app.services.compact_tagger import CompactTagger, Span
+from backend.app.services.travel_service import inference_exclude
+from base.src.training import entity_scores, gold_spans, load_split
+
+
+def load_spacy(config: TravelServiceConfig) -> Callable[[list[str]], list[set[Span]]]:
+    import spacy
+
+    nlp = spacy.load(config.model_path, exclude=inference_exclude(config.model_path))
+
+    def tag(texts: list[str]) -> list[set[Span]]:
+        return [
+            {(ent.label_, ent.start_char, ent.end_char) for ent in doc.ents}
+            for doc in nlp.pipe(texts, batch_size=config.batch_size)
+        ]
+
+    return tag
+
+
+def load_compact(config: TravelServiceConfig) -> Callable[[list[str]], list[set[Span]]]:
+    tagger = CompactTagger.load(config.tagger_path)
+    return lambda texts: [set(tagger.tag(text)) for text in texts]
+
+
+def size_mb(path: str) -> float:
+    root = Path(path)
+    files = [root] if root.is_file() else [f for f in root.rglob("*") if f.is_file()]
+    return sum(f.stat().st_size for f in files) / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-path", default=TravelServiceConfig().model_path)
+    parser.add_argument("--tagger-path", default=TravelServiceConfig().tagger_path)
+    parser.add_argument("--test-size", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the held-out split")
+    args = parser.parse_args()
+
+    config = TravelServiceConfig(model_path=args.model_path, tagger_path=args.tagger_path)
+    _, test_set = load_split(args.test_size, args.seed)
+    texts = [text for text, _ in test_set]
+    gold = [gold_spans(annotations) for _, annotations in test_set]
+
+    backends = {
+        "spacy": (load_spacy, args.model_path),
+        "compact": (load_compact, args.tagger_path),
+    }
+    print(f"{len(texts)} held-out examples")
+    print(f"{'':<8} {'load s':>7} {'size MB':>8} {'P':>7} {'R':>7} {'F1':>7} {'p50 ms':>8} {'p95 ms':>8} {'docs/s':>8}")
+    for name, (load, path) in backends.items():
+        start = time.perf_counter()
+        tag = load(config)
+        load_seconds = time.perf_counter() - start
+        scores = entity_scores(gold, tag(texts))
+
+        latencies = []
+        for _ in range(args.repeat):
+            for text in texts:
+                start = time.perf_counter()
+                tag([text])
+                latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            tag(texts)
+        throughput = args.repeat * len(texts) / (time.perf_counter() - start)
+
+        print(
+            f"{name:<8} {load_seconds:7.2f} {size_mb(path):8.2f}"
+            f" {scores['precision']:7.4f} {scores['recall']:7.4f} {scores['f1']:7.4f}"
+            f" {statistics.median(latencies):8.3f} {latencies[int(0.95 * (len(latencies) - 1))]:8.3f}"
+            f" {throughput:8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Full trained NER pipeline vs. the exported inference pipeline.
+
+Each variant is measured in a fresh process: load time, size on disk, RSS
+added by loading, per-doc latency (`nlp(text)` over the dataset) and entity
+F1 against the dataset annotations. The inference pipeline is loaded the way
+TravelService loads it, excluding what `inference_exclude` finds unneeded.
+
+Export the inference pipeline first (`uv run poe export-ner`), then from the
+project root:
+    uv run python -m backend.benchmarks.ner_pipeline_trim
+"""
+
+import argparse
+import json
+import multiprocessing
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from backend.app.models.travel import TravelServiceConfig
+from backend.app.services.travel_service import inference_exclude
+
+DATASET_PATH = "base/data/processed/travel-order-dataset.json"
+FULL_MODEL_PATH = "base/models/travel-order-ner-model"
+
+
+def rss_mb() -> float:
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def measure(model_path: str, exclude: list[str], repeat: int) -> dict:
+    import spacy
+    from spacy.training import Example
+
+    with open(DATASET_PATH, encoding="utf-8") as f:
+        dataset = json.load(f)
+
+    before = rss_mb()
+    start = time.perf_counter()
+    nlp = spacy.load(model_path, exclude=exclude)
+    load_seconds = time.perf_counter() - start
+    nlp(dataset[0][0])  # first call allocates the model's work buffers
+    rss = rss_mb() - before
+
+    latencies = []
+    for _ in range(repeat):
+        for text, _ in dataset:
+            start = time.perf_counter()
+            nlp(text)
+            latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+
+    examples = [Example.from_dict(nlp.make_doc(text), annotations) for text, annotations in dataset]
+    return {
+        "pipeline": list(nlp.pipe_names),
+        "load_s": load_seconds,
+        "disk_mb": sum(f.stat().st_size for f in Path(model_path).rglob("*") if f.is_file()) / 2**20,
+        "rss_mb": rss,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(0.95 * (len(latencies) - 1))],
+        "ents_f": nlp.evaluate(examples)["ents_f"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--full-model", default=FULL_MODEL_PATH)
+    parser.add_argument("--inference-model", default=TravelServiceConfig().model_path)
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the dataset")
+    args = parser.parse_args()
+
+    variants = {
+        "full": (args.full_model, []),
+        "inference": (args.inference_model, inference_exclude(args.inference_model)),
+    }
+    results = {}
+    for label, (path, exclude) in variants.items():
+        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results[label] = pool.submit(measure, path, exclude, args.repeat).result()
+
+    for label, r in results.items():
+        print(f"{label}: {', '.join(r['pipeline'])}")
+    print(f"{'':<10} {'load s':>8} {'disk MB':>8} {'RSS MB':>8} {'p50 ms':>8} {'p95 ms':>8} {'ents F1':>8}")
+    for label, r in results.items():
+        print(
+            f"{label:<10} {r['load_s']:8.2f} {r['disk_mb']:8.1f} {r['rss_mb']:8.1f}"
+            f" {r['p50_ms']:8.2f} {r['p95_ms']:8.2f} {r['ents_f']:8.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Throughput benchmark: single-text NER path vs. batched `nlp.pipe` path.
+
+Usage (from the project root):
+    uv run python -m backend.benchmarks.ner_throughput --n 2000 --batch-sizes 16 64 256
+"""
+
+import argparse
+import json
+import time
+
+from backend.app.models.travel import TravelServiceConfig
+from backend.app.services.travel_service import TravelService
+
+DATASET_PATH = "base/data/processed/travel-order-dataset.json"
+
+
+def load_texts(n: int) -> list[str]:
+    with open(DATASET_PATH, encoding="utf-8") as f:
+        dataset = json.load(f)
+    texts = [text for text, _ in dataset]
+    return (texts * (n // len(texts) + 1))[:n]
+
+
+def bench_single(service: TravelService, texts: list[str]) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        service.identify_travel_order(text)
+    return time.perf_counter() - start
+
+
+def bench_batch(
+    service: TravelService, texts: list[str], batch_size: int, n_process: int
+) -> float:
+    start = time.perf_counter()
+    service.identify_travel_orders(texts, batch_size=batch_size, n_process=n_process)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=1000, help="Number of texts")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--n-process", type=int, default=1)
+    parser.add_argument("--model-path", default=TravelServiceConfig().model_path)
+    args = parser.parse_args()
+
+    service = TravelService.get_instance(TravelServiceConfig(model_path=args.model_path))
+    texts = load_texts(args.n)
+
+    # Warm up model loading and the station/time caches
+    service.identify_travel_orders(texts[:32])
+
+    elapsed = bench_single(service, texts)
+    print(f"{'single':<24} {elapsed:8.2f}s {len(texts) / elapsed:10.1f} docs/s")
+
+    for batch_size in args.batch_sizes:
+        elapsed = bench_batch(service, texts, batch_size, args.n_process)
+        label = f"pipe bs={batch_size} np={args.n_process}"
+        print(f"{label:<24} {elapsed:8.2f}s {len(texts) / elapsed:10.1f} docs/s")
+
+
+if __name__ == "__main__":
+    main()
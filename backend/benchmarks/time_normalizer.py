@@ -0,0 +1,75 @@
+"""
+Benchmark: TimeNormalizer over the dataset's TIME entities.
+
+Reports the share of expressions handled by the fast-path grammar, the
+latency of the grammar vs. dateparser on each expression, and the cache
+hit rate and latency when the same stream of expressions is normalized
+within one reference bucket.
+
+Usage (from the project root):
+    uv run python -m backend.benchmarks.time_normalizer --repeat 200
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+
+from backend.app.services.time_normalizer import TimeNormalizer
+
+DATASET_PATH = "base/data/processed/travel-order-dataset.json"
+
+
+def load_expressions() -> list[str]:
+    with open(DATASET_PATH, encoding="utf-8") as f:
+        dataset = json.load(f)
+    return [
+        text[start:end]
+        for text, annotations in dataset
+        for start, end, label in annotations["entities"]
+        if label == "TIME"
+    ]
+
+
+def per_call_us(fn, expressions: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for expression in expressions:
+            fn(expression)
+    return (time.perf_counter() - start) / (repeat * len(expressions)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    expressions = load_expressions()
+    unique = sorted(set(expressions))
+    reference = datetime.now().replace(second=0, microsecond=0)
+
+    start = time.perf_counter()
+    TimeNormalizer.warm_up()
+    print(f"dateparser warm-up: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    fast = [e for e in unique if TimeNormalizer.parse_window(e, reference) is not None]
+    covered = sum(e in fast for e in expressions) / len(expressions)
+    print(f"{len(expressions)} TIME entities, {len(unique)} distinct")
+    print(f"fast-path coverage: {len(fast)}/{len(unique)} distinct, {covered:.1%} of entities")
+
+    grammar = per_call_us(lambda e: TimeNormalizer.parse_window(e, reference), unique, args.repeat)
+    dateparser_us = per_call_us(
+        lambda e: TimeNormalizer._parse_with_dateparser(e, reference), unique, max(args.repeat // 20, 1)
+    )
+    print(f"grammar:    {grammar:9.1f} us/expression")
+    print(f"dateparser: {dateparser_us:9.1f} us/expression ({dateparser_us / grammar:.0f}x)")
+
+    TimeNormalizer._cache.clear()
+    hits, misses = TimeNormalizer._cache.hits, TimeNormalizer._cache.misses
+    cached = per_call_us(lambda e: TimeNormalizer.normalize(e, reference), expressions, 1)
+    hits, misses = TimeNormalizer._cache.hits - hits, TimeNormalizer._cache.misses - misses
+    print(f"normalize (cache, one bucket): {cached:9.1f} us/expression, hit rate {hits / (hits + misses):.1%}")
+
+
+if __name__ == "__main__":
+    main()
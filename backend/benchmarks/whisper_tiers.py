@@ -0,0 +1,101 @@
+"""
+Benchmark Whisper model tiers on the recorded travel orders.
+
+For each tier, reports the load time, the real-time factor (decoding time /
+audio duration, lower is faster) and the word error rate. References come
+from a JSON file mapping wav file names to their transcripts when given;
+otherwise the words of the file name (`Fenouillet_Uzer_soir.wav` ->
+"fenouillet uzer soir") are used and the keyword recall is reported instead,
+which is what matters for station matching.
+
+Usage (from the project root):
+    uv run python -m backend.benchmarks.whisper_tiers --tiers tiny base small
+    uv run python -m backend.benchmarks.whisper_tiers --references refs.json
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import get_args
+
+from faster_whisper import decode_audio
+
+from backend.app.models.transcription import TranscriptionConfig, WhisperModelName
+from backend.app.services.transcription_service import TranscriptionService
+from backend.app.services.travel_service import normalize_text
+
+AUDIO_DIR = "base/data/raw/audio_travel_order"
+SAMPLE_RATE = 16000
+
+
+def word_error_rate(reference: list[str], hypothesis: list[str]) -> float:
+    """Word-level Levenshtein distance divided by the reference length."""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_word in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hypothesis, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            ))
+        previous = current
+    return previous[-1] / max(len(reference), 1)
+
+
+def keyword_recall(keywords: list[str], hypothesis: list[str]) -> float:
+    found = set(hypothesis)
+    return sum(word in found for word in keywords) / max(len(keywords), 1)
+
+
+def filename_keywords(path: Path) -> list[str]:
+    return normalize_text(path.stem.replace("_", " ").replace("-", " ")).split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tiers", nargs="+", default=list(get_args(WhisperModelName)))
+    parser.add_argument("--audio-dir", default=AUDIO_DIR)
+    parser.add_argument("--references", help="JSON file: {wav file name: transcript}")
+    args = parser.parse_args()
+
+    files = sorted(Path(args.audio_dir).glob("*.wav"))
+    references = {}
+    if args.references:
+        with open(args.references, encoding="utf-8") as f:
+            references = json.load(f)
+        files = [path for path in files if path.name in references]
+
+    audio = {path: decode_audio(str(path), sampling_rate=SAMPLE_RATE) for path in files}
+    total_seconds = sum(len(samples) for samples in audio.values()) / SAMPLE_RATE
+    print(f"{len(files)} files, {total_seconds:.1f}s of audio")
+
+    for tier in args.tiers:
+        service = TranscriptionService(TranscriptionConfig(model_name=tier))
+        start = time.perf_counter()
+        service._get_model()
+        load_seconds = time.perf_counter() - start
+
+        decode_seconds = 0.0
+        scores = []
+        for path, samples in audio.items():
+            start = time.perf_counter()
+            text = service.transcribe(samples).text
+            decode_seconds += time.perf_counter() - start
+
+            hypothesis = normalize_text(text).split()
+            if references:
+                scores.append(word_error_rate(normalize_text(references[path.name]).split(), hypothesis))
+            else:
+                scores.append(keyword_recall(filename_keywords(path), hypothesis))
+
+        metric = "WER" if references else "keyword recall"
+        print(
+            f"{tier:<9} load {load_seconds:6.1f}s   RTF {decode_seconds / total_seconds:6.3f}   "
+            f"{metric} {sum(scores) / len(scores):6.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
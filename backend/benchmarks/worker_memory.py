@@ -0,0 +1,119 @@
+"""
+Memory of the multi-process serving profile: 1 worker vs N workers.
+
+Starts the gunicorn profile (`gunicorn.conf.py`) with `SERVING_WORKERS=1`,
+then with `--workers`, waits for /api/v1/health and reports each process'
+RSS and PSS (Linux only, read from /proc). RSS counts pages shared
+copy-on-write with the master in every process; PSS splits them between the
+processes sharing them, so the PSS total is what the host actually spends.
+With the model preloaded in the master, the PSS total should grow by much
+less than one single-worker footprint per extra worker.
+
+From the project root:
+    uv run python -m backend.benchmarks.worker_memory --workers 4
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import time
+from pathlib import Path
+
+import httpx
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def children(pid: int) -> list[int]:
+    found = []
+    for stat in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            # The command name (2nd field) may contain spaces: split after it
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == pid:
+            found.append(int(stat.parent.name))
+    return found
+
+
+def memory_kb(pid: int) -> tuple[int, int]:
+    """(RSS, PSS) of `pid`, in kB."""
+    rollup = Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()
+    values = {line.split(":")[0]: int(line.split()[1]) for line in rollup[1:]}
+    return values["Rss"], values["Pss"]
+
+
+def describe(pid: int) -> str:
+    cmdline = Path(f"/proc/{pid}/cmdline").read_bytes().replace(b"\0", b" ").decode()
+    if "resource_tracker" in cmdline:
+        return "resource tracker"
+    if "multiprocessing" in cmdline:
+        return "inference server"
+    return "worker"
+
+
+def wait_ready(url: str, process: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with {process.returncode}")
+        try:
+            if httpx.get(f"{url}/api/v1/health", timeout=1).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.5)
+    raise TimeoutError(f"{url} not ready after {timeout:.0f}s")
+
+
+def measure(workers: int, timeout: float, settle: float) -> list[tuple[str, int, int, int]]:
+    port = free_port()
+    env = {**os.environ, "SERVING_BIND": f"127.0.0.1:{port}", "SERVING_WORKERS": str(workers)}
+    process = subprocess.Popen(
+        ["gunicorn"], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_ready(f"http://127.0.0.1:{port}", process, timeout)
+        # Let every worker finish its startup (warm-ups, first requests)
+        time.sleep(settle)
+        rows = [("master", process.pid, *memory_kb(process.pid))]
+        for pid in sorted(children(process.pid)):
+            rows.append((describe(pid), pid, *memory_kb(pid)))
+        return rows
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def report(workers: int, rows: list[tuple[str, int, int, int]]) -> int:
+    print(f"{workers} worker(s)")
+    for role, pid, rss, pss in rows:
+        print(f"  {role:<18} {pid:>8}   RSS {rss / 1024:8.1f} MB   PSS {pss / 1024:8.1f} MB")
+    total_rss = sum(row[2] for row in rows)
+    total_pss = sum(row[3] for row in rows)
+    print(f"  {'total':<18} {'':>8}   RSS {total_rss / 1024:8.1f} MB   PSS {total_pss / 1024:8.1f} MB")
+    return total_pss
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=300, help="Seconds to wait for startup")
+    parser.add_argument("--settle", type=float, default=5, help="Seconds to wait once healthy")
+    args = parser.parse_args()
+
+    single = report(1, measure(1, args.timeout, args.settle))
+    print()
+    multi = report(args.workers, measure(args.workers, args.timeout, args.settle))
+    print()
+    print(f"PSS per extra worker: {(multi - single) / max(args.workers - 1, 1) / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
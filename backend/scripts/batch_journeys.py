@@ -0,0 +1,80 @@
+"""
+Search journeys for a JSONL file of travel orders, writing JSONL results.
+
+Each input line is a JourneySearchRequest, e.g.
+    {"departure_station_id": 3, "destination_station_id": 42, "datetime_iso": "2026-01-15T08:00:00"}
+Each output line is a JourneyBatchResult (`index` is the input line number,
+from 0), in completion order. Lines that are not a valid request are reported
+on stderr and skipped. Concurrency, upstream rate and retries default to the
+JOURNEY_BATCH_* settings.
+
+Usage (from the project root):
+    uv run python -m backend.scripts.batch_journeys orders.jsonl -o results.jsonl
+    cat orders.jsonl | uv run python -m backend.scripts.batch_journeys - --concurrency 16
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import IO, Iterator
+
+from pydantic import ValidationError
+
+from backend.app.core.config import config
+from backend.app.core.rate_limit import TokenBucket
+from backend.app.models.journey import JourneySearchRequest
+from backend.app.services.journey_batch import JourneyBatchService
+from backend.app.services.navitia_service import NavitiaService
+
+
+def read_items(source: IO[str], line_numbers: list[int]) -> Iterator[JourneySearchRequest]:
+    """Valid requests of `source`; `line_numbers` gets the input line of each one."""
+    for number, line in enumerate(source):
+        if not line.strip():
+            continue
+        try:
+            item = JourneySearchRequest.model_validate_json(line)
+        except ValidationError as e:
+            print(f"line {number} skipped: {e.errors()[0]['msg']}", file=sys.stderr)
+            continue
+        line_numbers.append(number)
+        yield item
+
+
+async def run(args: argparse.Namespace) -> None:
+    navitia = NavitiaService(
+        rate_limiter=TokenBucket(args.rate, config.journey_batch_burst),
+        max_retries=args.retries,
+    )
+    service = JourneyBatchService(navitia)
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    searches = errors = 0
+    line_numbers: list[int] = []
+    try:
+        async for result in service.run(read_items(source, line_numbers), args.concurrency):
+            result.index = line_numbers[result.index]
+            output.write(result.model_dump_json() + "\n")
+            searches += 1
+            errors += result.error is not None
+    finally:
+        await service.aclose()
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    print(f"{searches} searches, {errors} errors", file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="JSONL file of JourneySearchRequest, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="JSONL results file (default: stdout)")
+    parser.add_argument("--concurrency", type=int, default=config.journey_batch_concurrency)
+    parser.add_argument("--rate", type=float, default=config.journey_batch_rate, help="Upstream calls per second")
+    parser.add_argument("--retries", type=int, default=config.journey_batch_max_retries)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
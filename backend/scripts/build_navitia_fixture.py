@@ -0,0 +1,279 @@
+"""
+Generate the synthetic Navitia journeys payload used by the tests and benchmarks.
+
+The payload is not a recording: it mimics the shape and size of a Navitia
+/journeys response (sections, stop times, geojson) for trips from Paris Gare
+de Lyon, with seeded random durations so the output is reproducible.
+
+Usage (from the project root):
+    uv run python -m backend.scripts.build_navitia_fixture [path/to/output.json]
+"""
+
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+
+DEFAULT_PATH = "backend/tests/fixtures/navitia_journeys_synthetic.json"
+
+# (name, lon, lat, UIC code)
+Stop = tuple[str, float, float, str]
+
+STOPS: list[Stop] = [
+    ("Paris Gare de Lyon", 2.3734, 48.8443, "87686006"),
+    ("Dijon Ville", 5.0272, 47.3233, "87713040"),
+    ("Lyon Part-Dieu", 4.8597, 45.7606, "87723197"),
+    ("Mâcon Loché TGV", 4.7791, 46.2829, "87725705"),
+    ("Chalon-sur-Saône", 4.8431, 46.7817, "87725002"),
+    ("Le Creusot Montceau TGV", 4.5027, 46.7653, "87694109"),
+]
+START = datetime(2026, 1, 15, 14, 0)
+NB_JOURNEYS = 6
+SEED = 7
+
+
+def fmt(dt: datetime) -> str:
+    return dt.strftime("%Y%m%dT%H%M%S")
+
+
+def place(name: str, lon: float, lat: float, uic: str) -> dict:
+    coord = {"lon": f"{lon}", "lat": f"{lat}"}
+    stop_point = {
+        "id": f"stop_point:SNCF:{uic}:Train",
+        "name": name,
+        "label": name,
+        "coord": coord,
+        "links": [],
+        "equipments": [],
+        "stop_area": {
+            "id": f"stop_area:SNCF:{uic}",
+            "name": name,
+            "label": name,
+            "timezone": "Europe/Paris",
+            "coord": dict(coord),
+            "links": [],
+        },
+    }
+    return {
+        "id": stop_point["id"],
+        "name": name,
+        "quality": 0,
+        "embedded_type": "stop_point",
+        "stop_point": stop_point,
+    }
+
+
+def address(lon: float, lat: float) -> dict:
+    return {
+        "id": f"{lon};{lat}",
+        "name": "Rue de Bercy (Paris)",
+        "quality": 0,
+        "embedded_type": "address",
+        "address": {
+            "id": f"{lon};{lat}",
+            "name": "Rue de Bercy",
+            "label": "Rue de Bercy (Paris)",
+            "house_number": 0,
+            "coord": {"lon": f"{lon}", "lat": f"{lat}"},
+            "links": [],
+        },
+    }
+
+
+def ride(
+    rng: random.Random, j: int, k: int, a: Stop, b: Stop, via: Stop, t: datetime
+) -> dict:
+    """A train from `a` to `b` stopping at `via` halfway."""
+    duration = rng.randint(3600, 7200)
+    stop_date_times = []
+    for m, stop in enumerate([a, via, b]):
+        arrival = t + timedelta(seconds=duration * m // 2)
+        departure = arrival + timedelta(seconds=120)
+        stop_date_times.append({
+            "stop_point": place(*stop)["stop_point"],
+            "arrival_date_time": fmt(arrival),
+            "departure_date_time": fmt(departure),
+            "base_arrival_date_time": fmt(arrival),
+            "base_departure_date_time": fmt(departure),
+            "links": [],
+            "additional_informations": [],
+        })
+    end = t + timedelta(seconds=duration)
+    number = f"{6601 + j * 2 + k}"
+    return {
+        "id": f"section_{j}_{k}",
+        "type": "public_transport",
+        "duration": duration,
+        "from": place(*a),
+        "to": place(*b),
+        "departure_date_time": fmt(t),
+        "arrival_date_time": fmt(end),
+        "base_departure_date_time": fmt(t),
+        "base_arrival_date_time": fmt(end),
+        "data_freshness": "base_schedule",
+        "additional_informations": ["regular"],
+        "co2_emission": {"value": round(rng.uniform(1, 4), 2), "unit": "gEC"},
+        "display_informations": {
+            "commercial_mode": "TGV INOUI",
+            "network": "SNCF",
+            "direction": f"{b[0]} ({b[0].split()[0]})",
+            "label": number,
+            "color": "000000",
+            "code": "",
+            "text_color": "FFFFFF",
+            "physical_mode": "Train grande vitesse",
+            "headsign": number,
+            "trip_short_name": number,
+            "name": "Paris - Lyon",
+            "description": "",
+            "equipments": [],
+            "links": [],
+        },
+        "stop_date_times": stop_date_times,
+        "geojson": {
+            "type": "LineString",
+            "coordinates": [
+                [a[1] + (b[1] - a[1]) * q / 40, a[2] + (b[2] - a[2]) * q / 40] for q in range(41)
+            ],
+            "properties": [{"length": 391000}],
+        },
+        "links": [
+            {"type": "vehicle_journey", "id": f"vehicle_journey:SNCF:2026-01-15:{6601 + j}:1187:Train"}
+        ],
+    }
+
+
+def journey(rng: random.Random, j: int) -> dict:
+    """Journey `j`: direct to Lyon for even `j`, with a change at Dijon for odd `j`."""
+    departure = t = START + timedelta(minutes=37 * j)
+    sections = [{
+        "id": f"section_{j}_0",
+        "type": "street_network",
+        "mode": "walking",
+        "duration": 180,
+        "from": address(2.3701, 48.8421),
+        "to": place(*STOPS[0]),
+        "departure_date_time": fmt(t),
+        "arrival_date_time": fmt(t + timedelta(seconds=180)),
+        "geojson": {
+            "type": "LineString",
+            "coordinates": [[2.3701 + k * 1e-4, 48.8421 + k * 1e-4] for k in range(12)],
+            "properties": [{"length": 240}],
+        },
+        "links": [],
+    }]
+    t += timedelta(seconds=180)
+
+    legs = [0, 1, 2] if j % 2 else [0, 2]
+    for k in range(len(legs) - 1):
+        if k:
+            sections.append({
+                "id": f"section_{j}_t{k}",
+                "type": "transfer",
+                "transfer_type": "walking",
+                "duration": 300,
+                "from": place(*STOPS[legs[k]]),
+                "to": place(*STOPS[legs[k]]),
+                "departure_date_time": fmt(t),
+                "arrival_date_time": fmt(t + timedelta(seconds=300)),
+                "links": [],
+            })
+            t += timedelta(seconds=300)
+            sections.append({
+                "id": f"section_{j}_w{k}",
+                "type": "waiting",
+                "duration": 600,
+                "departure_date_time": fmt(t),
+                "arrival_date_time": fmt(t + timedelta(seconds=600)),
+                "links": [],
+            })
+            t += timedelta(seconds=600)
+        section = ride(rng, j, k, STOPS[legs[k]], STOPS[legs[k + 1]], STOPS[3 + k % 3], t)
+        sections.append(section)
+        t += timedelta(seconds=section["duration"])
+
+    sections.append({
+        "id": f"section_{j}_end",
+        "type": "street_network",
+        "mode": "walking",
+        "duration": 240,
+        "from": place(*STOPS[2]),
+        "to": address(4.8611, 45.7612),
+        "departure_date_time": fmt(t),
+        "arrival_date_time": fmt(t + timedelta(seconds=240)),
+        "links": [],
+    })
+    t += timedelta(seconds=240)
+
+    total = int((t - departure).total_seconds())
+    nb_transfers = len(legs) - 2
+    return {
+        "duration": total,
+        "nb_transfers": nb_transfers,
+        "departure_date_time": fmt(departure),
+        "arrival_date_time": fmt(t),
+        "requested_date_time": fmt(START),
+        "type": "best" if j == 0 else "rapid",
+        "status": "",
+        "tags": ["walking", "ecologic"],
+        "co2_emission": {"value": round(rng.uniform(2, 8), 2), "unit": "gEC"},
+        "durations": {
+            "total": total,
+            "walking": 420 + 300 * nb_transfers,
+            "bike": 0,
+            "car": 0,
+            "ridesharing": 0,
+            "taxi": 0,
+        },
+        "distances": {"walking": 580, "bike": 0, "car": 0, "ridesharing": 0, "taxi": 0},
+        "fare": {"found": False, "total": {"value": "0.0"}, "links": []},
+        "calendars": [{
+            "active_periods": [{"begin": "20260115", "end": "20260116"}],
+            "week_pattern": {"monday": True},
+        }],
+        "sections": sections,
+        "links": [],
+    }
+
+
+def build_payload(seed: int = SEED) -> dict:
+    rng = random.Random(seed)
+    base = "https://api.navitia.io/v1/coverage/sncf/journeys?from=2.3734%3B48.8443&to=4.8597%3B45.7606"
+    return {
+        "journeys": [journey(rng, j) for j in range(NB_JOURNEYS)],
+        "links": [
+            {
+                "href": f"{base}&datetime=20260115T174500&datetime_represents=departure",
+                "type": "next",
+                "rel": "next",
+                "templated": False,
+            },
+            {
+                "href": f"{base}&datetime=20260115T135900&datetime_represents=arrival",
+                "type": "prev",
+                "rel": "prev",
+                "templated": False,
+            },
+        ],
+        "context": {
+            "timezone": "Europe/Paris",
+            "current_datetime": "20260115T135500",
+            "car_direct_path": {"co2_emission": {"value": 90.1, "unit": "gEC"}},
+        },
+        "tickets": [],
+        "disruptions": [],
+        "notes": [],
+        "feed_publishers": [{"id": "sncf", "name": "SNCF PROD", "license": "Private", "url": ""}],
+        "exceptions": [],
+    }
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(build_payload(), f, ensure_ascii=False, indent=2)
+    print(f"Synthetic Navitia payload written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""
+Compile `entries.csv` into the binary snapshot read by StationStore at startup.
+
+Usage (from the project root):
+    uv run python -m backend.scripts.build_station_snapshot [path/to/entries.csv]
+"""
+
+import sys
+
+from backend.app.services.station_store import StationStore
+
+
+def main() -> None:
+    data_path = sys.argv[1] if len(sys.argv) > 1 else None
+    snapshot_path = StationStore.build_snapshot(data_path)
+    print(f"Station snapshot written to {snapshot_path}")
+
+
+if __name__ == "__main__":
+    main()
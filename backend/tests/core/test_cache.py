@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+import pytest
+
+from backend.app.core.cache import LRUCache, SingleFlight, TTLCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.stats() == {"size": 2, "maxsize": 2, "hits": 1, "misses": 0, "evictions": 1}
+
+
+def test_ttl_entries_expire():
+    cache: TTLCache[str, int] = TTLCache(maxsize=8, ttl=60)
+    cache.set("fresh", 1)
+    cache.set("short", 2, ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("fresh") == 1
+    assert cache.get("short") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_the_leader_being_cancelled():
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    leader = asyncio.create_task(flight.do("key", fetch))
+    follower = asyncio.create_task(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == 42
+    assert leader.cancelled()
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_call_is_cancelled_once_every_caller_left():
+    flight: SingleFlight[str, int] = SingleFlight()
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def fetch() -> int:
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return 0
+
+    callers = [asyncio.create_task(flight.do("key", fetch)) for _ in range(2)]
+    await started.wait()
+    for caller in callers:
+        caller.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    await asyncio.sleep(0)
+    assert await flight.do("key", lambda: asyncio.sleep(0, result=7)) == 7
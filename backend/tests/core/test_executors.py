@@ -0,0 +1,162 @@
+import asyncio
+import operator
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.api.v1.travel import get_cpu_executor
+from backend.app.core.config import config
+from backend.app.core.executors import BoundedExecutor, ExecutorSaturatedError
+from backend.app.core.inference_server import InferenceClient, start_inference_server
+from backend.app.main import app, create_app
+
+
+def make_executor(max_workers: int = 1, max_queue: int = 0) -> BoundedExecutor:
+    return BoundedExecutor(
+        "test",
+        lambda workers: ThreadPoolExecutor(max_workers=workers),
+        max_workers=max_workers,
+        max_queue=max_queue,
+        retry_after=7,
+    )
+
+
+@pytest.mark.asyncio
+async def test_blocking_work_does_not_stall_the_event_loop():
+    executor = make_executor()
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    result = await executor.run(lambda seconds: time.sleep(seconds) or "done", 0.2)
+    task.cancel()
+    executor.shutdown()
+
+    assert result == "done"
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_rejects_until_a_slot_frees():
+    executor = make_executor(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    running = [asyncio.create_task(executor.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(ExecutorSaturatedError) as exc_info:
+        await executor.run(lambda: None)
+    assert exc_info.value.retry_after == 7
+
+    release.set()
+    await asyncio.gather(*running)
+    assert executor.in_flight == 0
+    assert await executor.run(lambda: 42) == 42
+    executor.shutdown()
+
+
+def test_saturated_route_returns_503_with_retry_after():
+    saturated = make_executor(max_workers=0)
+    app.dependency_overrides[get_cpu_executor] = lambda: saturated
+    try:
+        response = TestClient(app).post(
+            "/api/v1/identify-travel-orders", json={"items": [{"text": "Paris Lyon"}]}
+        )
+    finally:
+        del app.dependency_overrides[get_cpu_executor]
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "7"
+
+
+@pytest.mark.asyncio
+async def test_reconfigured_executor_runs_calls_in_the_inference_server():
+    # Unix socket paths are short: keep it out of pytest's deep tmp_path
+    address = os.path.join(tempfile.mkdtemp(), "inference.sock")
+    server = start_inference_server(address)
+    executor = make_executor(max_workers=2, max_queue=2)
+    try:
+        client = InferenceClient(address)
+        executor.reconfigure(client.executor, client.queue)
+
+        results = await asyncio.gather(*(executor.run(operator.mul, i, 3) for i in range(4)))
+        queue = executor.new_queue()
+        queue.put("progress")
+
+        assert results == [0, 3, 6, 9]
+        assert queue.get(timeout=5) == "progress"
+    finally:
+        executor.shutdown()
+        server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_inference_server_limits_calls_across_workers(monkeypatch):
+    # Read by the spawned server process
+    monkeypatch.setenv("INFERENCE_POOL_WORKERS", "1")
+    monkeypatch.setenv("INFERENCE_POOL_QUEUE", "1")
+    address = os.path.join(tempfile.mkdtemp(), "inference.sock")
+    server = start_inference_server(address)
+    # Two API workers, each allowed more than the server admits for the host
+    workers = [make_executor(max_workers=2, max_queue=2) for _ in range(2)]
+    try:
+        for worker in workers:
+            client = InferenceClient(address)
+            worker.reconfigure(client.executor, client.queue)
+
+        results = await asyncio.gather(
+            *(worker.run(time.sleep, 0.5) for worker in workers for _ in range(2)),
+            return_exceptions=True,
+        )
+
+        rejected = [r for r in results if isinstance(r, ExecutorSaturatedError)]
+        assert len(rejected) == 2
+        assert rejected[0].pool == "inference"
+        assert rejected[0].retry_after == config.inference_pool_retry_after
+    finally:
+        for worker in workers:
+            worker.shutdown()
+        server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_is_not_limited_by_the_inference_server(monkeypatch):
+    monkeypatch.setenv("INFERENCE_POOL_WORKERS", "1")
+    monkeypatch.setenv("INFERENCE_POOL_QUEUE", "0")
+    address = os.path.join(tempfile.mkdtemp(), "inference.sock")
+    server = start_inference_server(address)
+    workers = [make_executor(max_workers=1, max_queue=0) for _ in range(3)]
+    try:
+        for worker in workers:
+            client = InferenceClient(address)
+            worker.reconfigure(client.executor, client.queue)
+
+        # A request on the first worker takes the whole host budget while the others warm up
+        request = asyncio.ensure_future(workers[0].run(time.sleep, 1))
+        await asyncio.sleep(0.2)
+        await asyncio.gather(*(worker.warm_up(time.sleep, 0.1) for worker in workers[1:]))
+
+        with pytest.raises(ExecutorSaturatedError):
+            await workers[1].run(time.sleep, 0)
+        await request
+    finally:
+        for worker in workers:
+            worker.shutdown()
+        server.shutdown()
+
+
+def test_create_app_builds_independent_apps():
+    other = create_app()
+
+    assert other is not app
+    assert other.openapi()["paths"] == app.openapi()["paths"]
@@ -0,0 +1,61 @@
+import copy
+
+import httpx
+import pytest
+import spacy
+
+from backend.app.services.navitia_service import NavitiaService
+from backend.app.services.travel_service import TravelService
+
+NAVITIA_JOURNEY = {
+    "departure_date_time": "20260115T143000",
+    "arrival_date_time": "20260115T163000",
+    "duration": 7200,
+    "nb_transfers": 0,
+    "durations": {"walking": 120},
+    "sections": [
+        {
+            "type": "public_transport",
+            "from": {"name": "Paris", "stop_point": {"name": "Paris Gare de Lyon", "coord": {"lon": "2.37", "lat": "48.84"}}},
+            "to": {"name": "Lyon", "stop_point": {"name": "Lyon Part-Dieu", "coord": {"lon": "4.86", "lat": "45.76"}}},
+            "departure_date_time": "20260115T143000",
+            "arrival_date_time": "20260115T163000",
+            "duration": 7200,
+            "display_informations": {"label": "TGV INOUI", "commercial_mode": "TGV INOUI", "direction": "Lyon"},
+        }
+    ],
+}
+
+
+@pytest.fixture
+def ner_model(monkeypatch):
+    """Rule-based stand-in for the trained NER model."""
+    nlp = spacy.blank("fr")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "DEPARTURE", "pattern": [{"LOWER": "de"}, {"LOWER": "paris"}]},
+        {"label": "DEPARTURE", "pattern": [{"LOWER": "de"}, {"LOWER": "lyon"}]},
+        {"label": "DESTINATION", "pattern": [{"LOWER": "a"}, {"LOWER": "toulouse"}]},
+        {"label": "DESTINATION", "pattern": [{"LOWER": "a"}, {"LOWER": "marseille"}]},
+        {"label": "TIME", "pattern": [{"LOWER": "a"}, {"TEXT": {"REGEX": r"^\d{1,2}h$"}}]},
+    ])
+    monkeypatch.setattr(TravelService, "_model", nlp)
+    return nlp
+
+
+@pytest.fixture
+def navitia_journey():
+    """A direct Paris - Lyon journey as Navitia returns it."""
+    return copy.deepcopy(NAVITIA_JOURNEY)
+
+
+@pytest.fixture
+def make_navitia_service():
+    """Build NavitiaService instances answered by an httpx.MockTransport handler."""
+
+    def make(handler, **kwargs) -> NavitiaService:
+        service = NavitiaService(transport=httpx.MockTransport(handler), **kwargs)
+        service._api_key = "test-key"
+        return service
+
+    return make
@@ -0,0 +1,88 @@
+import io
+import wave
+
+import numpy as np
+import pytest
+from faster_whisper.vad import VadOptions
+
+from backend.app.services import audio_preprocessing
+from backend.app.services.audio_preprocessing import (
+    AudioTooLongError,
+    decode_audio,
+    prepare_audio,
+)
+
+RECORDING = "base/data/raw/audio_travel_order/Fenouillet_Uzer_soir.wav"
+
+
+def to_wav(samples: np.ndarray, rate: int) -> bytes:
+    """Encode int16 samples, shaped (frames, channels), as a PCM WAV."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(samples.shape[1])
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+def test_pcm_wav_is_resampled_to_16k_mono():
+    t = np.arange(48000) / 48000
+    tone = (0.5 * 32767 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+    stereo = np.column_stack([tone, tone])
+
+    samples = decode_audio(to_wav(stereo, 48000))
+
+    assert samples.dtype == np.float32
+    assert len(samples) == 16000
+    assert abs(np.abs(samples).max() - 0.5) < 0.01
+
+
+def test_silence_around_speech_is_trimmed():
+    with wave.open(RECORDING) as wav:
+        rate = wav.getframerate()
+        speech = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+    silence = np.zeros(3 * rate, dtype=np.int16)
+    padded = np.concatenate([silence, speech, silence])[:, None]
+
+    prepared = prepare_audio(to_wav(padded, rate), VadOptions(min_silence_duration_ms=500, speech_pad_ms=200))
+
+    assert prepared.audio_seconds == pytest.approx(len(padded) / rate, abs=0.01)
+    assert prepared.speech_seconds < len(speech) / rate
+    assert prepared.speech_seconds > 1
+
+
+def test_long_speech_is_rejected_or_truncated():
+    samples = np.zeros(40 * 16000, dtype=np.float32)
+
+    with pytest.raises(AudioTooLongError):
+        prepare_audio(samples, max_seconds=30)
+
+    prepared = prepare_audio(samples, max_seconds=30, truncate=True)
+    assert prepared.truncated
+    assert prepared.speech_seconds == 30
+
+
+def test_long_wav_is_rejected_from_its_header(monkeypatch):
+    wav = to_wav(np.zeros((130 * 16000, 1), dtype=np.int16), 16000)
+    monkeypatch.setattr(audio_preprocessing, "decode_audio", lambda data: pytest.fail("decoded"))
+
+    with pytest.raises(AudioTooLongError, match="130.0s"):
+        prepare_audio(wav, max_input_seconds=120)
+
+
+def test_long_input_is_truncated_before_vad(monkeypatch):
+    seen = []
+
+    def trim_silence(samples, vad_options):
+        seen.append(len(samples))
+        return samples
+
+    monkeypatch.setattr(audio_preprocessing, "trim_silence", trim_silence)
+
+    prepared = prepare_audio(
+        np.zeros(130 * 16000, dtype=np.float32), VadOptions(), max_input_seconds=120, truncate=True
+    )
+
+    assert seen == [120 * 16000]
+    assert prepared.truncated and prepared.audio_seconds == 130
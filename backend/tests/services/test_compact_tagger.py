@@ -0,0 +1,62 @@
+import numpy as np
+
+from backend.app.models.travel import TravelEntities, TravelServiceConfig
+from backend.app.services.compact_tagger import TAGS, CompactTagger, feature_ids
+from backend.app.services.travel_service import TravelService
+
+N_FEATURES = 2**12
+
+# Word -> tag it pushes towards, every other word leaning to "O"
+WORD_TAGS = {
+    "paris": "B-DEPARTURE",
+    "saint": "B-DESTINATION",
+    "malo": "I-DESTINATION",
+    "demain": "B-TIME",
+}
+
+
+def make_tagger() -> CompactTagger:
+    weights = np.zeros((N_FEATURES, len(TAGS)))
+    for word, tag in WORD_TAGS.items():
+        weights[feature_ids([word], N_FEATURES)[0][1], TAGS.index(tag)] = 5.0
+    bias = np.zeros(len(TAGS))
+    bias[TAGS.index("O")] = 1.0
+    return CompactTagger.quantize(weights, bias)
+
+
+def test_tags_are_decoded_into_spans():
+    text = "de paris a saint malo demain"
+
+    spans = make_tagger().tag(text)
+
+    assert [(label, text[start:end]) for label, start, end in spans] == [
+        ("DEPARTURE", "paris"),
+        ("DESTINATION", "saint malo"),
+        ("TIME", "demain"),
+    ]
+
+
+def test_inside_tag_never_starts_an_entity():
+    # "malo" alone scores I-DESTINATION best, which is not allowed without a B-
+    assert make_tagger().tag("malo") == []
+
+
+def test_saved_tagger_loads_with_the_same_predictions(tmp_path):
+    tagger = make_tagger()
+    path = tmp_path / "tagger.npz"
+
+    tagger.save(path)
+    loaded = CompactTagger.load(path)
+
+    text = "paris saint malo demain"
+    assert loaded.tag(text) == tagger.tag(text)
+    assert np.array_equal(loaded.scores(text.split()), tagger.scores(text.split()))
+
+
+def test_travel_service_compact_backend(monkeypatch):
+    monkeypatch.setattr(TravelService, "_tagger", make_tagger())
+    service = TravelService(TravelServiceConfig(backend="compact"))
+
+    assert service.extract_entities(["De Paris à Saint-Malo demain"]) == [
+        TravelEntities(departure="paris", destination="saint malo", time="demain")
+    ]
@@ -0,0 +1,66 @@
+import random
+from math import atan2, cos, radians, sin, sqrt
+
+import numpy as np
+
+from backend.app.services.geolocation import GeoLocationService
+from backend.app.services.station_store import StationStore
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+    dlat, dlon = lat2 - lat1, lon2 - lon1
+    a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
+    return 6371 * 2 * atan2(sqrt(a), sqrt(1 - a))
+
+
+def brute_force_nearest(lat: float, lon: float) -> int:
+    """The original linear scan."""
+    store = StationStore.get_instance()
+    rows = store.located_rows()
+    row = min(rows, key=lambda r: haversine(lat, lon, store.lat[r], store.lon[r]))
+    return int(store.ids[row])
+
+
+def random_points(n: int) -> list[tuple[float, float]]:
+    rng = random.Random(42)
+    return [(rng.uniform(42.3, 51.1), rng.uniform(-4.8, 8.2)) for _ in range(n)]
+
+
+def test_nearest_matches_brute_force():
+    service = GeoLocationService.get_instance()
+
+    for lat, lon in random_points(300):
+        assert service.find_nearest_station_id(lat, lon) == brute_force_nearest(lat, lon)
+
+
+def test_nearest_prefers_first_station_at_shared_coordinates():
+    service = GeoLocationService.get_instance()
+    # "Ablon" (3) and "ABLON-SUR-SEINE" (4) share coordinates
+    assert service.find_nearest_station_id(48.72389663352872, 2.417861797996967) == 3
+
+
+def test_batch_lookup_matches_single_lookup():
+    service = GeoLocationService.get_instance()
+    points = random_points(50)
+    lats, lons = np.array(points).T
+
+    ids, distances = service.find_nearest_station_ids(lats, lons)
+
+    assert ids.tolist() == [service.find_nearest_station_id(lat, lon) for lat, lon in points]
+    store = StationStore.get_instance()
+    for (lat, lon), station_id, distance in zip(points, ids, distances):
+        station_lat, station_lon = store.get_coords(int(station_id))
+        assert abs(distance - haversine(lat, lon, station_lat, station_lon)) < 1e-6
+
+
+def test_k_nearest_is_sorted_and_bounded():
+    service = GeoLocationService.get_instance()
+
+    nearest = service.find_k_nearest(48.8443, 2.3744, k=10)
+    assert len(nearest) == 10
+    assert [d for _, d in nearest] == sorted(d for _, d in nearest)
+    assert nearest[0][0] == service.find_nearest_station_id(48.8443, 2.3744)
+
+    within = service.find_k_nearest(48.8443, 2.3744, k=10, max_km=2)
+    assert within == [(i, d) for i, d in nearest if d <= 2]
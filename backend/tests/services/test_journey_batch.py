@@ -0,0 +1,150 @@
+import asyncio
+import io
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.api.v1.travel import get_journey_batch_service
+from backend.app.core.config import config
+from backend.app.core.rate_limit import TokenBucket
+from backend.app.main import app
+from backend.app.models.journey import JourneySearchRequest, JourneySearchResponse
+from backend.app.services.journey_batch import JourneyBatchService
+from backend.scripts.batch_journeys import read_items
+
+class FlakyUpstream:
+    """Mock Navitia answering 429 to the first call of each search, tracking concurrency."""
+
+    def __init__(self, journey: dict, delay: float = 0.01):
+        self.journey = journey
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.seen: set[str] = set()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        search = request.url.params["datetime"]
+        if search not in self.seen:
+            self.seen.add(search)
+            return httpx.Response(429)
+        return httpx.Response(200, json={"journeys": [self.journey]})
+
+
+@pytest.fixture
+def make_batch_service(make_navitia_service):
+    def make(upstream, **kwargs) -> JourneyBatchService:
+        return JourneyBatchService(make_navitia_service(upstream, **kwargs))
+
+    return make
+
+
+def make_items(n: int) -> list[JourneySearchRequest]:
+    return [
+        JourneySearchRequest(
+            departure_station_id=3,
+            destination_station_id=42,
+            datetime_iso=f"2026-01-{1 + i // 24:02d}T{i % 24:02d}:00:00",
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(config, "navitia_retry_base_delay", 0.001)
+
+
+@pytest.mark.asyncio
+async def test_batch_bounds_concurrency_and_retries_throttled_searches(
+    navitia_journey, make_batch_service
+):
+    upstream = FlakyUpstream(navitia_journey)
+    service = make_batch_service(upstream, max_retries=2)
+
+    results = [r async for r in service.run(make_items(20), concurrency=4)]
+
+    assert sorted(r.index for r in results) == list(range(20))
+    assert all(r.error is None and len(r.journeys) == 1 for r in results)
+    assert upstream.calls == 40
+    assert upstream.max_in_flight <= 4
+
+
+@pytest.mark.asyncio
+async def test_retries_give_up_with_an_error_line(navitia_journey, make_batch_service):
+    upstream = FlakyUpstream(navitia_journey)
+    service = make_batch_service(upstream, max_retries=0)
+
+    results = [r async for r in service.run(make_items(3))]
+
+    assert {r.error for r in results} == {"Erreur HTTP: 429"}
+    assert upstream.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_search_that_raises_yields_an_error_line():
+    class BrokenNavitia:
+        async def search_journeys(self, **params) -> JourneySearchResponse:
+            if params["datetime_iso"].endswith("T01:00:00"):
+                raise httpx.ConnectError("connection refused")
+            return JourneySearchResponse(journeys=[])
+
+    service = JourneyBatchService(BrokenNavitia())  # type: ignore[arg-type]
+
+    results = sorted([r async for r in service.run(make_items(3))], key=lambda r: r.index)
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert [r.error for r in results] == [None, "Erreur: connection refused", None]
+
+
+def test_script_skips_malformed_lines(capsys):
+    lines = [item.model_dump_json() for item in make_items(2)]
+    source = io.StringIO("\n".join([lines[0], "{not json", "", '{"departure_station_id": 3}', lines[1]]))
+    line_numbers: list[int] = []
+
+    items = list(read_items(source, line_numbers))
+
+    assert items == make_items(2)
+    assert line_numbers == [0, 4]
+    assert "line 1 skipped" in capsys.readouterr().err
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_upstream_calls(navitia_journey, make_batch_service):
+    upstream = FlakyUpstream(navitia_journey, delay=0)
+    service = make_batch_service(upstream, rate_limiter=TokenBucket(rate=100, capacity=1), max_retries=1)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    results = [r async for r in service.run(make_items(5), concurrency=5)]
+
+    # 10 calls (each search is retried once), one token banked at the start
+    assert loop.time() - start >= 9 / 100
+    assert all(r.error is None for r in results)
+
+
+def test_batch_endpoint_streams_jsonl(navitia_journey, make_batch_service):
+    service = make_batch_service(FlakyUpstream(navitia_journey, delay=0), max_retries=1)
+    app.dependency_overrides[get_journey_batch_service] = lambda: service
+    try:
+        response = TestClient(app).post(
+            "/api/v1/journeys/batch",
+            json={"items": [item.model_dump() for item in make_items(3)], "concurrency": 2},
+        )
+    finally:
+        del app.dependency_overrides[get_journey_batch_service]
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["index"] for line in lines) == [0, 1, 2]
+    assert all(line["error"] is None and line["request"]["destination_station_id"] == 42 for line in lines)
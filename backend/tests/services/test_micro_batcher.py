@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from backend.app.core.executors import ExecutorSaturatedError
+from backend.app.core.metrics import metrics
+from backend.app.services.micro_batcher import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_one_batch():
+    calls: list[list[int]] = []
+
+    def process(items: list[int]) -> list[int]:
+        calls.append(items)
+        return [i * 2 for i in items]
+
+    batcher = MicroBatcher(process, max_batch_size=16, max_wait_ms=20, name="test_share")
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert results == [0, 2, 4, 6, 8]
+    assert calls == [[0, 1, 2, 3, 4]]
+    summaries = metrics.snapshot()["summaries"]
+    assert summaries["test_share.batch_size"]["max"] == 5
+    assert summaries["test_share.queue_latency_ms"]["count"] == 5
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_splits_batches():
+    calls: list[list[int]] = []
+
+    def process(items: list[int]) -> list[int]:
+        calls.append(items)
+        return items
+
+    batcher = MicroBatcher(process, max_batch_size=2, max_wait_ms=1000, name="test_split")
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert results == [0, 1, 2, 3, 4]
+    assert all(len(batch) <= 2 for batch in calls)
+    assert sum(calls, []) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_propagates_to_every_caller():
+    def process(items: list[int]) -> list[int]:
+        raise RuntimeError("model crashed")
+
+    batcher = MicroBatcher(process, max_batch_size=8, max_wait_ms=1, name="test_fail")
+    results = await asyncio.gather(
+        *(batcher.submit(i) for i in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_submit_is_rejected_once_max_pending_items_wait():
+    batcher = MicroBatcher(
+        lambda items: items, max_batch_size=8, max_wait_ms=50, name="test_full", max_pending=2
+    )
+    waiting = [asyncio.ensure_future(batcher.submit(i)) for i in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(ExecutorSaturatedError):
+        await batcher.submit(2)
+    assert await asyncio.gather(*waiting) == [0, 1]
+    assert await batcher.submit(3) == 3
@@ -0,0 +1,480 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+import warnings
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlencode
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.api.v1.travel import get_navitia_service
+from backend.app.core.cache import SharedCacheBackend
+from backend.app.core.config import config
+from backend.app.main import app
+from backend.app.models.journey import JourneySearchResponse
+from backend.app.services.navitia_service import NavitiaService, _encode_cursor
+
+class MockNavitiaHandler(BaseHTTPRequestHandler):
+    """Keep-alive HTTP/1.1 stand-in for the Navitia journeys endpoint."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.client_ports.append(self.client_address[1])  # type: ignore
+        body = json.dumps({"journeys": [self.server.journey]}).encode()  # type: ignore
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def mock_navitia(navitia_journey):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockNavitiaHandler)
+    server.client_ports = []  # type: ignore
+    server.journey = navitia_journey  # type: ignore
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_service(server) -> NavitiaService:
+    service = NavitiaService()
+    service._api_key = "test-key"
+    service._base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    return service
+
+
+@pytest.mark.asyncio
+async def test_search_journeys_reuses_pooled_connection(mock_navitia):
+    service = make_service(mock_navitia)
+    await service.start()
+    try:
+        for day in range(3):
+            # Distinct datetimes so every search reaches the upstream
+            result = await service.search_journeys(3, 42, f"2026-01-1{day}T14:30:00")
+            assert result.error is None
+            assert result.journeys[0].sections[0].line_name == "TGV INOUI"
+    finally:
+        await service.aclose()
+
+    assert len(mock_navitia.client_ports) == 3
+    assert len(set(mock_navitia.client_ports)) == 1
+
+
+@pytest.mark.asyncio
+async def test_aclose_drops_the_pool(mock_navitia):
+    service = make_service(mock_navitia)
+
+    await service.search_journeys(3, 42, "2026-01-10T14:30:00")
+    await service.aclose()
+    await service.search_journeys(3, 42, "2026-01-11T14:30:00")
+    await service.aclose()
+
+    assert len(set(mock_navitia.client_ports)) == 2
+
+
+def test_client_of_a_previous_event_loop_is_closed(navitia_journey, make_navitia_service):
+    service = make_navitia_service(CountingUpstream(navitia_journey))
+
+    asyncio.run(service.search_journeys(3, 42, "2026-01-10T14:30:00"))
+    first = service._client
+    asyncio.run(service.search_journeys(3, 42, "2026-01-11T14:30:00"))
+
+    assert first.is_closed
+    assert service._client is not first and not service._client.is_closed
+
+
+class CountingUpstream:
+    """httpx.MockTransport handler counting upstream calls."""
+
+    def __init__(self, journey: dict, status_code: int = 200, delay: float = 0.0):
+        self.journey = journey
+        self.calls = 0
+        self.status_code = status_code
+        self.delay = delay
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.status_code != 200:
+            return httpx.Response(self.status_code)
+        return httpx.Response(200, json={"journeys": [self.journey]})
+
+
+@pytest.mark.asyncio
+async def test_repeated_search_in_same_bucket_is_cached(navitia_journey, make_navitia_service):
+    upstream = CountingUpstream(navitia_journey)
+    service = make_navitia_service(upstream)
+
+    first = await service.search_journeys(3, 42, "2026-01-15T14:30:00")
+    second = await service.search_journeys(3, 42, "2026-01-15T14:32:00")
+    other_bucket = await service.search_journeys(3, 42, "2026-01-15T18:00:00")
+    arrival = await service.search_journeys(3, 42, "2026-01-15T14:30:00", "arrival")
+
+    assert second == first
+    assert other_bucket.error is None and arrival.error is None
+    assert upstream.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_time_window_is_fetched_in_one_upstream_call(navitia_journey, make_navitia_service):
+    requests = []
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.params)
+        return httpx.Response(200, json={"journeys": [navitia_journey, navitia_journey]})
+
+    service = make_navitia_service(upstream)
+    departures = await service.search_journeys(
+        3, 42, "2026-01-15T18:00:00", datetime_end="2026-01-15T22:00:00"
+    )
+    arrivals = await service.search_journeys(
+        3, 42, "2026-01-15T18:00:00", "arrival", datetime_end="2026-01-15T22:00:00"
+    )
+
+    assert len(departures.journeys) == 2 and arrivals.error is None
+    assert "count" not in requests[0]
+    assert requests[0]["datetime"] == "20260115T180000"
+    assert requests[0]["timeframe_duration"] == "14400"
+    assert requests[0]["min_nb_journeys"] == "3"
+    # Arrivals are searched backwards from the end of the window
+    assert requests[1]["datetime"] == "20260115T220000"
+    assert requests[1]["datetime_represents"] == "arrival"
+
+
+@pytest.mark.asyncio
+async def test_multi_day_window_is_searched_one_day_at_a_time(
+    navitia_journey, make_navitia_service
+):
+    requests = []
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        requests.append(params)
+        day = params["datetime"][:8]
+        journey = {**navitia_journey, "departure_date_time": f"{day}T143000"}
+        return httpx.Response(200, json={"journeys": [journey]})
+
+    service = make_navitia_service(upstream)
+    # "ce week-end"
+    weekend = await service.search_journeys(
+        3, 42, "2026-01-17T00:00:00", datetime_end="2026-01-19T00:00:00"
+    )
+
+    assert [r["datetime"] for r in requests] == ["20260117T000000", "20260118T000000"]
+    assert all(r["timeframe_duration"] == str(config.navitia_window_max_seconds) for r in requests)
+    assert [j.departure_datetime[:8] for j in weekend.journeys] == ["20260117", "20260118"]
+    assert not weekend.truncated
+
+
+@pytest.mark.asyncio
+async def test_window_beyond_the_longest_searched_is_truncated(
+    monkeypatch, navitia_journey, make_navitia_service
+):
+    monkeypatch.setattr(config, "navitia_window_max_days", 2)
+    upstream = CountingUpstream(navitia_journey)
+    service = make_navitia_service(upstream)
+
+    result = await service.search_journeys(
+        3, 42, "2026-01-17T00:00:00", datetime_end="2026-01-27T00:00:00"
+    )
+
+    assert result.truncated and result.error is None
+    assert upstream.calls == 2
+
+
+class PagingUpstream:
+    """Navitia stand-in answering with next/prev links an hour apart."""
+
+    def __init__(self, journey: dict):
+        self.journey = journey
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        self.requests.append(params)
+        dt = datetime.strptime(params["datetime"], "%Y%m%dT%H%M%S")
+        links = [
+            {"type": kind, "href": f"{request.url.copy_with(query=None)}?{urlencode(query)}"}
+            for kind, query in (
+                ("next", {"datetime": f"{dt + timedelta(hours=1):%Y%m%dT%H%M%S}", "datetime_represents": "departure"}),
+                ("prev", {"datetime": f"{dt - timedelta(minutes=1):%Y%m%dT%H%M%S}", "datetime_represents": "arrival"}),
+            )
+        ]
+        count = int(params.get("count", params.get("max_nb_journeys", 1)))
+        return httpx.Response(200, json={"journeys": [self.journey] * count, "links": links})
+
+
+@pytest.mark.asyncio
+async def test_cursors_page_through_journeys_and_back_from_cache(
+    navitia_journey, make_navitia_service
+):
+    upstream = PagingUpstream(navitia_journey)
+    service = make_navitia_service(upstream)
+
+    first = await service.search_journeys(3, 42, "2026-01-15T14:30:00", count=3, depth=1)
+    second = await service.search_journeys(3, 42, count=3, depth=1, cursor=first.next_cursor)
+    back = await service.search_journeys(3, 42, count=3, depth=1, cursor=second.prev_cursor)
+
+    assert len(first.journeys) == 3 and upstream.requests[0]["depth"] == "1"
+    assert upstream.requests[1]["datetime"] == "20260115T153000"
+    assert back == first
+    assert len(upstream.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_foreign_cursor_is_rejected(navitia_journey, make_navitia_service):
+    upstream = PagingUpstream(navitia_journey)
+    service = make_navitia_service(upstream)
+
+    result = await service.search_journeys(3, 42, cursor="not-a-cursor")
+
+    assert result.error == "Curseur de pagination invalide"
+    assert upstream.requests == []
+
+
+@pytest.mark.asyncio
+async def test_forged_cursor_cannot_widen_the_window(navitia_journey, make_navitia_service):
+    upstream = PagingUpstream(navitia_journey)
+    service = make_navitia_service(upstream)
+    forged = _encode_cursor(
+        "https://navitia/journeys?"
+        + urlencode(
+            {
+                "datetime": "20260115T143000",
+                "timeframe_duration": 10 * 86400,
+                "min_nb_journeys": 5000,
+                "max_nb_journeys": 5000,
+            }
+        )
+    )
+
+    await service.search_journeys(3, 42, cursor=forged)
+
+    sent = upstream.requests[0]
+    assert int(sent["timeframe_duration"]) == config.navitia_window_max_seconds
+    assert int(sent["max_nb_journeys"]) == config.navitia_window_max_journeys
+    assert int(sent["min_nb_journeys"]) == config.navitia_window_max_journeys
+    bad = _encode_cursor("https://navitia/journeys?datetime=20260115T143000&max_nb_journeys=all")
+    assert (await service.search_journeys(3, 42, cursor=bad)).error == "Curseur de pagination invalide"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_upstream_call(
+    navitia_journey, make_navitia_service
+):
+    upstream = CountingUpstream(navitia_journey, delay=0.05)
+    service = make_navitia_service(upstream)
+
+    results = await asyncio.gather(
+        *(service.search_journeys(3, 42, "2026-01-15T14:30:00") for _ in range(5))
+    )
+
+    assert upstream.calls == 1
+    assert all(r.journeys and r.error is None for r in results)
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(navitia_journey, make_navitia_service):
+    upstream = CountingUpstream(navitia_journey, status_code=503)
+    service = make_navitia_service(upstream)
+
+    for _ in range(2):
+        result = await service.search_journeys(3, 42, "2026-01-15T14:30:00")
+        assert result.error == "Erreur HTTP: 503"
+
+    assert upstream.calls == 2
+
+
+class FaultyUpstream:
+    """Navitia stand-in with injectable latency (per call) and failures."""
+
+    def __init__(self, journey: dict, delays: list[float] | None = None):
+        self.journey = journey
+        self.calls = 0
+        self.failing = False
+        self.delays = delays or []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.delays:
+            await asyncio.sleep(self.delays.pop(0))
+        if self.failing:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"journeys": [self.journey]})
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_serves_stale_results_without_calling_upstream(
+    monkeypatch, navitia_journey, make_navitia_service
+):
+    monkeypatch.setattr(config, "navitia_breaker_failures", 2)
+    upstream = FaultyUpstream(navitia_journey)
+    service = make_navitia_service(upstream)
+
+    fresh = await service.search_journeys(3, 42, "2026-01-15T08:00:00")
+    service._cache._cache.clear()  # the fresh copy expired
+    upstream.failing = True
+    for hour in (10, 12):
+        failed = await service.search_journeys(3, 42, f"2026-01-15T{hour}:00:00")
+        assert failed.error == "Erreur HTTP: 503"
+    calls = upstream.calls
+
+    stale = await service.search_journeys(3, 42, "2026-01-15T08:00:00")
+    unknown = await service.search_journeys(3, 42, "2026-01-15T18:00:00")
+    await asyncio.sleep(0)  # let the background revalidation run
+
+    assert not fresh.stale
+    assert stale.stale and stale.journeys == fresh.journeys
+    assert unknown.error is not None and not unknown.journeys
+    assert upstream.calls == calls
+
+
+@pytest.mark.asyncio
+async def test_aclose_cancels_background_revalidations(
+    monkeypatch, navitia_journey, make_navitia_service
+):
+    monkeypatch.setattr(config, "navitia_breaker_failures", 1)
+    monkeypatch.setattr(config, "navitia_breaker_reset_seconds", 0.01)
+    upstream = FaultyUpstream(navitia_journey)
+    service = make_navitia_service(upstream)
+
+    await service.search_journeys(3, 42, "2026-01-15T08:00:00")
+    service._cache._cache.clear()
+    upstream.failing = True
+    await service.search_journeys(3, 42, "2026-01-15T10:00:00")
+    await asyncio.sleep(0.02)
+    # Half-open: the probe hangs while the stale copy is served
+    upstream.delays = [60.0]
+    stale = await service.search_journeys(3, 42, "2026-01-15T08:00:00")
+    revalidations = list(service._revalidations)
+
+    await service.aclose()
+
+    assert stale.stale and len(revalidations) == 1
+    assert revalidations[0].cancelled() and not service._revalidations
+
+
+@pytest.mark.asyncio
+async def test_upstream_failure_falls_back_to_stale_copy(navitia_journey, make_navitia_service):
+    upstream = FaultyUpstream(navitia_journey)
+    service = make_navitia_service(upstream)
+
+    await service.search_journeys(3, 42, "2026-01-15T08:00:00")
+    service._cache._cache.clear()
+    upstream.failing = True
+    result = await service.search_journeys(3, 42, "2026-01-15T08:00:00")
+
+    assert result.stale and result.error is None and result.journeys
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_after_latency_quantile(
+    monkeypatch, navitia_journey, make_navitia_service
+):
+    monkeypatch.setattr(config, "navitia_hedge_quantile", 0.9)
+    monkeypatch.setattr(config, "navitia_hedge_min_samples", 3)
+    # Three quick calls set the quantile, then a stuck one and its quick hedge
+    upstream = FaultyUpstream(navitia_journey, delays=[0.01, 0.01, 0.01, 5.0, 0.01])
+    service = make_navitia_service(upstream)
+    for hour in (8, 10, 12):
+        await service.search_journeys(3, 42, f"2026-01-15T{hour}:00:00")
+
+    start = time.perf_counter()
+    result = await service.search_journeys(3, 42, "2026-01-15T18:00:00")
+
+    assert result.error is None and result.journeys
+    assert time.perf_counter() - start < 1
+    assert upstream.calls == 5
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.asyncio.Redis."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        self.data[key] = value
+
+
+@pytest.mark.asyncio
+async def test_shared_backend_serves_other_workers(navitia_journey, make_navitia_service):
+    redis = FakeRedis()
+
+    def shared_cache() -> SharedCacheBackend[JourneySearchResponse]:
+        return SharedCacheBackend(
+            redis,
+            dumps=lambda r: r.model_dump_json().encode(),
+            loads=JourneySearchResponse.model_validate_json,
+            prefix="navitia:",
+        )
+
+    upstream = CountingUpstream(navitia_journey)
+    worker_a = make_navitia_service(upstream, cache=shared_cache())
+    worker_b = make_navitia_service(upstream, cache=shared_cache())
+
+    first = await worker_a.search_journeys(3, 42, "2026-01-15T14:30:00")
+    second = await worker_b.search_journeys(3, 42, "2026-01-15T14:30:00")
+
+    assert second == first
+    assert upstream.calls == 1
+    assert all(key.startswith("navitia:") for key in redis.data)
+
+
+def test_redis_backend_without_the_extra_says_how_to_install_it(monkeypatch):
+    monkeypatch.setattr(config, "navitia_cache_backend", "redis")
+    monkeypatch.setitem(sys.modules, "redis", None)
+    monkeypatch.setitem(sys.modules, "redis.asyncio", None)
+
+    with pytest.raises(RuntimeError, match="--extra redis"):
+        NavitiaService._build_cache()
+
+
+SYNTHETIC_PAYLOAD = json.load(open("backend/tests/fixtures/navitia_journeys_synthetic.json", encoding="utf-8"))
+
+
+@pytest.mark.asyncio
+async def test_fast_parse_matches_validated_models(make_navitia_service):
+    service = make_navitia_service(lambda request: httpx.Response(200, json=SYNTHETIC_PAYLOAD))
+
+    result = await service.search_journeys(3, 42, "2026-01-15T14:00:00")
+
+    assert len(result.journeys) == len(SYNTHETIC_PAYLOAD["journeys"])
+    validated = JourneySearchResponse.model_validate(result.model_dump())
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert result.model_dump_json() == validated.model_dump_json()
+
+
+def test_journeys_endpoint_returns_serialized_response(make_navitia_service):
+    service = make_navitia_service(lambda request: httpx.Response(200, json=SYNTHETIC_PAYLOAD))
+    app.dependency_overrides[get_navitia_service] = lambda: service
+    try:
+        response = TestClient(app).get(
+            "/api/v1/journeys",
+            params={"departure_id": 3, "destination_id": 42, "datetime_iso": "2026-01-15T14:00:00"},
+        )
+    finally:
+        del app.dependency_overrides[get_navitia_service]
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = JourneySearchResponse.model_validate(response.json())
+    assert body.error is None
+    assert body.journeys[0].sections[1].line_name == "6601"
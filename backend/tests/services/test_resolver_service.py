@@ -0,0 +1,105 @@
+import json
+
+import httpx
+from fastapi.testclient import TestClient
+
+from backend.app.api.v1.resolve import get_resolver_service
+from backend.app.main import app
+from backend.app.models.transcription import TranscriptionResponse
+from backend.app.services.navitia_service import NavitiaService
+from backend.app.services.resolver_service import ResolverService
+
+SYNTHETIC_PAYLOAD = json.load(open("backend/tests/fixtures/navitia_journeys_synthetic.json", encoding="utf-8"))
+
+
+class FakeTranscription:
+    def __init__(self, text: str):
+        self.text = text
+
+    async def transcribe_async(self, audio, model_name=None) -> TranscriptionResponse:
+        return TranscriptionResponse(text=self.text)
+
+
+def make_resolver(transcript: str = "") -> ResolverService:
+    resolver = ResolverService()
+    resolver._navitia = NavitiaService(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=SYNTHETIC_PAYLOAD))
+    )
+    resolver._navitia._api_key = "test-key"
+    resolver._transcription = FakeTranscription(transcript)  # type: ignore
+    return resolver
+
+
+def post_resolve(resolver: ResolverService, path: str = "/api/v1/resolve", **kwargs) -> httpx.Response:
+    app.dependency_overrides[get_resolver_service] = lambda: resolver
+    try:
+        return TestClient(app).post(path, **kwargs)
+    finally:
+        del app.dependency_overrides[get_resolver_service]
+
+
+def test_text_is_resolved_to_journeys_with_stage_timings(ner_model):
+    response = post_resolve(make_resolver(), data={"text": "Je pars de Paris à Toulouse à 15h"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["entities"] == {"departure": "de paris", "destination": "a toulouse", "time": "a 15h"}
+    assert body["departure_id"] is not None and body["destination_id"] is not None
+    assert body["datetime_iso"] is not None
+    assert len(body["journeys"]["journeys"]) == len(SYNTHETIC_PAYLOAD["journeys"])
+    assert {"ner", "departure_match", "destination_match", "time_normalization", "journeys", "total"} <= set(body["timings"])
+    assert "transcription" not in body["timings"]
+
+
+def test_audio_is_transcribed_and_departure_falls_back_to_location(ner_model):
+    response = post_resolve(
+        make_resolver(transcript="Aller à Toulouse"),
+        files={"file": ("audio.wav", b"RIFF", "audio/wav")},
+        data={"lat": "48.8443", "lon": "2.3744"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["text"] == "Aller à Toulouse"
+    assert body["transcription"]["text"] == "Aller à Toulouse"
+    assert body["departure_from_location"] is True
+    assert body["departure_id"] is not None
+    assert {"transcription", "geolocation"} <= set(body["timings"])
+
+
+def test_needs_exactly_one_of_text_and_audio(ner_model):
+    resolver = make_resolver()
+
+    assert post_resolve(resolver, data={"lat": "48.8"}).status_code == 400
+    assert post_resolve(
+        resolver, data={"text": "Paris"}, files={"file": ("audio.wav", b"RIFF", "audio/wav")}
+    ).status_code == 400
+
+
+def parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+def test_stream_emits_each_stage_then_journeys(ner_model):
+    response = post_resolve(
+        make_resolver(), "/api/v1/resolve/stream", data={"text": "Je pars de Paris à Toulouse à 15h"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_sse(response.text)
+    names = [name for name, _ in events]
+    assert names[0] == "entities"
+    assert set(names[1:3]) == {"datetime", "stations"}
+    assert names[3:-1] == ["journey"] * len(SYNTHETIC_PAYLOAD["journeys"])
+    assert names[-1] == "timings"
+
+    streamed = dict(events[:3])
+    resolved = post_resolve(make_resolver(), data={"text": "Je pars de Paris à Toulouse à 15h"}).json()
+    assert streamed["stations"]["departure_id"] == resolved["departure_id"]
+    assert streamed["datetime"]["datetime_iso"] == resolved["datetime_iso"]
+    assert [payload for name, payload in events if name == "journey"] == resolved["journeys"]["journeys"]
@@ -0,0 +1,77 @@
+import pandas as pd
+from thefuzz import fuzz, process
+
+from backend.app.services.station_matcher import StationMatcher
+
+ENTRIES = pd.read_csv(StationMatcher.DEFAULT_DATA_PATH)
+
+
+def reference_match(query: str, choices: list[str], cutoff: int) -> tuple[str, int] | None:
+    """The original thefuzz-based linear scan."""
+    result = process.extractOne(
+        query.lower().strip(), choices, score_cutoff=cutoff, scorer=fuzz.token_sort_ratio
+    )
+    return (result[0], result[1]) if result else None
+
+
+def make_query(i: int, raw: str, entry: str) -> str:
+    """Rotate through realistic query shapes: raw names, typos, partial and shuffled names."""
+    tokens = entry.split()
+    variant = i % 4
+    if variant == 0:
+        return raw
+    if variant == 1:
+        middle = len(entry) // 2
+        return entry[:middle] + entry[middle + 1:]
+    if variant == 2:
+        return tokens[0]
+    return " ".join(reversed(tokens)) + " gare"
+
+
+def test_index_matches_thefuzz_on_all_entries():
+    matcher = StationMatcher.get_instance()
+    choices = ENTRIES["entries"].tolist()
+
+    for i, (raw, entry) in enumerate(zip(ENTRIES["raw"], ENTRIES["entries"])):
+        query = make_query(i, raw, entry)
+        result = matcher.match(query)
+        expected = reference_match(query, choices, StationMatcher.MIN_SCORE_THRESHOLD)
+        assert ((result.matched, result.score) if result else None) == expected, query
+
+
+def test_match_respects_custom_cutoff():
+    matcher = StationMatcher.get_instance()
+    choices = ENTRIES["entries"].tolist()
+
+    for query in ["paris", "lyon prt dieu", "st etienne", "zzzz", "marseile"]:
+        for cutoff in (40, 80, 95):
+            result = matcher.match(query, score_cutoff=cutoff)
+            expected = reference_match(query, choices, cutoff)
+            assert ((result.matched, result.score) if result else None) == expected
+
+
+def test_match_cache_is_keyed_on_normalized_query():
+    matcher = StationMatcher(cache_size=2)
+    matcher._load_data()
+
+    first = matcher.match("Paris")
+    assert matcher.match("  PARIS ") == first
+    assert matcher.match("paris!") == first
+    assert matcher.cache_stats()["misses"] == 1
+    assert matcher.cache_stats()["hits"] == 2
+
+    matcher.match("paris", score_cutoff=90)
+    matcher.match("lyon")
+    assert matcher.cache_stats()["evictions"] == 1
+    assert matcher.cache_stats()["size"] == 2
+
+
+def test_reload_clears_match_cache():
+    matcher = StationMatcher(cache_size=8)
+    matcher._load_data()
+    matcher.match("toulouse")
+
+    matcher.reload()
+
+    assert matcher.cache_stats()["size"] == 0
+    assert matcher.match("toulouse") is not None
@@ -0,0 +1,95 @@
+import pandas as pd
+
+from backend.app.services.geolocation import GeoLocationService
+from backend.app.services.station_matcher import StationMatcher
+from backend.app.services.station_store import StationStore, _file_hash
+
+ENTRIES = pd.read_csv(StationStore.DEFAULT_DATA_PATH)
+
+
+def test_store_loads_every_row_in_csv_order():
+    store = StationStore.get_instance()
+
+    assert len(store) == len(ENTRIES)
+    assert store.ids.tolist() == ENTRIES["index"].tolist()
+    assert store.raw.tolist() == ENTRIES["raw"].tolist()
+    assert store.entries.tolist() == ENTRIES["entries"].tolist()
+
+
+def test_lookup_by_id():
+    store = StationStore.get_instance()
+    row = ENTRIES.iloc[42]
+
+    assert store.row(int(row["index"])) == 42
+    assert store.get_coords(int(row["index"])) == (row["Y_WGS84"], row["X_WGS84"])
+    assert store.row(-1) is None
+    assert store.get_coords(-1) is None
+
+
+def test_services_share_the_store():
+    matcher = StationMatcher.get_instance()
+    row = ENTRIES.iloc[7]
+
+    match = matcher.get_by_id(int(row["index"]))
+
+    assert match is not None
+    assert (match.raw, match.matched, match.score) == (row["raw"], row["entries"], 100)
+    assert matcher._store is StationStore.get_instance()
+
+
+def copy_csv(tmp_path):
+    csv_path = tmp_path / "entries.csv"
+    csv_path.write_bytes(open(StationStore.DEFAULT_DATA_PATH, "rb").read())
+    return csv_path
+
+
+def test_snapshot_round_trips_the_csv(tmp_path):
+    csv_path = copy_csv(tmp_path)
+    from_csv = StationStore.load(str(csv_path))
+
+    snapshot_path = StationStore.build_snapshot(str(csv_path))
+    from_snapshot = StationStore._load_snapshot(snapshot_path, _file_hash(csv_path))
+
+    assert from_snapshot is not None
+    for column in ("ids", "raw", "entries"):
+        assert getattr(from_snapshot, column).tolist() == getattr(from_csv, column).tolist()
+    assert from_snapshot.get_coords(42) == from_csv.get_coords(42)
+
+
+def test_stale_snapshot_falls_back_to_csv(tmp_path):
+    csv_path = copy_csv(tmp_path)
+    StationStore.build_snapshot(str(csv_path))
+
+    with csv_path.open("a", encoding="utf-8") as f:
+        f.write("99999,Nouvelle-Gare,2.0,48.0,nouvelle gare\n")
+
+    store = StationStore.load(str(csv_path))
+    assert store.row(99999) == len(ENTRIES)
+
+
+
+def test_reload_rebuilds_what_services_derived_from_the_store(monkeypatch):
+    store = StationStore.get_instance()
+    matcher = StationMatcher(cache_size=8)
+    matcher._load_data()
+    geolocation = GeoLocationService.get_instance()
+    before = matcher.match("paris gare de lyon")
+    # Next to Paris Gare de Lyon
+    nearest = geolocation.find_nearest_station_id(48.8443, 2.3744)
+
+    full = StationStore.load(StationStore.DEFAULT_DATA_PATH)
+    kept = (full.ids != before.id) & (full.ids != nearest)
+    without = StationStore(full.ids[kept], full.raw[kept], full.entries[kept], full.lat[kept], full.lon[kept])
+    monkeypatch.setattr(StationStore, "load", classmethod(lambda cls, path: without))
+    try:
+        matcher.reload()
+
+        assert StationStore.get_instance() is store and len(store) == len(full) - 2
+        assert matcher.match("paris gare de lyon").id != before.id
+        assert geolocation.find_nearest_station_id(48.8443, 2.3744) not in (before.id, nearest)
+    finally:
+        monkeypatch.undo()
+        StationStore.reload()
+
+    assert matcher.match("paris gare de lyon") == before
+    assert geolocation.find_nearest_station_id(48.8443, 2.3744) == nearest
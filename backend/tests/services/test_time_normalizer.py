@@ -0,0 +1,99 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from backend.app.core.metrics import metrics
+from backend.app.services.time_normalizer import TimeNormalizer
+
+# A Wednesday
+REFERENCE = datetime(2026, 1, 14, 10, 30)
+TUESDAY_AFTERNOON = datetime(2026, 1, 13, 15, 0)
+
+DATASET_PATH = "base/data/processed/travel-order-dataset.json"
+
+
+def dataset_time_expressions() -> set[str]:
+    with open(DATASET_PATH, encoding="utf-8") as f:
+        dataset = json.load(f)
+    return {
+        text[start:end]
+        for text, annotations in dataset
+        for start, end, label in annotations["entities"]
+        if label == "TIME"
+    }
+
+
+def test_grammar_covers_every_dataset_expression():
+    missed = [e for e in dataset_time_expressions() if TimeNormalizer.parse_window(e, REFERENCE) is None]
+    assert missed == []
+
+
+@pytest.mark.parametrize(
+    ("expression", "start", "end"),
+    [
+        ("apres demain", "2026-01-16T00:00:00", "2026-01-17T00:00:00"),
+        ("mardi à 8h30", "2026-01-20T08:30:00", None),
+        ("lundi prochain", "2026-01-19T00:00:00", "2026-01-20T00:00:00"),
+        ("le 15 mars", "2026-03-15T00:00:00", "2026-03-16T00:00:00"),
+        ("dans deux jours", "2026-01-16T00:00:00", "2026-01-17T00:00:00"),
+        ("entre 13h et 14h", "2026-01-14T13:00:00", "2026-01-14T14:00:00"),
+        ("ce week-end", "2026-01-17T00:00:00", "2026-01-19T00:00:00"),
+        ("ce matin", "2026-01-14T10:30:00", "2026-01-14T12:00:00"),
+        ("tôt le matin", "2026-01-15T06:00:00", "2026-01-15T08:00:00"),
+        ("dès que possible", "2026-01-14T10:30:00", None),
+    ],
+)
+def test_parse_window(expression, start, end):
+    window = TimeNormalizer.parse_window(expression, REFERENCE)
+    assert window.start.isoformat() == start
+    assert (window.end.isoformat() if window.end else None) == end
+    assert window.represents == "departure"
+
+
+@pytest.mark.parametrize(
+    ("expression", "start", "end"),
+    [
+        ("mardi à 8h30", "2026-01-20T08:30:00", None),
+        ("ce mardi matin", "2026-01-20T08:00:00", "2026-01-20T12:00:00"),
+        ("mardi soir", "2026-01-13T18:00:00", "2026-01-13T22:00:00"),
+        ("mardi après-midi", "2026-01-13T15:00:00", "2026-01-13T18:00:00"),
+    ],
+)
+def test_parse_window_never_returns_a_weekday_slot_that_has_ended(expression, start, end):
+    window = TimeNormalizer.parse_window(expression, TUESDAY_AFTERNOON)
+    assert window.start.isoformat() == start
+    assert (window.end.isoformat() if window.end else None) == end
+
+
+@pytest.mark.parametrize("expression", ["aujourd'hui à 8h", "le 13 janvier à 8h30"])
+def test_parse_window_leaves_past_times_of_a_fixed_day_to_dateparser(expression):
+    assert TimeNormalizer.parse_window(expression, TUESDAY_AFTERNOON) is None
+
+
+def test_arrival_expressions_set_what_the_time_represents():
+    window = TimeNormalizer.normalize_window("pour arriver avant midi", REFERENCE)
+
+    assert window.represents == "arrival"
+    assert window.start == REFERENCE and window.end == datetime(2026, 1, 14, 12, 0)
+
+
+def test_unknown_words_fall_back_to_dateparser():
+    assert TimeNormalizer.parse_window("dans 3 jours a la gare", REFERENCE) is None
+    before = metrics.snapshot()["counters"].get("time_normalizer.dateparser", 0)
+
+    assert TimeNormalizer.normalize("15/03/2027", REFERENCE) == "2027-03-15T00:00:00"
+    assert metrics.snapshot()["counters"]["time_normalizer.dateparser"] == before + 1
+
+
+def test_results_are_cached_per_reference_bucket():
+    TimeNormalizer._cache.clear()
+    hits = TimeNormalizer._cache.hits
+
+    first = TimeNormalizer.normalize("vendredi soir", REFERENCE)
+    again = TimeNormalizer.normalize("vendredi soir", REFERENCE.replace(second=42))
+    next_day = TimeNormalizer.normalize("vendredi soir", REFERENCE.replace(day=17))
+
+    assert first == again == "2026-01-16T18:00:00"
+    assert next_day == "2026-01-23T18:00:00"
+    assert TimeNormalizer._cache.hits == hits + 1
@@ -0,0 +1,144 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import get_args
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.core.config import config
+from backend.app.core.executors import BoundedExecutor, ExecutorSaturatedError
+from backend.app.api.v1.transcription import get_transcription_service
+from backend.app.main import app
+from backend.app.models.transcription import TranscriptionConfig, WhisperModelName
+from backend.app.services import transcription_service
+from backend.app.services.transcription_service import TranscriptionService
+
+AUDIO = open("base/data/raw/audio_travel_order/Fenouillet_Uzer_soir.wav", "rb").read()
+SEGMENTS = [(0.0, 1.2, " Je veux aller"), (1.2, 2.5, " de Paris à Lyon.")]
+
+
+class FakeWhisperModel:
+    """Stand-in for WhisperModel yielding fixed segments lazily."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.inputs = []
+
+    def transcribe(self, audio, **kwargs):
+        self.inputs.append(audio)
+        segments = (SimpleNamespace(start=s, end=e, text=t) for s, e, t in SEGMENTS)
+        return segments, None
+
+
+@pytest.fixture
+def whisper_models(monkeypatch):
+    models = {name: FakeWhisperModel(name) for name in get_args(WhisperModelName)}
+    monkeypatch.setattr(TranscriptionService, "_models", models)
+    # Threads rather than processes, so the workers see the fake model
+    executor = BoundedExecutor(
+        "test_inference", lambda workers: ThreadPoolExecutor(max_workers=workers), 1, 2
+    )
+    monkeypatch.setattr(transcription_service, "inference_executor", executor)
+    yield models
+    executor.shutdown()
+
+
+def test_transcribe_feeds_trimmed_16k_samples(whisper_models):
+    result = TranscriptionService(TranscriptionConfig(model_name="small")).transcribe(AUDIO)
+
+    assert result.text == "Je veux aller de Paris à Lyon."
+    samples = whisper_models["small"].inputs[0]
+    assert isinstance(samples, np.ndarray) and samples.dtype == np.float32
+    assert len(samples) == round(result.speech_seconds * 16000)
+    assert result.speech_seconds < result.audio_seconds
+    assert result.timings.vad_ms > 0 and result.timings.transcribe_ms >= 0
+
+
+def test_request_can_pick_a_model_tier(whisper_models, monkeypatch):
+    client = TestClient(app)
+    files = {"file": ("audio.wav", AUDIO, "audio/wav")}
+
+    assert client.post("/api/v1/transcribe", params={"model": "tiny"}, files=files).status_code == 400
+    monkeypatch.setattr(config, "whisper_allowed_models", ["tiny", config.whisper_model])
+    assert client.post("/api/v1/transcribe", params={"model": "tiny"}, files=files).status_code == 200
+    assert len(whisper_models["tiny"].inputs) == 1
+    assert client.post("/api/v1/transcribe", params={"model": "huge"}, files=files).status_code == 422
+
+
+def test_oversized_upload_is_rejected_before_transcription(whisper_models, monkeypatch):
+    monkeypatch.setattr(config, "audio_max_upload_bytes", len(AUDIO) - 1)
+    files = {"file": ("audio.wav", AUDIO, "audio/wav")}
+
+    response = TestClient(app).post("/api/v1/transcribe", files=files)
+
+    assert response.status_code == 413
+    assert not any(model.inputs for model in whisper_models.values())
+
+
+@pytest.mark.asyncio
+async def test_ready_once_the_default_model_is_preloaded(whisper_models):
+    service = TranscriptionService()
+    app.dependency_overrides[get_transcription_service] = lambda: service
+    try:
+        client = TestClient(app)
+        assert client.get("/api/v1/ready").status_code == 503
+        await service.warm_up()
+        assert client.get("/api/v1/ready").status_code == 200
+    finally:
+        del app.dependency_overrides[get_transcription_service]
+
+
+@pytest.mark.asyncio
+async def test_failed_preload_is_retried(whisper_models, monkeypatch):
+    monkeypatch.setattr(config, "whisper_preload_retry_delay", 0.01)
+    attempts = []
+
+    def flaky_load(config: TranscriptionConfig) -> None:
+        attempts.append(config.model_name)
+        if len(attempts) == 1:
+            raise OSError("download interrupted")
+
+    monkeypatch.setattr(transcription_service, "_load_in_worker", flaky_load)
+    service = TranscriptionService()
+
+    await service.warm_up()
+
+    assert service.ready and len(attempts) == 2
+
+
+def test_stream_endpoint_returns_segments_as_ndjson(whisper_models):
+    response = TestClient(app).post(
+        "/api/v1/transcribe/stream",
+        files={"file": ("audio.wav", AUDIO, "audio/wav")},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [{"start": s, "end": e, "text": t.strip()} for s, e, t in SEGMENTS]
+
+
+def test_stream_endpoint_maps_errors_before_responding(whisper_models):
+    response = TestClient(app).post(
+        "/api/v1/transcribe/stream",
+        files={"file": ("audio.wav", b"not audio", "audio/wav")},
+    )
+
+    assert response.status_code == 500
+    assert response.json()["detail"].startswith("Transcription failed")
+
+
+def test_saturated_stream_endpoint_asks_to_retry(whisper_models, monkeypatch):
+    def saturated(*args):
+        raise ExecutorSaturatedError("inference", 3)
+
+    monkeypatch.setattr(transcription_service.inference_executor, "submit", saturated)
+    response = TestClient(app).post(
+        "/api/v1/transcribe/stream",
+        files={"file": ("audio.wav", AUDIO, "audio/wav")},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "3"
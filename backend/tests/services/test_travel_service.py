@@ -0,0 +1,112 @@
+import pytest
+import spacy
+from fastapi.testclient import TestClient
+
+from backend.app.core.config import config
+from backend.app.main import app
+from backend.app.models.travel import TravelServiceConfig
+from backend.app.services.travel_service import TravelService, inference_exclude
+
+client = TestClient(app)
+
+TEXTS = [
+    "Je pars de Paris à Toulouse à 15h",
+    "Un billet de Lyon à Marseille",
+    "Aller à Toulouse",
+]
+
+
+def test_batch_matches_single_path(ner_model):
+    service = TravelService.get_instance()
+
+    singles = [service.identify_travel_order(text) for text in TEXTS]
+    batch = service.identify_travel_orders(TEXTS, batch_size=2)
+
+    assert batch == singles
+    assert batch[0].departure_id is not None
+    assert batch[0].destination_id is not None
+    assert batch[2].departure_id is None
+
+
+def test_batch_uses_coords_fallback_per_item(ner_model):
+    service = TravelService.get_instance()
+
+    results = service.identify_travel_orders(TEXTS[2:] * 2, coords=[None, (48.8443, 2.3744)])
+
+    assert results[0].departure_id is None
+    assert results[1].departure_id is not None
+
+
+def test_identify_travel_orders_endpoint(ner_model):
+    response = client.post(
+        "/api/v1/identify-travel-orders",
+        json={"items": [{"text": t} for t in TEXTS], "batch_size": 8},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == len(TEXTS)
+    assert results[1]["destination_id"] is not None
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"items": [{"text": "Paris Lyon"}] * (config.travel_batch_max_items + 1)},
+        {"items": [{"text": "Paris Lyon"}], "batch_size": config.travel_batch_max_batch_size + 1},
+        {"items": [{"text": "Paris Lyon"}], "n_process": config.travel_batch_max_processes + 1},
+    ],
+)
+def test_identify_travel_orders_rejects_oversized_requests(body):
+    assert client.post("/api/v1/identify-travel-orders", json=body).status_code == 422
+
+
+def test_identify_travel_order_endpoint_goes_through_batcher(ner_model):
+    response = client.get("/api/v1/identify-travel-order", params={"text": TEXTS[0]})
+
+    assert response.status_code == 200
+    assert response.json() == TravelService.get_instance().identify_travel_order(TEXTS[0]).model_dump()
+    assert client.get("/api/v1/metrics").json()["summaries"]["ner.batch_size"]["count"] >= 1
+
+
+def test_model_is_loaded_without_unneeded_components(ner_model, monkeypatch, tmp_path):
+    full = spacy.blank("fr")
+    full.add_pipe("sentencizer")
+    full.add_pipe("entity_ruler", name="ner", source=ner_model)
+    full.to_disk(tmp_path)
+    monkeypatch.setattr(TravelService, "_model", None)
+
+    service = TravelService(TravelServiceConfig(model_path=str(tmp_path)))
+
+    assert service._get_model().pipe_names == ["ner"]
+    assert service.identify_travel_order(TEXTS[0]).departure_id is not None
+
+
+def test_full_model_is_served_until_exported(ner_model, monkeypatch, tmp_path):
+    full = spacy.blank("fr")
+    full.add_pipe("entity_ruler", name="ner", source=ner_model)
+    full.to_disk(tmp_path / "full")
+    monkeypatch.setattr(TravelService, "_model", None)
+
+    service = TravelService(TravelServiceConfig(
+        model_path=str(tmp_path / "missing"), fallback_model_path=str(tmp_path / "full")
+    ))
+
+    assert service._get_model().pipe_names == ["ner"]
+
+
+def test_shared_tok2vec_is_kept_when_ner_listens_to_it(tmp_path):
+    nlp = spacy.blank("fr")
+    nlp.add_pipe("tok2vec")
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("ner", config={"model": {
+        "@architectures": "spacy.TransitionBasedParser.v2",
+        "state_type": "ner",
+        "hidden_width": 32,
+        "tok2vec": {"@architectures": "spacy.Tok2VecListener.v1", "width": 96, "upstream": "*"},
+    }})
+    nlp.get_pipe("ner").add_label("DEPARTURE")
+    nlp.initialize()
+    nlp.to_disk(tmp_path)
+
+    assert inference_exclude(str(tmp_path)) == ["sentencizer"]
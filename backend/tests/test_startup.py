@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative `-X importtime` of backend.app.main; override on slow machines
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", 1500))
+
+# Loaded on first use or in the lifespan, never by importing the app
+LAZY_MODULES = {
+    "spacy", "sklearn", "scipy", "pandas", "dateparser", "faster_whisper", "ctranslate2",
+    "httpx", "thefuzz",
+}
+
+
+def import_times(module: str) -> list[tuple[str, int, float]]:
+    """(name, depth, cumulative ms) of every module imported by `import module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        times.append((name.strip(), depth, int(cumulative) / 1000))
+    return times
+
+
+def startup_report(times: list[tuple[str, int, float]], top: int = 10) -> str:
+    direct = sorted((t for t in times if t[1] == 1), key=lambda t: t[2], reverse=True)
+    lines = [f"{name:<40} {ms:8.1f} ms" for name, _, ms in direct[:top]]
+    return "\n".join(["Slowest imports of backend.app.main:", *lines])
+
+
+def test_app_import_stays_light():
+    # Best of a few runs, so that a busy machine does not fail the budget
+    runs = [import_times("backend.app.main") for _ in range(3)]
+    totals = [
+        next(ms for name, depth, ms in times if name == "backend.app.main" and depth == 0)
+        for times in runs
+    ]
+    total = min(totals)
+    times = runs[totals.index(total)]
+    report = startup_report(times)
+    print(f"\n{report}\n{'total':<40} {total:8.1f} ms")
+
+    eager = {name.split(".")[0] for name, _, _ in times} & LAZY_MODULES
+    assert not eager, f"imported at startup: {sorted(eager)}\n{report}"
+    assert total < IMPORT_BUDGET_MS, f"import took {total:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)\n{report}"
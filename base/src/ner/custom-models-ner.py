@@ -1,11 +1,13 @@
 import random
-import json
+import sys
 import spacy
 from spacy.util import minibatch
 from spacy.training.example import Example
+sys.path.append('.')
+from base.src.training import load_split
 
-with open('base/data/processed/travel-order-dataset.json', 'r') as f:
-    train_data = json.load(f)
+# The held-out split is kept for export-inference-model.py and the benchmarks
+train_data, _ = load_split()
 
 nlp = spacy.load('fr_core_news_md')
 
@@ -0,0 +1,86 @@
+"""
+Export the trained travel order NER model as a minimal inference pipeline.
+
+The trained model keeps every component of fr_core_news_md (tok2vec,
+morphologizer, parser, lemmatizer, ...), but serving only reads the entities
+of the `ner` component, which embeds its own tok2vec. Everything the `ner`
+does not listen to is removed before saving.
+
+Entities may differ slightly from the full pipeline: there, the parser splits
+sentences and the NER never crosses a sentence boundary, while the NER was
+trained with the parser disabled (see custom-models-ner.py). The export is
+therefore checked to score at least the full pipeline's entity F1 on the
+held-out split custom-models-ner.py does not train on. It is written to a
+temporary directory and only moved to the target once the check passes, so
+a worse export is never served.
+
+Usage (from the project root, after custom-models-ner.py):
+    uv run poe export-ner
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import spacy
+from spacy.language import Language
+from spacy.training import Example
+
+sys.path.append('.')
+# The server excludes the same components when loading the full model
+from backend.app.services.travel_service import inference_exclude
+from base.src.training import load_split
+
+SOURCE_PATH = 'base/models/travel-order-ner-model'
+TARGET_PATH = 'base/models/travel-order-ner-inference'
+
+
+def directory_size(path: str) -> int:
+    return sum(f.stat().st_size for f in Path(path).rglob('*') if f.is_file())
+
+
+def entity_f1(nlp: Language, dataset: list) -> float:
+    examples = [Example.from_dict(nlp.make_doc(text), annotations) for text, annotations in dataset]
+    return nlp.evaluate(examples)['ents_f']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--source', default=SOURCE_PATH)
+    parser.add_argument('--target', default=TARGET_PATH)
+    parser.add_argument('--test-size', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    full = spacy.load(args.source)
+    nlp = spacy.load(args.source)
+    unused = inference_exclude(args.source)
+    for name in reversed(unused):
+        nlp.remove_pipe(name)
+
+    _, held_out = load_split(args.test_size, args.seed)
+    target = Path(args.target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=target.parent) as staging:
+        staged = Path(staging) / target.name
+        nlp.to_disk(staged)
+        exported = spacy.load(staged)
+        full_f1, exported_f1 = entity_f1(full, held_out), entity_f1(exported, held_out)
+        if exported_f1 < full_f1:
+            raise SystemExit(
+                f'Not exported: entity F1 {exported_f1:.4f} is below {args.source} ({full_f1:.4f})'
+            )
+        if target.exists():
+            shutil.rmtree(target)
+        staged.rename(target)
+
+    print(f'Removed: {", ".join(unused) or "nothing"}')
+    print(f'Pipeline: {exported.pipe_names}')
+    print(f'Held-out entity F1 ({len(held_out)} examples): {full_f1:.4f} -> {exported_f1:.4f}')
+    print(f'Size: {directory_size(args.source) / 2**20:.1f} MB -> {directory_size(args.target) / 2**20:.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
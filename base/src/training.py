@@ -1,4 +1,111 @@
 """
-This file is a template for potential training utilities.
-You can implement model training logic here if needed.
+Train the compact travel order tagger (backend/app/services/compact_tagger.py).
+
+A multinomial logistic regression learns the BIO tags of
+travel-order-dataset.json from hashed token features; its weights are then
+quantized to int8 and saved as a small .npz, served with `NER_BACKEND=compact`.
+A fixed held-out split is kept out of training and scored for the float and
+the int8 weights.
+
+Usage (from the project root):
+    uv run poe train-tagger
 """
+
+import argparse
+import json
+import random
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.linear_model import LogisticRegression
+
+from backend.app.services.compact_tagger import TAGS, CompactTagger, Span, feature_ids, tokenize
+
+DATASET_PATH = 'base/data/processed/travel-order-dataset.json'
+MODEL_PATH = 'base/models/travel-order-tagger.npz'
+N_FEATURES = 2**18
+
+
+def load_split(test_size: float = 0.2, seed: int = 0) -> tuple[list, list]:
+    """(train, held-out) examples of the dataset, the same for a given seed."""
+    with open(DATASET_PATH, 'r') as f:
+        dataset = json.load(f)
+    random.Random(seed).shuffle(dataset)
+    n_test = int(len(dataset) * test_size)
+    return dataset[n_test:], dataset[:n_test]
+
+
+def gold_spans(annotations: dict) -> set[Span]:
+    return {(label, start, end) for start, end, label in annotations['entities']}
+
+
+def bio_tags(text: str, annotations: dict) -> list[str]:
+    tags = []
+    for start, end in tokenize(text):
+        tag = 'O'
+        for ent_start, ent_end, label in annotations['entities']:
+            if ent_start <= start and end <= ent_end:
+                tag = f'{"B" if start == ent_start else "I"}-{label}'
+        tags.append(tag)
+    return tags
+
+
+def entity_scores(gold: list[set[Span]], predicted: list[set[Span]]) -> dict[str, float]:
+    """Exact-match entity precision, recall and F1."""
+    correct = sum(len(g & p) for g, p in zip(gold, predicted))
+    n_predicted = sum(len(p) for p in predicted)
+    n_gold = sum(len(g) for g in gold)
+    precision = correct / n_predicted if n_predicted else 0.0
+    recall = correct / n_gold if n_gold else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {'precision': precision, 'recall': recall, 'f1': f1}
+
+
+def featurize(examples: list, n_features: int) -> tuple[csr_matrix, np.ndarray]:
+    rows, labels = [], []
+    for text, annotations in examples:
+        tokens = [text[start:end] for start, end in tokenize(text)]
+        rows.extend(feature_ids(tokens, n_features))
+        labels.extend(TAGS.index(tag) for tag in bio_tags(text, annotations))
+    ids = np.array(rows)
+    indptr = np.arange(0, ids.size + 1, ids.shape[1])
+    # Duplicate ids within a row (hash collisions) are summed
+    features = csr_matrix((np.ones(ids.size), ids.ravel(), indptr), shape=(len(ids), n_features))
+    return features, np.array(labels)
+
+
+def train(examples: list, n_features: int = N_FEATURES, c: float = 10.0) -> tuple[np.ndarray, np.ndarray]:
+    """Float weights of shape (n_features, len(TAGS)) and bias."""
+    features, labels = featurize(examples, n_features)
+    model = LogisticRegression(C=c, max_iter=2000)
+    model.fit(features, labels)
+    weights = np.zeros((n_features, len(TAGS)))
+    bias = np.full(len(TAGS), -1e4)  # Tags never seen in training are never predicted
+    weights[:, model.classes_] = model.coef_.T
+    bias[model.classes_] = model.intercept_
+    return weights, bias
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=MODEL_PATH)
+    parser.add_argument('--test-size', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--c', type=float, default=10.0, help='Inverse L2 regularization strength')
+    args = parser.parse_args()
+
+    train_set, test_set = load_split(args.test_size, args.seed)
+    weights, bias = train(train_set, c=args.c)
+    tagger = CompactTagger.quantize(weights, bias)
+    tagger.save(args.output)
+
+    gold = [gold_spans(annotations) for _, annotations in test_set]
+    float_tagger = CompactTagger(weights, np.ones(len(TAGS)), bias)
+    for name, model in (('float', float_tagger), ('int8', tagger)):
+        scores = entity_scores(gold, [set(model.tag(text)) for text, _ in test_set])
+        print(f'{name:<6} held-out entities: ' + '  '.join(f'{k} {v:.4f}' for k, v in scores.items()))
+    print(f'{len(train_set)} train / {len(test_set)} held-out examples, saved to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
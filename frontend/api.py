@@ -7,7 +7,9 @@ from models import JourneySearchResponse, Station, TravelOrderResponse
 
 API_BASE_URL = "http://localhost:8000/api/v1"
 DEFAULT_TIMEOUT = 10
-SEARCH_TIMEOUT = 35
+# Navitia connect + read timeouts of the backend (5 s + 10 s), which answers
+# from its stale copy rather than waiting once the upstream is failing
+SEARCH_TIMEOUT = 16
 
 
 def transcribe_audio(audio_bytes: bytes) -> str:
@@ -65,18 +67,30 @@ def search_journeys(
     destination_id: int,
     datetime_iso: str | None = None,
     datetime_represents: str = "departure",
+    datetime_end: str | None = None,
+    count: int = 1,
+    cursor: str | None = None,
 ) -> JourneySearchResponse | None:
     """
     Search for journeys via the Navitia API.
+
+    With `datetime_end`, all the journeys up to that time are returned.
+    `cursor` (a previous response's next/prev cursor) fetches the next or
+    previous `count` journeys instead.
     """
     try:
         params: dict[str, str | int] = {
             "departure_id": departure_id,
             "destination_id": destination_id,
             "datetime_represents": datetime_represents,
+            "count": count,
         }
         if datetime_iso:
             params["datetime_iso"] = datetime_iso
+        if datetime_end:
+            params["datetime_end"] = datetime_end
+        if cursor:
+            params["cursor"] = cursor
 
         response = requests.get(
             f"{API_BASE_URL}/journeys",
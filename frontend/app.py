@@ -31,6 +31,8 @@ st.logo("./public/logo.svg", size="large", link="https://www.sncf.com/fr/sncf-co
 # Constants
 # =============================================================================
 
+JOURNEYS_PER_PAGE = 3
+
 SESSION_DEFAULTS: dict[str, object] = {
     "messages": [],
     "show_form": False,
@@ -39,11 +41,19 @@ SESSION_DEFAULTS: dict[str, object] = {
     "user_coords": None,
     "journeys": None,
     "search_error": None,
+    "search_stale": False,
+    "search_truncated": False,
+    # Paging: cursors of the displayed page, and the one to fetch next
+    "next_cursor": None,
+    "prev_cursor": None,
+    "page_cursor": None,
     "process_result": None,  # Stores last processing result for display
     # Persistent form values (survive page navigation)
     "saved_dep_idx": None,
     "saved_dest_idx": None,
     "saved_datetime": None,
+    # Time window of the identified order, used while the datetime is unchanged
+    "identified_window": None,
 }
 
 
@@ -77,6 +87,10 @@ def reset_search_results() -> None:
     """Reset search results."""
     st.session_state.journeys = None
     st.session_state.search_error = None
+    st.session_state.search_stale = False
+    st.session_state.search_truncated = False
+    st.session_state.next_cursor = None
+    st.session_state.prev_cursor = None
 
 
 # =============================================================================
@@ -105,6 +119,12 @@ def on_search_param_change() -> None:
     st.session_state.searching = True
 
 
+def on_change_page(cursor: str) -> None:
+    """Show the earlier or later journeys."""
+    st.session_state.page_cursor = cursor
+    st.session_state.searching = True
+
+
 def on_process_request(text: str) -> None:
     """Process a new user request."""
     st.session_state.processing = True
@@ -129,6 +149,7 @@ def update_user_coords() -> None:
 def execute_search() -> float:
     """Execute journey search. Returns elapsed time."""
     start = time.perf_counter()
+    cursor, st.session_state.page_cursor = st.session_state.page_cursor, None
     reset_search_results()
 
     dep_idx = st.session_state.get("_dep_select")
@@ -145,11 +166,29 @@ def execute_search() -> float:
     elif isinstance(dt_value, str):
         dt_iso = dt_value
 
-    if result := search_journeys(stations[dep_idx].id, stations[dest_idx].id, dt_iso):
+    # The whole identified window ("ce soir") is fetched in one search
+    dt_end, represents = None, "departure"
+    window = st.session_state.identified_window
+    if window and dt_value is not None and dt_value == window[0]:
+        _, dt_end, represents = window
+
+    if result := search_journeys(
+        stations[dep_idx].id,
+        stations[dest_idx].id,
+        dt_iso,
+        represents,
+        dt_end,
+        count=JOURNEYS_PER_PAGE,
+        cursor=cursor,
+    ):
         if result.error:
             st.session_state.search_error = result.error
         else:
             st.session_state.journeys = result.journeys
+            st.session_state.search_stale = result.stale
+            st.session_state.search_truncated = result.truncated
+            st.session_state.next_cursor = result.next_cursor
+            st.session_state.prev_cursor = result.prev_cursor
 
     return time.perf_counter() - start
 
@@ -186,6 +225,9 @@ def process_identification() -> tuple[bool, float]:
     st.session_state.saved_dep_idx = dep_idx
     st.session_state.saved_dest_idx = dest_idx
     st.session_state.saved_datetime = dt_value
+    st.session_state.identified_window = (
+        (dt_value, result.datetime_end, result.datetime_represents) if dt_value else None
+    )
     
     st.session_state.show_form = True
     
@@ -212,9 +254,19 @@ def render_journeys_results() -> None:
         return
 
     st.subheader(f"🚆 {len(journeys)} trajet(s) trouvé(s)")
+    if st.session_state.search_stale:
+        st.warning("Navitia est indisponible : ces trajets datent d'une recherche précédente.")
+    if st.session_state.search_truncated:
+        st.info("La période demandée est trop longue : seuls ses premiers jours ont été recherchés.")
     for i, journey in enumerate(journeys):
         ItineraryCard(journey, f"journey_{i}")
 
+    col1, col2 = st.columns(2)
+    if cursor := st.session_state.prev_cursor:
+        col1.button("Plus tôt", icon=":material/chevron_left:", on_click=on_change_page, args=(cursor,))
+    if cursor := st.session_state.next_cursor:
+        col2.button("Plus tard", icon=":material/chevron_right:", on_click=on_change_page, args=(cursor,))
+
 
 def render_search_form() -> None:
     """Render the search form."""
@@ -44,3 +44,7 @@ class JourneySearchResponse(BaseModel):
 
     journeys: list[Journey] = []
     error: str | None = None
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+    stale: bool = False
+    truncated: bool = False
@@ -9,3 +9,5 @@ class TravelOrderResponse(BaseModel):
     departure_id: int | None = None
     destination_id: int | None = None
     datetime_iso: str | None = None
+    datetime_end: str | None = None
+    datetime_represents: str = "departure"
@@ -0,0 +1,60 @@
+"""
+Multi-process serving profile, picked up by `uv run gunicorn` from the
+project root.
+
+The app and its read-only state (NER model, station data) are loaded once in
+the master before the workers fork, so the workers share those pages
+copy-on-write. Whisper runs in one inference server process for the whole
+host, which the workers reach over a local Unix socket.
+"""
+
+import gc
+import os
+import shutil
+import tempfile
+
+from backend.app.core.config import config as app_config
+
+wsgi_app = "backend.app.main:create_app(preload=True)"
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+bind = app_config.serving_bind
+workers = app_config.serving_workers
+timeout = app_config.serving_timeout
+
+_inference_server = None
+_inference_dir = None
+
+
+def on_starting(server):
+    global _inference_server, _inference_dir
+    if not app_config.serving_shared_inference:
+        return
+    from backend.app.core.executors import use_inference_server
+    from backend.app.core.inference_server import start_inference_server
+
+    _inference_dir = tempfile.mkdtemp(prefix="travel-resolver-")
+    address = os.path.join(_inference_dir, "inference.sock")
+    _inference_server = start_inference_server(address)
+    use_inference_server(address)
+    server.log.info("Inference server listening on %s", address)
+
+
+def when_ready(server):
+    # Everything loaded so far lives as long as the workers: moving it out of
+    # the GC's reach stops collections from writing to (and un-sharing) its pages
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # Connections opened by the master must not be shared with the workers
+    from backend.app.db.schema import engine
+
+    engine.dispose(close=False)
+
+
+def on_exit(server):
+    if _inference_server is not None:
+        _inference_server.shutdown()
+    if _inference_dir is not None:
+        shutil.rmtree(_inference_dir, ignore_errors=True)